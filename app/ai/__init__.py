@@ -0,0 +1,26 @@
+import asyncio
+import importlib
+from types import ModuleType
+
+# LangChain / OpenAI 임포트가 무거워 워커 시작 시가 아니라 처음 필요할 때 불러온다
+AGENT_MODULE = "app.ai.agent"
+
+_agent_task: asyncio.Task | None = None
+
+
+async def load_agent() -> ModuleType:
+    """
+    app.ai.agent 모듈을 반환한다.
+
+    첫 호출 때 이벤트 루프를 막지 않도록 스레드에서 임포트하고,
+    동시에 들어온 요청과 시작 시 미리 불러오기는 같은 임포트 작업을 기다린다.
+    임포트에 실패하면 다음 호출에서 다시 시도한다.
+    """
+    global _agent_task
+    if _agent_task is None or (
+        _agent_task.done() and (_agent_task.cancelled() or _agent_task.exception())
+    ):
+        _agent_task = asyncio.create_task(
+            asyncio.to_thread(importlib.import_module, AGENT_MODULE)
+        )
+    return await asyncio.shield(_agent_task)
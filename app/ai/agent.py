@@ -1,16 +1,19 @@
-import json
+import time
 from collections.abc import AsyncGenerator
+from contextlib import aclosing
 
 from langchain_classic.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_openai import ChatOpenAI
 
-from app.ai.prompts import SYSTEM_PROMPT, TITLE_GENERATION_PROMPT
+from app.ai.prompts import SYSTEM_PROMPT, TITLE_GENERATION_PROMPT, current_date_text
 from app.ai.tools import tools
 from app.config.settings import settings
+from app.utils import metrics, serializer, timing
 
 _llm: ChatOpenAI | None = None
+_title_llm: ChatOpenAI | None = None
 
 
 def get_llm() -> ChatOpenAI:
@@ -29,6 +32,19 @@ def get_llm() -> ChatOpenAI:
     return _llm
 
 
+def get_title_llm() -> ChatOpenAI:
+    """대화 제목 생성용 저렴한 모델을 반환 (최초 호출 시 생성)"""
+    global _title_llm
+    if _title_llm is None:
+        _title_llm = ChatOpenAI(
+            model="gpt-4o-mini",
+            temperature=0.3,
+            max_tokens=50,
+            openai_api_key=settings.openai_api_key,
+        )
+    return _title_llm
+
+
 def get_agent_executor() -> AgentExecutor:
     """에이전트 실행기 생성"""
     llm = get_llm()
@@ -90,48 +106,67 @@ async def generate_response_stream(
 
     langchain_history = convert_to_langchain_messages(chat_history)
 
-    async for event in executor.astream_events(
-        {"input": enhanced_input, "chat_history": langchain_history},
+    # 스트림이 중간에 닫히면 astream_events도 닫아 진행 중인 LLM/도구 호출을 취소한다
+    events = executor.astream_events(
+        {
+            "input": enhanced_input,
+            "chat_history": langchain_history,
+            "current_date": current_date_text(),
+        },
         version="v2",
-    ):
-        kind = event["event"]
-
-        if kind == "on_tool_start":
-            tool_name = event["name"]
-            status_data = {"type": "status", "content": f"{tool_name} 실행 중..."}
-            yield f"data: {json.dumps(status_data, ensure_ascii=False)}\n\n"
-
-        chunk = event.get("data", {}).get("chunk")
-
-        is_valid_content = (
-            kind == "on_chat_model_stream"
-            and chunk
-            and hasattr(chunk, "content")
-            and chunk.content
-        )
-
-        if is_valid_content:
-            content_data = {"type": "content", "content": chunk.content}
-            yield f"data: {json.dumps(content_data, ensure_ascii=False)}\n\n"
+    )
 
-    yield f"data: {json.dumps({'type': 'done'})}\n\n"
+    started = time.perf_counter()
+    first_token = True
+    tool_started: dict[str, float] = {}
+
+    async with aclosing(events):
+        async for event in events:
+            kind = event["event"]
+
+            if kind == "on_tool_start":
+                tool_started[event["run_id"]] = time.perf_counter()
+                tool_name = event["name"]
+                status_data = {"type": "status", "content": f"{tool_name} 실행 중..."}
+                yield serializer.sse_event(status_data)
+
+            if kind in ("on_tool_end", "on_tool_error") and event["run_id"] in tool_started:
+                timing.record_span(
+                    f"tool.{event['name']}",
+                    (time.perf_counter() - tool_started.pop(event["run_id"])) * 1000,
+                )
+
+            chunk = event.get("data", {}).get("chunk")
+
+            is_valid_content = (
+                kind == "on_chat_model_stream"
+                and chunk
+                and hasattr(chunk, "content")
+                and chunk.content
+            )
+
+            if is_valid_content:
+                if first_token:
+                    ttft = time.perf_counter() - started
+                    metrics.observe("llm_time_to_first_token_seconds", ttft)
+                    timing.record_span("llm_ttft", ttft * 1000)
+                    first_token = False
+                metrics.increment("llm_tokens_streamed_total")
+                content_data = {"type": "content", "content": chunk.content}
+                yield serializer.sse_event(content_data)
+
+    timing.record_span("agent", (time.perf_counter() - started) * 1000)
+    yield serializer.sse_event({"type": "done"})
 
 
 async def generate_title(user_message: str, ai_response: str) -> str:
     """사용자 메시지와 AI 응답을 기반으로 대화 제목 생성"""
 
-    cheap_llm = ChatOpenAI(
-        model="gpt-4o-mini",
-        temperature=0.3,
-        max_tokens=50,
-        openai_api_key=settings.openai_api_key,
-    )
-
     prompt = TITLE_GENERATION_PROMPT.format(
         user_message=user_message,
         ai_response=ai_response[:200],
     )
 
-    response = await cheap_llm.ainvoke(prompt)
+    response = await get_title_llm().ainvoke(prompt)
 
     return response.content.strip()[:20]
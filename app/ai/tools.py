@@ -1,16 +1,17 @@
+from typing import TYPE_CHECKING
+
 from langchain_core.tools import tool
-from langchain_openai import OpenAIEmbeddings
-from supabase import create_client
-from tavily import TavilyClient
 
 from app.config.settings import settings
 
-supabase = create_client(settings.supabase_url, settings.supabase_key)
-tavily = TavilyClient(api_key=settings.tavily_api_key)
-embeddings = OpenAIEmbeddings(
-    model="text-embedding-3-small",
-    openai_api_key=settings.openai_api_key,
-)
+if TYPE_CHECKING:
+    from langchain_openai import OpenAIEmbeddings
+    from supabase import Client
+    from tavily import TavilyClient
+
+_supabase: "Client | None" = None
+_tavily: "TavilyClient | None" = None
+_embeddings: "OpenAIEmbeddings | None" = None
 
 ALLOWED_DOMAINS = [
     "liquipedia.net",
@@ -20,6 +21,43 @@ ALLOWED_DOMAINS = [
 ]
 
 
+def get_sync_supabase() -> "Client":
+    """
+    도구용 동기 Supabase 클라이언트를 반환
+
+    최초 호출 시 생성하고, 이후에는 동일한 인스턴스를 재사용
+    """
+    global _supabase
+    if _supabase is None:
+        from supabase import create_client
+
+        _supabase = create_client(settings.supabase_url, settings.supabase_key)
+    return _supabase
+
+
+def get_tavily() -> "TavilyClient":
+    """웹 검색용 Tavily 클라이언트를 반환 (최초 호출 시 생성)"""
+    global _tavily
+    if _tavily is None:
+        from tavily import TavilyClient
+
+        _tavily = TavilyClient(api_key=settings.tavily_api_key)
+    return _tavily
+
+
+def get_embeddings() -> "OpenAIEmbeddings":
+    """RAG 검색용 임베딩 모델을 반환 (최초 호출 시 생성)"""
+    global _embeddings
+    if _embeddings is None:
+        from langchain_openai import OpenAIEmbeddings
+
+        _embeddings = OpenAIEmbeddings(
+            model="text-embedding-3-small",
+            openai_api_key=settings.openai_api_key,
+        )
+    return _embeddings
+
+
 @tool
 async def search_rag(query: str) -> str:
     """
@@ -28,9 +66,9 @@ async def search_rag(query: str) -> str:
     관련 정보를 찾지 못하면 search_web 도구를 사용합니다.
     """
 
-    query_embedding = await embeddings.aembed_query(query)
+    query_embedding = await get_embeddings().aembed_query(query)
 
-    result = supabase.rpc(
+    result = get_sync_supabase().rpc(
         "match_documents",
         {
             "query_embedding": query_embedding,
@@ -57,7 +95,7 @@ def search_web(query: str) -> str:
     검색 결과를 요약하고 출처 링크를 반드시 포함하세요.
     """
     try:
-        result = tavily.search(
+        result = get_tavily().search(
             query=f"오버워치 2 {query}",
             include_domains=ALLOWED_DOMAINS,
             max_results=5,
@@ -86,7 +124,7 @@ def get_hero_stats(hero_key: str) -> str:
     특정 영웅의 통계 정보(픽률, 승률 등)를 조회합니다.
     영웅 키는 영어 소문자입니다 (예: ana, genji, reinhardt)
     """
-    result = supabase.table("hero_stats").select("*").eq(
+    result = get_sync_supabase().table("hero_stats").select("*").eq(
         "hero_key", hero_key
     ).order("synced_at", desc=True).limit(1).execute()
 
@@ -107,7 +145,7 @@ def get_hero_counters(hero_key: str) -> str:
     특정 영웅의 카운터와 시너지 영웅을 조회합니다.
     영웅 키는 영어 소문자입니다 (예: ana, genji, reinhardt)
     """
-    result = supabase.table("heroes").select(
+    result = get_sync_supabase().table("heroes").select(
         "name, counters, synergies"
     ).eq("key", hero_key).execute()
 
@@ -134,7 +172,7 @@ def get_hero_abilities(hero_key: str) -> str:
     영웅 키는 영어 소문자입니다 (예: ana, genji, wuyang, freja, vendetta)
     신규 영웅(우양, 프레야, 벤데타)도 조회 가능합니다.
     """
-    hero_result = supabase.table("heroes").select(
+    hero_result = get_sync_supabase().table("heroes").select(
         "name, role"
     ).eq("key", hero_key).execute()
 
@@ -143,7 +181,7 @@ def get_hero_abilities(hero_key: str) -> str:
 
     hero = hero_result.data[0]
 
-    abilities_result = supabase.table("hero_abilities").select(
+    abilities_result = get_sync_supabase().table("hero_abilities").select(
         "name, description, ability_type"
     ).eq("hero_key", hero_key).execute()
 
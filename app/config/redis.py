@@ -3,14 +3,21 @@ import redis.asyncio as redis
 from app.config.settings import settings
 
 _client: redis.Redis | None = None
+_binary_client: redis.Redis | None = None
 
 
 async def init_redis():
     """앱 시작 시 Redis 클라이언트를 초기화한다."""
-    global _client
+    global _client, _binary_client
     _client = redis.from_url(settings.redis_url, decode_responses=True)
+    _binary_client = redis.from_url(settings.redis_url)
 
 
 def get_redis() -> redis.Redis:
     """초기화된 Redis 클라이언트를 반환한다."""
     return _client
+
+
+def get_redis_binary() -> redis.Redis:
+    """응답을 디코딩하지 않는 Redis 클라이언트를 반환한다. (압축 캐시 등 bytes 값용)"""
+    return _binary_client
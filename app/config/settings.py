@@ -9,6 +9,11 @@ class Settings(BaseSettings):
     openai_temperature: float
     tavily_api_key: str
     redis_url: str
+    overfast_base_url: str = "https://overfast-api.tekrop.fr"
+    admin_api_key: str | None = None
+    server_timing_sample_rate: float = 0.1
+    server_timing_log: bool = False
+    ai_preload: bool = True
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,28 @@
+import secrets
+
+from fastapi import Header, HTTPException, status
+
+from app.config.settings import settings
+
+
+async def verify_admin_key(x_admin_key: str | None = Header(default=None)) -> None:
+    """
+    관리자 API 접근을 확인하는 의존성
+
+    - X-Admin-Key 헤더가 ADMIN_API_KEY 설정값과 같아야 한다
+    - ADMIN_API_KEY가 설정되지 않았으면 관리자 API를 막는다
+
+    Raises:
+        HTTPException: 403 - 관리자 API 비활성화 또는 키 불일치 시
+    """
+    if not settings.admin_api_key:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 API가 비활성화되어 있습니다",
+        )
+
+    if not x_admin_key or not secrets.compare_digest(x_admin_key, settings.admin_api_key):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 키가 올바르지 않습니다",
+        )
@@ -1,6 +1,9 @@
 from fastapi import HTTPException, Request, status
 
 from app.config.supabase import get_supabase
+from app.utils import metrics, timing
+
+_SUPABASE_AUTH = {"dependency": "supabase", "operation": "auth_get_user"}
 
 
 async def get_current_user(request: Request) -> dict:
@@ -36,7 +39,8 @@ async def get_current_user(request: Request) -> dict:
     supabase = get_supabase()
 
     try:
-        user_response = await supabase.auth.get_user(token)
+        with metrics.timed("dependency_duration_seconds", _SUPABASE_AUTH), timing.span("auth"):
+            user_response = await supabase.auth.get_user(token)
         user = user_response.user
 
         if not user:
@@ -75,7 +79,8 @@ async def get_current_user_or_none(request: Request) -> dict | None:
     supabase = get_supabase()
 
     try:
-        user_response = await supabase.auth.get_user(token)
+        with metrics.timed("dependency_duration_seconds", _SUPABASE_AUTH), timing.span("auth"):
+            user_response = await supabase.auth.get_user(token)
         user = user_response.user
 
         if not user:
@@ -2,11 +2,14 @@ from fastapi import HTTPException, Request
 
 from app.config.redis import get_redis
 from app.dependencies.auth import get_current_user_or_none
+from app.utils import metrics, timing
 
 GUEST_LIMIT = 3
 MEMBER_LIMIT = 15
 WINDOW_SECONDS = 6 * 60 * 60
 
+_REDIS_RATE_LIMIT = {"dependency": "redis", "operation": "rate_limit"}
+
 
 async def check_rate_limit(request: Request) -> dict:
     """
@@ -34,14 +37,17 @@ async def check_rate_limit(request: Request) -> dict:
         key = f"rate:guest:{ip}"
         limit = GUEST_LIMIT
 
-    current = await redis.get(key)
+    with metrics.timed("dependency_duration_seconds", _REDIS_RATE_LIMIT), timing.span("rate_limit"):
+        current = await redis.get(key)
+        ttl = await redis.ttl(key)
     current = int(current) if current else 0
-
-    ttl = await redis.ttl(key)
     if ttl < 0:
         ttl = WINDOW_SECONDS
 
     if current >= limit:
+        metrics.increment(
+            "rate_limit_rejections_total", labels={"tier": "member" if user_id else "guest"}
+        )
         raise HTTPException(
             status_code=429,
             detail={
@@ -54,7 +60,8 @@ async def check_rate_limit(request: Request) -> dict:
     pipe = redis.pipeline()
     pipe.incr(key)
     pipe.expire(key, WINDOW_SECONDS)
-    await pipe.execute()
+    with metrics.timed("dependency_duration_seconds", _REDIS_RATE_LIMIT), timing.span("rate_limit"):
+        await pipe.execute()
 
     return {
         "remaining": limit - current - 1,
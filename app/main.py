@@ -1,27 +1,80 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
 
+from app.ai import load_agent
 from app.config.redis import init_redis
+from app.config.settings import settings
 from app.config.supabase import init_supabase
+from app.dependencies.admin import verify_admin_key
 from app.exceptions import AppError
-from app.routers import chat, conversations, heroes
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.timing import ServerTimingMiddleware
+from app.routers import admin, chat, conversations, heroes
 from app.scheduler.scheduler import shutdown_scheduler, start_scheduler
+from app.services.message_buffer import drain_message_buffer, start_message_buffer
+from app.services.overfast import close_overfast_client, init_overfast_client
+from app.utils.cluster_metrics import (
+    render_cluster_metrics,
+    start_metrics_publisher,
+    stop_metrics_publisher,
+)
+from app.utils.serializer import FastJSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _create_ai_clients() -> None:
+    """AI 클라이언트를 만들어 둔다. (첫 채팅 요청 지연 방지)"""
+    from app.ai import agent, tools
+
+    agent.get_llm()
+    agent.get_title_llm()
+    tools.get_embeddings()
+    tools.get_tavily()
+    tools.get_sync_supabase()
+
+
+async def _preload_ai() -> None:
+    """첫 채팅 요청과 같은 임포트 작업으로 LangChain 스택을 불러오고 AI 클라이언트를 만든다."""
+    try:
+        await load_agent()
+        await asyncio.to_thread(_create_ai_clients)
+    except Exception as e:
+        # 실패해도 첫 요청에서 다시 만든다
+        logger.warning("AI 클라이언트 미리 불러오기 실패: %s", e)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_supabase()
     await init_redis()
+    await init_overfast_client()
+    start_message_buffer()
+    start_metrics_publisher()
     start_scheduler()
+    # 시작을 막지 않도록 백그라운드에서 불러온다. 채팅을 받지 않는 워커는 AI_PRELOAD=false
+    preload = asyncio.create_task(_preload_ai()) if settings.ai_preload else None
     yield
+    if preload and not preload.done():
+        preload.cancel()
     shutdown_scheduler()
+    await drain_message_buffer()
+    await stop_metrics_publisher()
+    await close_overfast_client()
 
 
-app = FastAPI(title="OOW.GG API", lifespan=lifespan)
+app = FastAPI(
+    title="OOW.GG API",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -30,20 +83,28 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(
+    ServerTimingMiddleware,
+    sample_rate=settings.server_timing_sample_rate,
+    log=settings.server_timing_log,
+)
 
 app.include_router(heroes.router)
 app.include_router(chat.router)
 app.include_router(conversations.router)
+app.include_router(admin.router)
 
 
 @app.exception_handler(AppError)
 async def handle_app_error(request, exc: AppError):
-    return JSONResponse(status_code=exc.status_code, content={"error": exc.message})
+    return FastJSONResponse(status_code=exc.status_code, content={"error": exc.message})
 
 
 @app.exception_handler(Exception)
 async def handle_unexpected(request, exc: Exception):
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=500, content={"error": "서버 내부 오류가 발생했습니다"}
     )
 
@@ -51,3 +112,17 @@ async def handle_unexpected(request, exc: Exception):
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "timestamp": datetime.now(UTC).isoformat()}
+
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(verify_admin_key)])
+async def metrics_endpoint():
+    """
+    Prometheus 수집용 메트릭 (텍스트 형식)
+
+    어느 워커가 받아도 모든 워커의 값을 worker 라벨로 구분해 내보낸다.
+    수집 설정에서 X-Admin-Key 헤더를 보내야 한다.
+    """
+    return PlainTextResponse(
+        await render_cluster_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,92 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.compression import MIN_COMPRESS_SIZE, choose_encoding, compress
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+EXCLUDED_TYPES = ("text/event-stream",)
+
+
+def _is_compressible_type(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES) and not content_type.startswith(
+        EXCLUDED_TYPES
+    )
+
+
+def _is_compressible(headers: Headers) -> bool:
+    return "content-encoding" not in headers and _is_compressible_type(headers)
+
+
+def _add_vary(message: Message) -> None:
+    """응답 시작 메시지에 Vary: Accept-Encoding을 더한다. (이미 있으면 그대로)"""
+    headers = MutableHeaders(raw=message["headers"])
+    vary = {value.strip().lower() for value in headers.get("vary", "").split(",")}
+    if "accept-encoding" not in vary:
+        headers.add_vary_header("Accept-Encoding")
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding 협상 기반 응답 압축 미들웨어 (zstd > br > gzip)
+
+    - minimum_size 미만의 응답, 이미 압축된 응답(Content-Encoding 지정), SSE는 그대로 보낸다
+    - 본문이 여러 조각으로 나뉘는 스트리밍 응답은 압축하지 않고 그대로 흘려보낸다
+    - 압축할 수 있는 타입의 응답에는 실제 압축 여부와 관계없이 Vary: Accept-Encoding을 붙인다
+      (작은 응답이나 압축을 협상하지 않은 요청의 원본 본문을 공유 캐시가 다른 클라이언트에
+      돌려주지 않도록)
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MIN_COMPRESS_SIZE) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if _is_compressible_type(headers):
+                    _add_vary(message)
+                if encoding is None or not _is_compressible(headers):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+
+            if message.get("more_body", False):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            if len(body) >= self.minimum_size:
+                body = compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,46 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils import metrics
+
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 처리 시간을 http_request_duration_seconds 히스토그램에 기록하는 미들웨어
+
+    - 경로 라벨은 실제 URL이 아니라 라우트 템플릿(/api/heroes/{hero_key})이라 라벨 수가 늘지 않는다
+    - 매칭되는 라우트가 없으면 "unmatched"로 묶는다
+    - 스트리밍 응답(SSE)은 마지막 본문 조각을 보낼 때까지를 잰다
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            metrics.observe(
+                "http_request_duration_seconds",
+                time.perf_counter() - started,
+                {
+                    "method": scope["method"],
+                    "route": getattr(route, "path", "unmatched"),
+                    "status": str(status_code),
+                },
+            )
@@ -0,0 +1,52 @@
+import json
+import logging
+import random
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.timing import start_request_timing
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """
+    표본 요청의 구간 시간을 Server-Timing 헤더와 구조화 로그로 내보내는 미들웨어
+
+    - sample_rate 비율의 요청만 측정한다 (0이면 끔). 나머지 요청은 그대로 통과한다
+    - 헤더에는 응답 시작 전까지의 구간이, 로그에는 스트림 종료까지의 전체 구간이 담긴다
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0, log: bool = False) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.log = log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_request_timing()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", timings.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if self.log:
+                route = scope.get("route")
+                logger.info(json.dumps({
+                    "event": "request_timing",
+                    "method": scope["method"],
+                    "route": getattr(route, "path", scope["path"]),
+                    "status": status_code,
+                    **timings.as_log_fields(),
+                }, ensure_ascii=False))
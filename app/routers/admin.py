@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.dependencies.admin import verify_admin_key
+from app.scheduler.progress import get_sync_status
+
+router = APIRouter(
+    prefix="/admin", tags=["admin"], dependencies=[Depends(verify_admin_key)]
+)
+
+
+@router.get("/sync/status")
+async def sync_status(
+    recent_items: int = Query(default=20, ge=1, le=200, alias="recentItems"),
+):
+    """동기화 작업별 진행 상황(i/N, ETA)과 최근 항목 지표를 조회한다."""
+    return await get_sync_status(recent_items)
@@ -1,14 +1,20 @@
-import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
 
-from app.ai.agent import generate_response_stream, generate_title
+from app.ai import load_agent
 from app.dependencies.auth import get_current_user_or_none
 from app.dependencies.rate_limit import check_rate_limit
 from app.schemas.chat import ChatMetaEvent, ChatRequest
 from app.services import conversation_service
+from app.utils import metrics, serializer
+from app.utils.disconnect import ClientDisconnectedError, stream_until_disconnect
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
@@ -16,29 +22,91 @@ RateLimitDep = Annotated[dict, Depends(check_rate_limit)]
 OptionalUserDep = Annotated[dict | None, Depends(get_current_user_or_none)]
 
 
+def _record_aborted_run(streamed_tokens: int) -> None:
+    """
+    중단된 응답의 메트릭을 기록한다.
+
+    - 절약 토큰은 완료된 응답의 평균 토큰 수에서 이미 스트리밍된 토큰 수를 뺀 추정치
+    - 부분 응답은 저장하지 않는다 (사용자가 끝까지 보지 않은 답변이므로)
+    """
+    completed_runs = metrics.get_counter("chat_runs_completed_total")
+    average_tokens = (
+        metrics.get_counter("chat_completed_tokens_total") / completed_runs
+        if completed_runs
+        else 0
+    )
+    saved_tokens = max(average_tokens - streamed_tokens, 0)
+
+    metrics.increment("chat_runs_aborted_total")
+    metrics.increment("chat_aborted_tokens_total", streamed_tokens)
+    metrics.increment("chat_tokens_saved_estimate_total", saved_tokens)
+
+    logger.info(
+        "클라이언트 연결 종료로 응답 중단: 스트리밍 %d토큰, 절약 추정 %d토큰, 부분 응답 저장 안 함",
+        streamed_tokens, saved_tokens,
+    )
+
+
+async def _track_active_stream(stream: AsyncIterator[str]) -> AsyncIterator[str]:
+    """스트림이 열려 있는 동안 sse_active_streams 게이지를 1 올려 둔다."""
+    metrics.add_gauge("sse_active_streams", 1)
+    try:
+        async with aclosing(stream):
+            async for chunk in stream:
+                yield chunk
+    finally:
+        metrics.add_gauge("sse_active_streams", -1)
+
+
 @router.post("")
 async def chat(
     request: ChatRequest,
+    http_request: Request,
     rate_limit: RateLimitDep,
     user: OptionalUserDep,
 ):
-    """AI 채팅 응답 생성 (스트리밍)"""
+    """AI 채팅 응답 생성 (스트리밍)
+
+    클라이언트 연결이 끊기면 에이전트 실행과 진행 중인 도구 호출을 즉시 취소하고,
+    부분 응답은 저장하지 않는다.
+    """
+    # 첫 요청이면 LangChain 스택을 이벤트 루프 밖에서 불러온다 (다른 요청을 막지 않도록)
+    agent = await load_agent()
 
     is_logged_in = user is not None
 
     async def event_generator():
         full_response = ""
+        streamed_tokens = 0
+        completed = False
+
+        # 연결 종료는 ClientDisconnectedError 외에도 태스크 취소, 전송 실패에 따른 GeneratorExit 등
+        # 여러 형태로 드러나므로, 끝까지 스트리밍하지 못한 실행은 모두 finally에서 기록한다
+        try:
+            async for chunk in stream_until_disconnect(
+                http_request,
+                agent.generate_response_stream(
+                    user_input=request.message,
+                    tag=request.tag,
+                    chat_history=request.chat_history
+                ),
+            ):
+                # 전송 중에 연결이 끊겨도 보낸 토큰이 집계되도록 먼저 센다
+                data = serializer.loads(chunk.removeprefix("data: "))
+                if data["type"] == "content":
+                    full_response += data["content"]
+                    streamed_tokens += 1
+
+                yield chunk
+            completed = True
+        except ClientDisconnectedError:
+            return
+        finally:
+            if not completed:
+                _record_aborted_run(streamed_tokens)
 
-        async for chunk in generate_response_stream(
-            user_input=request.message,
-            tag=request.tag,
-            chat_history=request.chat_history
-        ):
-            yield chunk
-
-            if '"type": "content"' in chunk:
-                data = json.loads(chunk.replace("data: ", "").strip())
-                full_response += data["content"]
+        metrics.increment("chat_runs_completed_total")
+        metrics.increment("chat_completed_tokens_total", streamed_tokens)
 
         if not is_logged_in:
             return
@@ -46,7 +114,7 @@ async def chat(
         conversation_id = request.conversation_id
 
         if not conversation_id:
-            title = await generate_title(request.message, full_response)
+            title = await agent.generate_title(request.message, full_response)
             conversation = await conversation_service.create_conversation(
                 user_id=user["id"],
                 title=title,
@@ -54,15 +122,13 @@ async def chat(
             )
             conversation_id = conversation["id"]
 
-        await conversation_service.add_message(
-            conversation_id=conversation_id,
-            role="user",
-            content=request.message,
-        )
-        await conversation_service.add_message(
+        await conversation_service.queue_messages(
             conversation_id=conversation_id,
-            role="assistant",
-            content=full_response,
+            messages=[
+                {"role": "user", "content": request.message},
+                {"role": "assistant", "content": full_response},
+            ],
+            user_id=user["id"],
         )
 
         meta_event = ChatMetaEvent(conversation_id=str(conversation_id))
@@ -70,7 +136,7 @@ async def chat(
         yield f"data: {meta_event.model_dump_json(by_alias=True)}\n\n"
 
     return StreamingResponse(
-        event_generator(),
+        _track_active_stream(event_generator()),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -1,7 +1,7 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.dependencies.auth import get_current_user
 from app.schemas.conversation import (
@@ -12,6 +12,7 @@ from app.schemas.conversation import (
     MigrateRequest,
 )
 from app.services import conversation_service
+from app.services.conversation_service import DEFAULT_MESSAGE_LIMIT, MAX_MESSAGE_LIMIT
 
 router = APIRouter(prefix="/api/conversations", tags=["conversations"])
 
@@ -46,15 +47,21 @@ async def get_conversations(user: UserDep):
 async def get_messages(
     conversation_id: UUID,
     user: UserDep,
+    limit: int = Query(default=DEFAULT_MESSAGE_LIMIT, ge=1, le=MAX_MESSAGE_LIMIT),
+    before: str | None = Query(default=None, description="이 커서보다 오래된 메시지 조회"),
+    after: str | None = Query(default=None, description="이 커서보다 새로운 메시지 조회"),
 ):
-    """채팅방의 메시지를 조회한다."""
-    messages = await conversation_service.get_conversation_messages(
+    """채팅방의 메시지를 조회한다. (커서 없으면 최신 페이지)"""
+    page = await conversation_service.get_conversation_messages(
         user_id=user["id"],
         conversation_id=conversation_id,
+        limit=limit,
+        before=before,
+        after=after,
     )
     return {
-        "messages": messages,
-        "total": len(messages),
+        **page,
+        "total": len(page["messages"]),
     }
 
 
@@ -1,30 +1,52 @@
-from fastapi import APIRouter, Path, Query
+import re
 
-from app.schemas.hero import HeroDetailResponse, HeroListResponse, StatsResponse
-from app.services.hero_service import get_hero_detail, get_hero_stats
+from fastapi import APIRouter, Header, Path, Query, Response
+
+from app.exceptions import InvalidParameterError
+from app.schemas.hero import (
+    HeroBatchResponse,
+    HeroDetailResponse,
+    HeroListResponse,
+    StatsHistoryResponse,
+    StatsResponse,
+)
+from app.services.hero_service import get_hero_detail, get_hero_details, get_hero_stats
 from app.services.hero_service import get_heroes as get_heroes_service
-from app.utils.cache import get_or_set_cache
+from app.services.stats_history import RETENTION_DAYS, get_hero_stats_history
+from app.utils import serializer
+from app.utils.cache import get_or_set_response_bodies, get_or_set_response_cache
 
 router = APIRouter(prefix="/api/heroes", tags=["heroes"])
 
 HEROES_CACHE_TTL = 3600
 STATS_CACHE_TTL = 1800
 HERO_DETAIL_CACHE_TTL = 3600
+MAX_BATCH_KEYS = 50
+# PostgREST in_() 필터에 그대로 들어가므로 쉼표/괄호 등이 섞인 키는 받지 않는다
+HERO_KEY_PATTERN = re.compile(r"[a-z0-9-]+")
+
+
+async def _fetch_hero_list(role: str) -> dict:
+    heroes = await get_heroes_service(role)
+    return {"heroes": heroes, "total": len(heroes)}
 
 
 @router.get("", response_model=HeroListResponse)
-async def get_heroes(role: str = Query(default="all")):
+async def get_heroes(
+    role: str = Query(default="all"),
+    accept_encoding: str | None = Header(default=None),
+):
     """영웅 목록을 조회한다."""
     cache_key = f"cache:heroes:{role}"
 
-    heroes = await get_or_set_cache(
+    return await get_or_set_response_cache(
         key=cache_key,
-        fetch_fn=lambda: get_heroes_service(role),
+        fetch_fn=lambda: _fetch_hero_list(role),
         ttl=HEROES_CACHE_TTL,
+        response_model=HeroListResponse,
+        accept_encoding=accept_encoding,
     )
 
-    return HeroListResponse(heroes=heroes, total=len(heroes))
-
 
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats(
@@ -34,11 +56,12 @@ async def get_stats(
     competitive_division: str = Query(default="all", alias="competitiveDivision"),
     role: str = Query(default="all"),
     order_by: str = Query(default="winrate:desc"),
+    accept_encoding: str | None = Header(default=None),
 ):
     """영웅 통계를 조회한다."""
     cache_key = f"cache:stats:{platform}:{gamemode}:{region}:{competitive_division}:{role}:{order_by}"
 
-    return await get_or_set_cache(
+    return await get_or_set_response_cache(
         key=cache_key,
         fetch_fn=lambda: get_hero_stats(
             platform=platform,
@@ -49,16 +72,92 @@ async def get_stats(
             order_by=order_by,
         ),
         ttl=STATS_CACHE_TTL,
+        response_model=StatsResponse,
+        accept_encoding=accept_encoding,
+    )
+
+
+def _parse_batch_keys(keys: str) -> list[str]:
+    """쉼표로 구분한 영웅 키를 순서를 유지한 채 중복 없이 나눈다."""
+    hero_keys = list(dict.fromkeys(key.strip() for key in keys.split(",") if key.strip()))
+    if not hero_keys:
+        raise InvalidParameterError("조회할 영웅 키를 입력하세요.")
+    if len(hero_keys) > MAX_BATCH_KEYS:
+        raise InvalidParameterError(
+            f"영웅은 한 번에 최대 {MAX_BATCH_KEYS}명까지 조회할 수 있습니다."
+        )
+    invalid = [key for key in hero_keys if not HERO_KEY_PATTERN.fullmatch(key)]
+    if invalid:
+        raise InvalidParameterError(
+            f"유효하지 않은 영웅 키입니다: {', '.join(invalid[:5])} (영문 소문자, 숫자, - 만 사용)"
+        )
+    return hero_keys
+
+
+@router.get("/batch", response_model=HeroBatchResponse)
+async def get_heroes_batch(
+    keys: str = Query(description="쉼표로 구분한 영웅 키 (예: ana,dva)"),
+):
+    """
+    여러 영웅의 상세 정보를 한 번에 조회한다.
+
+    단건 조회와 같은 캐시를 쓰며, 캐시된 JSON 본문을 다시 파싱하지 않고 이어 붙여 응답한다.
+    존재하지 않는 영웅은 missing에 담는다.
+    """
+    hero_keys = _parse_batch_keys(keys)
+
+    bodies = await get_or_set_response_bodies(
+        keys={hero_key: f"cache:heroDetail:{hero_key}" for hero_key in hero_keys},
+        fetch_fn=get_hero_details,
+        ttl=HERO_DETAIL_CACHE_TTL,
+        response_model=HeroDetailResponse,
     )
 
+    found = [bodies[hero_key] for hero_key in hero_keys if hero_key in bodies]
+    missing = [hero_key for hero_key in hero_keys if hero_key not in bodies]
+    body = b"".join([
+        b'{"heroes":[', b",".join(found), b'],"total":', str(len(found)).encode(),
+        b',"missing":', serializer.dumps(missing), b"}",
+    ])
+    return Response(content=body, media_type="application/json")
+
 
 @router.get("/{hero_key}", response_model=HeroDetailResponse)
-async def get_hero(hero_key: str = Path(description="영웅 고유 키 (예: ana, dva)")):
+async def get_hero(
+    hero_key: str = Path(description="영웅 고유 키 (예: ana, dva)"),
+    accept_encoding: str | None = Header(default=None),
+):
     """영웅 상세 정보를 조회한다."""
     cache_key = f"cache:heroDetail:{hero_key}"
 
-    return await get_or_set_cache(
+    return await get_or_set_response_cache(
         key=cache_key,
         fetch_fn=lambda: get_hero_detail(hero_key),
         ttl=HERO_DETAIL_CACHE_TTL,
+        response_model=HeroDetailResponse,
+        accept_encoding=accept_encoding,
+    )
+
+
+@router.get("/{hero_key}/stats/history", response_model=StatsHistoryResponse)
+async def get_hero_stats_history_endpoint(
+    hero_key: str = Path(description="영웅 고유 키 (예: ana, dva)"),
+    platform: str = Query(default="pc"),
+    gamemode: str = Query(default="competitive"),
+    region: str = Query(default="asia"),
+    competitive_division: str = Query(default="all", alias="competitiveDivision"),
+    days: int = Query(default=30, ge=1, le=RETENTION_DAYS),
+):
+    """
+    영웅 통계 추이(승률/픽률)를 조회한다.
+
+    지점은 통계가 바뀐 시각(변경 지점)이며, 첫 지점은 범위 시작 시점의 값이다.
+    """
+    return await get_hero_stats_history(
+        hero_key=hero_key,
+        platform=platform,
+        gamemode=gamemode,
+        region=region,
+        competitive_division=competitive_division,
+        days=days,
     )
@@ -0,0 +1,178 @@
+"""
+스케줄러 작업의 클러스터 단위 단일 실행 (Redis 리스 락)
+
+모든 워커/레플리카가 같은 cron 시각에 작업을 시작하지만 실제 실행은 한 곳에서만 한다.
+
+- 리스(scheduler:lease:{job})를 얻은 워커가 리더로 실행하고, 실행 중에는 주기적으로 연장한다
+- 실행을 마치면 실행 슬롯(scheduler:slot:{job}:{주기 시작 시각})에 완료 표시를 남긴다.
+  슬롯은 작업 주기 단위로 내림한 시각이라, 늦게 깨어난 워커도 같은 주기면 같은 슬롯을 본다
+- 나머지 워커는 완료 표시가 생길 때까지 대기하다가, 리더가 죽어 리스가 만료되면 이어받아 실행한다
+- 연장에 실패해 리스를 잃으면 두 곳에서 동시에 실행되지 않도록 진행 중인 작업을 취소한다
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from app.config.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+LEASE_TTL = 30.0
+HEARTBEAT_INTERVAL = 10.0
+STANDBY_POLL_INTERVAL = 5.0
+STANDBY_TIMEOUT = 3600.0
+SLOT_TTL = 86400
+DEFAULT_SLOT_PERIOD = timedelta(minutes=1)
+
+# 토큰이 같을 때만 연장/삭제한다 (다른 워커의 리스를 건드리지 않도록)
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaseLostError(Exception):
+    """실행 중 리스를 잃어 작업을 중단함"""
+
+
+class RedisLease:
+    """토큰으로 소유자를 구분하는 Redis 리스 (SET NX PX)"""
+
+    def __init__(self, key: str, ttl: float = LEASE_TTL) -> None:
+        self.key = key
+        self.ttl_ms = int(ttl * 1000)
+        self.token = uuid.uuid4().hex
+        self.lost = False
+
+    async def acquire(self) -> bool:
+        """리스가 비어 있으면 얻는다."""
+        return bool(await get_redis().set(self.key, self.token, nx=True, px=self.ttl_ms))
+
+    async def renew(self) -> bool:
+        """아직 소유 중이면 만료 시간을 연장한다."""
+        return bool(await get_redis().eval(_RENEW_SCRIPT, 1, self.key, self.token, self.ttl_ms))
+
+    async def release(self) -> None:
+        """소유 중인 리스를 반납한다. 실패해도 TTL이 지나면 풀린다."""
+        try:
+            await get_redis().eval(_RELEASE_SCRIPT, 1, self.key, self.token)
+        except Exception as e:
+            logger.warning("리스 반납 실패 (%s): %s", self.key, e)
+
+
+async def _heartbeat(lease: RedisLease, job: asyncio.Task) -> None:
+    """리스를 주기적으로 연장한다. 리스를 잃었거나 만료됐을 수 있으면 작업을 취소한다."""
+    last_renewed = time.monotonic()
+
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+        try:
+            if await lease.renew():
+                last_renewed = time.monotonic()
+                continue
+            reason = "다른 워커가 리스를 보유 중"
+        except Exception as e:
+            # 다음 연장 시점 전에 만료될 수 있으면 더 기다리지 않는다
+            if time.monotonic() - last_renewed + HEARTBEAT_INTERVAL < lease.ttl_ms / 1000:
+                logger.warning("리스 연장 실패, 재시도 (%s): %s", lease.key, e)
+                continue
+            reason = f"연장 실패 ({e})"
+
+        lease.lost = True
+        logger.error("리스 상실로 작업 취소 (%s): %s", lease.key, reason)
+        job.cancel()
+        return
+
+
+async def _run_with_heartbeat(lease: RedisLease, job_fn: Callable[[], Awaitable]) -> None:
+    job = asyncio.create_task(job_fn())
+    heartbeat = asyncio.create_task(_heartbeat(lease, job))
+
+    try:
+        await job
+    except asyncio.CancelledError:
+        if lease.lost:
+            raise LeaseLostError() from None
+        raise
+    finally:
+        heartbeat.cancel()
+
+
+def _slot_start(period: timedelta) -> datetime:
+    """현재 시각을 period 단위로 내림한다 (UTC epoch 기준)."""
+    seconds = period.total_seconds()
+    now = time.time()
+    return datetime.fromtimestamp(now - now % seconds, UTC)
+
+
+async def run_exclusive(
+    job_name: str,
+    job_fn: Callable[[], Awaitable],
+    standby_timeout: float = STANDBY_TIMEOUT,
+    lease_name: str | None = None,
+    slot_period: timedelta = DEFAULT_SLOT_PERIOD,
+) -> None:
+    """
+    클러스터 전체에서 실행 슬롯당 한 번만 job_fn을 실행한다.
+
+    Args:
+        job_name: 작업 이름 (리스/슬롯 키에 사용)
+        job_fn: 실행할 작업 (async, 인자 없음)
+        standby_timeout: 다른 워커가 실행 중일 때 이어받기 위해 기다리는 최대 시간 (초).
+            0이면 기다리지 않고 건너뛴다
+        lease_name: 리스 이름. 다른 작업과 동시에 실행되면 안 될 때 그 작업 이름을 준다
+            (기본값 job_name). 실행 슬롯은 항상 job_name 기준이다
+        slot_period: 실행 슬롯 단위. 작업 주기로 주면 워커마다 실행 시각이 조금씩 달라도
+            (misfire, 이벤트 루프 지연, 분 경계) 한 주기에 한 번만 실행된다
+    """
+    slot = _slot_start(slot_period).isoformat()
+    slot_key = f"scheduler:slot:{job_name}:{slot}"
+    lease = RedisLease(f"scheduler:lease:{lease_name or job_name}")
+    redis = get_redis()
+    deadline = time.monotonic() + standby_timeout
+
+    try:
+        while True:
+            if await redis.exists(slot_key):
+                logger.info("%s (%s): 다른 워커에서 실행 완료", job_name, slot)
+                return
+            if await lease.acquire():
+                break
+            if time.monotonic() >= deadline:
+                logger.warning("%s (%s): 대기 시간 초과, 이번 실행은 건너뜀", job_name, slot)
+                return
+            await asyncio.sleep(STANDBY_POLL_INTERVAL)
+    except Exception as e:
+        logger.error("%s (%s): 리스 확인 실패, 이번 실행은 건너뜀: %s", job_name, slot, e)
+        return
+
+    try:
+        # 리스를 얻기 직전에 이전 리더가 완료했을 수 있다
+        if await redis.exists(slot_key):
+            logger.info("%s (%s): 다른 워커에서 실행 완료", job_name, slot)
+            return
+
+        logger.info("%s (%s): 이 워커에서 실행", job_name, slot)
+        await _run_with_heartbeat(lease, job_fn)
+        await redis.set(
+            slot_key, lease.token, ex=max(SLOT_TTL, int(slot_period.total_seconds()))
+        )
+
+    except LeaseLostError:
+        logger.error("%s (%s): 리스를 잃어 중단, 다른 워커가 이어받음", job_name, slot)
+
+    finally:
+        await lease.release()
@@ -0,0 +1,188 @@
+"""
+동기화 진행 상황 / 항목별 지표
+
+- 실행 중 진행률(i/N, ETA)을 Redis(sync:progress:{job})에 기록해 /admin/sync/status에서 본다
+- 항목별 지표(Overfast 시간, 재시도, 429, 대기, DB 시간)는 sync:progress:{job}:items 리스트에 쌓는다
+- 실행이 끝나면 summary()를 scheduler_logs.metrics에 함께 남긴다
+"""
+
+import json
+import logging
+import time
+from datetime import UTC, datetime
+
+from app.config.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_TTL = 86400
+SLOWEST_ITEMS = 5
+JOB_NAMES = ("sync_heroes", "sync_hero_stats")
+
+
+def _progress_key(job_name: str) -> str:
+    return f"sync:progress:{job_name}"
+
+
+class SyncProgress:
+    """동기화 실행 1회의 진행 상황과 항목별 지표"""
+
+    def __init__(self, job_name: str, total: int, resumed: bool = False) -> None:
+        self.job_name = job_name
+        self.total = total
+        self.resumed = resumed
+        self.done = 0
+        self.failed = 0
+        self.items: list[dict] = []
+        self._started = time.perf_counter()
+
+    async def _write(self, mapping: dict, item: dict | None = None, reset: bool = False) -> None:
+        """진행 상황은 참고용이므로 Redis 오류는 기록만 하고 넘어간다."""
+        key = _progress_key(self.job_name)
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            if reset:
+                pipe.delete(key, f"{key}:items")
+            pipe.hset(key, mapping={
+                **mapping, "updated_at": datetime.now(UTC).isoformat()
+            })
+            if item:
+                pipe.rpush(f"{key}:items", json.dumps(item, ensure_ascii=False))
+            pipe.expire(key, PROGRESS_TTL)
+            pipe.expire(f"{key}:items", PROGRESS_TTL)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("진행 상황 기록 실패 (%s): %s", self.job_name, e)
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def _eta(self) -> float | None:
+        processed = self.done + self.failed
+        if not processed:
+            return None
+        return self._elapsed() / processed * (self.total - processed)
+
+    async def start(self) -> None:
+        await self._write(
+            {
+                "status": "running",
+                "started_at": datetime.now(UTC).isoformat(),
+                "resumed": int(self.resumed),
+                "total": self.total,
+                "done": 0,
+                "failed": 0,
+                "current": "",
+                "elapsed_seconds": 0,
+                "eta_seconds": "",
+            },
+            reset=True,
+        )
+
+    async def item_finished(self, item: str, success: bool, metrics: dict) -> None:
+        """
+        항목 하나의 처리를 기록한다.
+
+        Args:
+            item: 영웅 키 또는 통계 조합 이름
+            success: 처리 성공 여부
+            metrics: start_item_metrics()로 모은 항목 지표
+        """
+        if success:
+            self.done += 1
+        else:
+            self.failed += 1
+
+        entry = {
+            "item": item,
+            "success": success,
+            **{name: round(value, 1) for name, value in metrics.items()},
+        }
+        self.items.append(entry)
+
+        eta = self._eta()
+        await self._write(
+            {
+                "done": self.done,
+                "failed": self.failed,
+                "current": item,
+                "elapsed_seconds": round(self._elapsed(), 1),
+                "eta_seconds": round(eta, 1) if eta is not None else "",
+            },
+            item=entry,
+        )
+
+    async def finish(self, status: str) -> None:
+        await self._write({
+            "status": status,
+            "current": "",
+            "elapsed_seconds": round(self._elapsed(), 1),
+            "eta_seconds": 0,
+        })
+
+    def summary(self) -> dict:
+        """scheduler_logs.metrics에 남길 지표 요약"""
+
+        def total(name: str) -> float:
+            return round(sum(item.get(name, 0) for item in self.items), 1)
+
+        slowest = sorted(self.items, key=lambda item: item["overfast_ms"], reverse=True)
+        return {
+            "wall_time_ms": round(self._elapsed() * 1000),
+            "overfast_requests": total("requests"),
+            "overfast_ms": total("overfast_ms"),
+            "retries": total("retries"),
+            "throttled": total("throttled"),
+            "rate_wait_ms": total("rate_wait_ms"),
+            "backoff_ms": total("backoff_ms"),
+            "item_db_ms": total("db_ms"),
+            "slowest_items": [
+                {"item": item["item"], "overfast_ms": item["overfast_ms"]}
+                for item in slowest[:SLOWEST_ITEMS]
+            ],
+        }
+
+
+def _parse_number(value: str | None) -> float | int | None:
+    if value in (None, ""):
+        return None
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+async def get_sync_status(recent_items: int = 20) -> dict:
+    """
+    동기화 작업별 최근 실행의 진행 상황을 반환한다.
+
+    Args:
+        recent_items: 작업별로 함께 반환할 최근 항목 지표 수
+    """
+    redis = get_redis()
+    jobs = {}
+
+    for job_name in JOB_NAMES:
+        key = _progress_key(job_name)
+        pipe = redis.pipeline(transaction=False)
+        pipe.hgetall(key)
+        pipe.lrange(f"{key}:items", -recent_items, -1)
+        progress, items = await pipe.execute()
+
+        if not progress:
+            jobs[job_name] = None
+            continue
+
+        jobs[job_name] = {
+            "status": progress.get("status"),
+            "started_at": progress.get("started_at"),
+            "updated_at": progress.get("updated_at"),
+            "resumed": progress.get("resumed") == "1",
+            "total": _parse_number(progress.get("total")),
+            "done": _parse_number(progress.get("done")),
+            "failed": _parse_number(progress.get("failed")),
+            "current": progress.get("current") or None,
+            "elapsed_seconds": _parse_number(progress.get("elapsed_seconds")),
+            "eta_seconds": _parse_number(progress.get("eta_seconds")),
+            "recent_items": [json.loads(item) for item in items],
+        }
+
+    return {"jobs": jobs}
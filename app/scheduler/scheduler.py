@@ -1,15 +1,49 @@
 import logging
+from datetime import timedelta
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
+from app.scheduler.leader import run_exclusive
 from app.scheduler.sync_service import sync_hero_stats, sync_heroes
 
 logger = logging.getLogger(__name__)
 
+RETRY_INTERVAL_MINUTES = 15
+
+# run_exclusive의 실행 슬롯 단위 (작업 주기와 같게 둔다)
+SYNC_HEROES_PERIOD = timedelta(days=1)
+SYNC_HERO_STATS_PERIOD = timedelta(hours=3)
+RETRY_PERIOD = timedelta(minutes=RETRY_INTERVAL_MINUTES)
+
 _scheduler: AsyncIOScheduler | None = None
 
 
+async def retry_failed_syncs() -> None:
+    """
+    중단됐거나 실패 항목이 남은 동기화를 이어서 실행한다.
+
+    한 실행에서 MAX_ITEM_ATTEMPTS번 실패한 항목은 다음 정기 실행까지 다시 시도하지 않는다.
+
+    다른 워커에서 같은 작업이 실행 중이면 그쪽에 맡기고 기다리지 않는다.
+    """
+    await run_exclusive(
+        "sync_heroes:retry",
+        lambda: sync_heroes(resume=True),
+        standby_timeout=0,
+        lease_name="sync_heroes",
+        slot_period=RETRY_PERIOD,
+    )
+    await run_exclusive(
+        "sync_hero_stats:retry",
+        lambda: sync_hero_stats(resume=True),
+        standby_timeout=0,
+        lease_name="sync_hero_stats",
+        slot_period=RETRY_PERIOD,
+    )
+
+
 def start_scheduler() -> None:
     """스케줄러 시작"""
     scheduler_logger = logging.getLogger("app.scheduler")
@@ -23,22 +57,40 @@ def start_scheduler() -> None:
     global _scheduler
     _scheduler = AsyncIOScheduler()
 
+    # 모든 워커가 스케줄러를 띄우지만 run_exclusive가 클러스터 전체에서 한 번만 실행한다
     _scheduler.add_job(
-        sync_heroes,
+        run_exclusive,
+        args=["sync_heroes", sync_heroes],
+        kwargs={"slot_period": SYNC_HEROES_PERIOD},
         trigger=CronTrigger(hour=3, minute=0),
         id="sync_heroes",
         max_instances=1,
     )
 
     _scheduler.add_job(
-        sync_hero_stats,
+        run_exclusive,
+        args=["sync_hero_stats", sync_hero_stats],
+        kwargs={"slot_period": SYNC_HERO_STATS_PERIOD},
         trigger=CronTrigger(hour="*/3", minute=0),
         id="sync_hero_stats",
         max_instances=1,
     )
 
+    _scheduler.add_job(
+        retry_failed_syncs,
+        trigger=IntervalTrigger(minutes=RETRY_INTERVAL_MINUTES),
+        id="retry_failed_syncs",
+        max_instances=1,
+    )
+
+    # 재시작 직후 이전 프로세스에서 중단된 실행을 바로 이어간다
+    _scheduler.add_job(retry_failed_syncs, id="resume_syncs_on_startup")
+
     _scheduler.start()
-    logger.info("스케줄러 시작: sync_heroes(매일 03:00), sync_hero_stats(30분마다)")
+    logger.info(
+        "스케줄러 시작: sync_heroes(매일 03:00), sync_hero_stats(30분마다), "
+        "retry_failed_syncs(%d분마다)", RETRY_INTERVAL_MINUTES,
+    )
 
 
 def shutdown_scheduler() -> None:
@@ -1,18 +1,48 @@
 import asyncio
+import hashlib
+import json
 import logging
+import time
 from datetime import UTC, datetime
 
-import httpx
-
+from app.config.redis import get_redis
 from app.config.supabase import get_supabase
-from app.services.overfast import fetch_hero_detail, fetch_hero_stats, fetch_heroes
-from app.utils.cache import invalidate_cache
+from app.scheduler.progress import SyncProgress
+from app.services.overfast import (
+    NotModifiedError,
+    fetch_hero_detail,
+    fetch_hero_stats,
+    fetch_heroes,
+)
+from app.services.stats_history import append_snapshots
+from app.utils.cache import delete_cache_keys, invalidate_cache, response_cache_keys
+from app.utils.item_metrics import record_item_metric, start_item_metrics
 
 logger = logging.getLogger(__name__)
 
-BASE_DELAY = 15
-FAILURE_DELAY = 45
-MAX_RETRIES = 5
+MAX_CONCURRENCY = 3
+
+# 마지막으로 저장한 내용의 해시 (변경 감지용)
+HERO_HASHES_KEY = "sync:hashes:heroes"
+STATS_HASHES_KEY = "sync:hashes:stats"
+
+# 실행 진행 상황 (중단된 실행 재개 / 실패 항목 재시도용)
+CHECKPOINT_TTL = 86400
+HERO_CHUNK_SIZE = 15
+# 한 실행(체크포인트)에서 항목 하나를 시도하는 최대 횟수 (첫 시도 포함).
+# 넘으면 retry_failed_syncs 대상에서 빼고, 다음 정기 실행에서 다시 시도한다
+MAX_ITEM_ATTEMPTS = 4
+
+_NOT_MODIFIED = object()
+
+# 조건부 요청용 검증자 ("heroes:{영웅 키}" / "stats:{조합}" → If-None-Match / If-Modified-Since).
+# 응답 내용을 저장하고 해시를 기록한 뒤에만 갱신한다. 저장에 실패한 응답의 검증자를 보내면
+# 다음 실행에서 304를 받아 바뀐 내용을 영영 저장하지 못하기 때문이다.
+_validators: dict[str, dict[str, str]] = {}
+
+# 영웅 목록/통계/다른 영웅 상세(카운터·시너지)에 함께 실리는 필드.
+# 이 필드가 바뀔 때만 본인 상세 외의 캐시를 무효화한다
+HERO_SUMMARY_FIELDS = ("name", "portrait", "role")
 
 REGIONS = ["asia", "europe", "americas"]
 DIVISIONS = [
@@ -25,37 +55,143 @@ DIVISIONS = [
     "grandmaster",
 ]
 
-async def _fetch_with_retry(fetch_fn, **kwargs) -> list[dict] | dict | None:
-    """429/5xx 발생 시 지수 백오프로 재시도한다."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            return await fetch_fn(**kwargs)
-        except httpx.HTTPStatusError as e:
-            status = e.response.status_code
-            is_retryable = status == 429 or status >= 500
-            if is_retryable and attempt < MAX_RETRIES - 1:
-                retry_after = e.response.headers.get("Retry-After")
-                if retry_after:
-                    wait = int(retry_after) + 2
-                else:
-                    wait = 2 ** (attempt + 2)
-                logger.warning(
-                    "%d 응답 - %d초 대기 후 재시도 (%d/%d)",
-                    status, wait, attempt + 1, MAX_RETRIES,
-                )
-                await asyncio.sleep(wait)
-            else:
-                raise
-    return None
 
+def _content_hash(data) -> str:
+    """synced_at을 제외한 저장 내용의 해시. 키 순서와 무관하게 같은 값을 만든다."""
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
 
-async def _upsert_hero_info(
-    supabase,
-    hero_list_item: dict,
-    detail: dict,
-) -> None:
-    """영웅 기본 정보를 upsert한다."""
-    row = {
+
+async def _load_hashes(key: str) -> dict[str, str]:
+    """지난 실행에서 저장한 해시를 불러온다. Redis 장애 시 빈 값(전체 저장)으로 진행한다."""
+    try:
+        return await get_redis().hgetall(key)
+    except Exception as e:
+        logger.warning("변경 감지 해시 조회 실패, 전체 저장으로 진행 (%s): %s", key, e)
+        return {}
+
+
+async def _save_hashes(key: str, hashes: dict[str, str]) -> None:
+    """저장에 성공한 항목의 해시를 기록한다. 실패해도 다음 실행에서 다시 저장될 뿐이다."""
+    if not hashes:
+        return
+    try:
+        await get_redis().hset(key, mapping=hashes)
+    except Exception as e:
+        logger.warning("변경 감지 해시 저장 실패 (%s): %s", key, e)
+
+
+def _checkpoint_key(job_name: str) -> str:
+    return f"sync:checkpoint:{job_name}"
+
+
+async def _start_checkpoint(job_name: str, started_at: datetime) -> None:
+    """새 실행의 체크포인트를 만든다. 이전 실행의 기록은 지운다."""
+    key = _checkpoint_key(job_name)
+    try:
+        pipe = get_redis().pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.hset(key, mapping={"status": "running", "started_at": started_at.isoformat()})
+        pipe.expire(key, CHECKPOINT_TTL)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning("체크포인트 생성 실패 (%s): %s", job_name, e)
+
+
+async def _load_checkpoint(job_name: str) -> dict | None:
+    """
+    마지막 실행의 체크포인트를 불러온다.
+
+    Returns:
+        {"status": "running" | "completed", "done": 완료 항목, "failed": 재시도할 실패 항목,
+         "exhausted": 시도 횟수를 다 쓴 실패 항목}, 기록이 없으면 None
+    """
+    try:
+        fields = await get_redis().hgetall(_checkpoint_key(job_name))
+    except Exception as e:
+        logger.warning("체크포인트 조회 실패 (%s): %s", job_name, e)
+        return None
+
+    if not fields:
+        return None
+
+    items = {k.removeprefix("item:"): v for k, v in fields.items() if k.startswith("item:")}
+    failed = {item for item, state in items.items() if state == "failed"}
+    exhausted = {
+        item for item in failed
+        if int(fields.get(f"attempts:{item}", 0)) >= MAX_ITEM_ATTEMPTS
+    }
+    return {
+        "status": fields.get("status"),
+        "done": {item for item, state in items.items() if state == "done"},
+        "failed": failed - exhausted,
+        "exhausted": exhausted,
+    }
+
+
+async def _mark_items(job_name: str, items: list[str], state: str) -> None:
+    """
+    항목 처리 결과("done" | "failed")를 체크포인트에 기록한다.
+
+    실패 항목은 시도 횟수를 세고, MAX_ITEM_ATTEMPTS에 처음 도달한 항목을 한 번만 로그로 남긴다.
+    """
+    if not items:
+        return
+    key = _checkpoint_key(job_name)
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.hset(key, mapping={f"item:{item}": state for item in items})
+        if state == "failed":
+            for item in items:
+                pipe.hincrby(key, f"attempts:{item}", 1)
+        results = await pipe.execute()
+    except Exception as e:
+        logger.warning("체크포인트 기록 실패 (%s): %s", job_name, e)
+        return
+
+    exhausted = [
+        item for item, attempts in zip(items, results[1:], strict=False)
+        if attempts == MAX_ITEM_ATTEMPTS
+    ]
+    if exhausted:
+        logger.error(
+            "%s: %d번 실패한 항목은 다음 정기 실행까지 재시도하지 않음: %s",
+            job_name, MAX_ITEM_ATTEMPTS, ", ".join(exhausted),
+        )
+
+
+async def _finish_checkpoint(job_name: str) -> None:
+    try:
+        await get_redis().hset(_checkpoint_key(job_name), "status", "completed")
+    except Exception as e:
+        logger.warning("체크포인트 완료 기록 실패 (%s): %s", job_name, e)
+
+
+async def _pending_items(job_name: str) -> set[str] | None:
+    """
+    재시도할 항목이 있는지 확인한다.
+
+    Returns:
+        건너뛸 항목 집합 (완료 항목 + 시도 횟수를 다 쓴 실패 항목, 이 외의 항목을 다시 처리한다).
+        중단되지 않았고 재시도할 실패 항목도 없으면 None
+    """
+    checkpoint = await _load_checkpoint(job_name)
+    if not checkpoint:
+        return None
+    if checkpoint["status"] == "completed" and not checkpoint["failed"]:
+        return None
+    return checkpoint["done"] | checkpoint["exhausted"]
+
+
+async def _bounded(semaphore: asyncio.Semaphore, coro):
+    """세마포어로 동시 실행 수를 제한해 코루틴을 실행한다."""
+    async with semaphore:
+        return await coro
+
+
+def _build_hero_row(hero_list_item: dict, detail: dict, synced_at: str) -> dict:
+    """영웅 기본 정보 행을 만든다."""
+    return {
         "key": hero_list_item["key"],
         "name": detail.get("name", ""),
         "portrait": hero_list_item.get("portrait", ""),
@@ -63,38 +199,174 @@ async def _upsert_hero_info(
         "hitpoints_health": detail.get("hitpoints", {}).get("health", 0),
         "hitpoints_armor": detail.get("hitpoints", {}).get("armor", 0),
         "hitpoints_shields": detail.get("hitpoints", {}).get("shields", 0),
-        "synced_at": datetime.now(UTC).isoformat(),
+        "synced_at": synced_at,
     }
-    await supabase.table("heroes").upsert(row).execute()
 
 
-async def _upsert_hero_abilities(
-    supabase,
-    hero_key: str,
-    abilities: list[dict],
-) -> None:
-    """영웅 스킬을 upsert한다."""
+def _build_ability_rows(hero_key: str, abilities: list[dict]) -> list[dict]:
+    """영웅 스킬 행을 만든다. 같은 upsert 안에서 충돌하지 않도록 이름 중복은 제거한다."""
+    rows: dict[str, dict] = {}
     for ability in abilities:
-        row = {
+        name = ability.get("name", "")
+        rows[name] = {
             "hero_key": hero_key,
-            "name": ability.get("name", ""),
+            "name": name,
             "description": ability.get("description", ""),
             "icon": ability.get("icon", ""),
             "ability_type": "skill",
         }
+    return list(rows.values())
+
+
+def _quote_filter_value(value: str) -> str:
+    """PostgREST 논리 필터 값으로 쓸 수 있게 따옴표로 감싼다."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+async def _upsert_heroes(supabase, hero_rows: list[dict]) -> None:
+    """영웅 기본 정보를 한 번에 upsert한다."""
+    if hero_rows:
+        await supabase.table("heroes").upsert(hero_rows).execute()
+
+
+async def _upsert_hero_abilities(supabase, ability_rows: list[dict]) -> None:
+    """영웅 스킬을 한 번에 upsert한다."""
+    if ability_rows:
         await supabase.table("hero_abilities").upsert(
-            row, on_conflict="hero_key,name"
+            ability_rows, on_conflict="hero_key,name"
         ).execute()
 
 
+async def _delete_stale_abilities(
+    supabase,
+    hero_keys: list[str],
+    ability_rows: list[dict],
+) -> int:
+    """
+    동기화한 영웅의 스킬 중 Overfast에서 사라진 것을 삭제한다.
+
+    특전(perk_major/perk_minor)은 Overfast에서 오지 않으므로 skill 타입만 대상으로 한다.
+
+    Returns:
+        삭제한 스킬 수
+    """
+    if not hero_keys:
+        return 0
+
+    existing = await (
+        supabase.table("hero_abilities")
+        .select("hero_key, name")
+        .eq("ability_type", "skill")
+        .in_("hero_key", hero_keys)
+        .execute()
+    )
+
+    current = {(row["hero_key"], row["name"]) for row in ability_rows}
+    stale = [
+        (row["hero_key"], row["name"])
+        for row in existing.data
+        if (row["hero_key"], row["name"]) not in current
+    ]
+
+    if not stale:
+        return 0
+
+    conditions = ",".join(
+        f"and(hero_key.eq.{_quote_filter_value(hero_key)},name.eq.{_quote_filter_value(name)})"
+        for hero_key, name in stale
+    )
+    await (
+        supabase.table("hero_abilities")
+        .delete()
+        .eq("ability_type", "skill")
+        .or_(conditions)
+        .execute()
+    )
+
+    logger.info("사라진 스킬 %d개 삭제: %s", len(stale), stale)
+    return len(stale)
+
+
+async def _invalidate_hero_caches(
+    supabase,
+    summary_changed: list[str],
+    detail_changed: list[str],
+) -> int:
+    """
+    바뀐 영웅에 의존하는 캐시만 삭제한다.
+
+    - 이름/초상화/역할(HERO_SUMMARY_FIELDS)이 바뀐 영웅: 영웅 목록, 통계, 본인 상세,
+      카운터/시너지로 이 영웅을 보여주는 다른 영웅의 상세
+    - 체력이나 스킬만 바뀐 영웅: 본인 상세
+
+    Returns:
+        삭제한 캐시 키 수
+    """
+    detail_keys = set(summary_changed) | set(detail_changed)
+    deleted = 0
+
+    if summary_changed:
+        values = ",".join(_quote_filter_value(key) for key in summary_changed)
+        dependents = await (
+            supabase.table("heroes")
+            .select("key")
+            .or_(f"counters.ov.{{{values}}},synergies.ov.{{{values}}}")
+            .execute()
+        )
+        detail_keys.update(row["key"] for row in dependents.data)
+
+        deleted += await invalidate_cache("cache:heroes:*")
+        deleted += await invalidate_cache("cache:stats:*")
+
+    deleted += await delete_cache_keys([
+        cache_key
+        for hero_key in sorted(detail_keys)
+        for cache_key in response_cache_keys(f"cache:heroDetail:{hero_key}")
+    ])
+
+    logger.info("영웅 캐시 무효화: 상세 %d명, 키 %d개 삭제", len(detail_keys), deleted)
+    return deleted
+
+
+async def _invalidate_stats_caches(changed_tasks: list[dict]) -> int:
+    """
+    내용이 바뀐 통계 조합의 캐시만 삭제한다. (role / order_by 조합 전체)
+
+    모든 조합이 바뀌었으면 조합마다 SCAN하지 않고 cache:stats:*를 한 번에 지운다.
+
+    Returns:
+        삭제한 캐시 키 수
+    """
+    if not changed_tasks:
+        return 0
+
+    if len(changed_tasks) == len(_build_stat_tasks()):
+        deleted = await invalidate_cache("cache:stats:*")
+    else:
+        deleted = 0
+        for task in changed_tasks:
+            deleted += await invalidate_cache(
+                f"cache:stats:pc:{task['gamemode']}:{task['region']}:{task['division']}:*"
+            )
+
+    logger.info("통계 캐시 무효화: 조합 %d개, 키 %d개 삭제", len(changed_tasks), deleted)
+    return deleted
+
+
 async def _log_sync(
     supabase,
     task_name: str,
     status: str,
     started_at: datetime,
     error_message: str | None = None,
+    metrics: dict | None = None,
 ) -> None:
-    """scheduler_logs 테이블에 실행 결과를 기록한다."""
+    """scheduler_logs 테이블에 실행 결과를 기록한다.
+    Args:
+        metrics: 처리 건수/소요 시간 등 실행 지표 (jsonb 컬럼). None이면 컬럼을 보내지 않아
+            metrics 컬럼이 아직 없는 DB에서도 실패/진행 기록은 남는다
+    """
     row = {
         "task_name": task_name,
         "status": status,
@@ -102,40 +374,58 @@ async def _log_sync(
         "finished_at": datetime.now(UTC).isoformat(),
         "error_message": error_message,
     }
+    if metrics is not None:
+        row["metrics"] = metrics
     await supabase.table("scheduler_logs").insert(row).execute()
 
 
-async def _sync_single_hero(
-    supabase, client: httpx.AsyncClient, hero: dict, index: int, total: int
-) -> str | None:
-    """영웅 1명의 기본 정보 + 스킬을 동기화한다.
+async def _fetch_single_hero(
+    hero: dict,
+    index: int,
+    total: int,
+    conditional: bool = False,
+    progress: SyncProgress | None = None,
+) -> tuple[dict | object | None, dict[str, str]]:
+    """영웅 1명의 상세 정보를 가져온다.
+    Args:
+        conditional: True면 저장해 둔 검증자로 조건부 요청을 보낸다
+        progress: 조회 결과와 항목 지표를 기록할 진행 상황
     Returns:
-        실패 시 hero_key, 성공 시 None
+        (결과, 새 검증자). 결과는 성공 시 상세 정보, 304 응답 시 _NOT_MODIFIED, 실패 시 None
     """
     hero_key = hero["key"]
+    metrics = start_item_metrics()
+    detail, validators = await _fetch_hero_detail_logged(hero_key, index, total, conditional)
+
+    if progress:
+        await progress.item_finished(hero_key, detail is not None, metrics)
+    return detail, validators
+
 
+async def _fetch_hero_detail_logged(
+    hero_key: str, index: int, total: int, conditional: bool
+) -> tuple[dict | object | None, dict[str, str]]:
+    """상세 정보를 조회하고 결과를 로그로 남긴다. 반환값은 _fetch_single_hero와 같다."""
     try:
-        detail = await _fetch_with_retry(
-            fetch_hero_detail,
+        detail, validators = await fetch_hero_detail(
             hero_key=hero_key,
             locale="ko-kr",
-            client=client,
+            validators=_validators.get(f"heroes:{hero_key}") if conditional else None,
         )
 
         if not detail:
-            return hero_key
+            return None, {}
 
-        await _upsert_hero_info(supabase, hero, detail)
-        await _upsert_hero_abilities(
-            supabase, hero_key, detail.get("abilities", [])
-        )
+        logger.info("[%d/%d] %s 조회 완료", index, total, hero_key)
+        return detail, validators
 
-        logger.info("[%d/%d] %s 동기화 완료", index, total, hero_key)
-        return None
+    except NotModifiedError:
+        logger.info("[%d/%d] %s 변경 없음 (304)", index, total, hero_key)
+        return _NOT_MODIFIED, {}
 
     except Exception as e:
-        logger.error("[%d/%d] %s 동기화 실패: %s", index, total, hero_key, e)
-        return hero_key
+        logger.error("[%d/%d] %s 조회 실패: %s", index, total, hero_key, e)
+        return None, {}
 
 
 def _build_stat_tasks() -> list[dict]:
@@ -166,46 +456,53 @@ def _build_stat_tasks() -> list[dict]:
     return tasks
 
 
+def _stat_task_label(task: dict) -> str:
+    """통계 조합을 로그/해시 키로 쓸 이름. 예: "asia/competitive/gold" """
+    return f"{task['region']}/{task['gamemode']}/{task['division']}"
+
+
 async def _sync_single_stat_task(
     supabase,
-    client: httpx.AsyncClient,
     task: dict,
     valid_keys: set[str],
     synced_at: str,
     index: int,
     total: int,
-) -> tuple[int, bool]:
-    """통계 조합 1건을 동기화한다.
+    previous_hash: str | None = None,
+) -> tuple[int, str, float, str | None, dict[str, str]]:
+    """통계 조합 1건을 동기화한다. 내용이 바뀐 경우에만 한 번의 bulk upsert로 저장하고,
+    같은 값을 통계 추이(hero_stats_history)에도 한 점 추가한다.
+    Args:
+        previous_hash: 지난 실행에서 저장한 조합 해시. 있으면 조건부 요청을 보낸다
     Returns:
-        (저장 수, 성공 여부) 튜플
+        (저장 수, 결과, DB 소요 시간(초), 새 해시, 새 검증자) 튜플
+        결과는 "changed" | "unchanged" | "not_modified" | "failed".
+        새 검증자는 저장(또는 내용이 같음을 확인)한 경우에만 있다
     """
     gamemode = task["gamemode"]
     region = task["region"]
     division = task["division"]
     api_division = task["api_division"]
-    label = f"{region}/{gamemode}/{division}"
+    label = _stat_task_label(task)
 
     try:
         kwargs: dict = {
             "platform": "pc",
             "gamemode": gamemode,
             "region": region,
-            "client": client,
+            "validators": _validators.get(f"stats:{label}") if previous_hash else None,
         }
         if api_division:
             kwargs["competitive_division"] = api_division
 
-        stats = await _fetch_with_retry(fetch_hero_stats, **kwargs)
-
-        if stats is None:
-            return 0, False
-
-        saved = 0
-        for stat in stats:
-            if stat["hero"] not in valid_keys:
-                continue
+        try:
+            stats, validators = await fetch_hero_stats(**kwargs)
+        except NotModifiedError:
+            logger.info("[%d/%d] %s: 변경 없음 (304)", index, total, label)
+            return 0, "not_modified", 0.0, None, {}
 
-            row = {
+        rows = [
+            {
                 "hero_key": stat["hero"],
                 "platform": "pc",
                 "gamemode": gamemode,
@@ -215,103 +512,368 @@ async def _sync_single_stat_task(
                 "pickrate": stat.get("pickrate"),
                 "synced_at": synced_at,
             }
+            for stat in stats
+            if stat["hero"] in valid_keys
+        ]
+
+        content_hash = _content_hash(sorted(
+            ({k: v for k, v in row.items() if k != "synced_at"} for row in rows),
+            key=lambda row: row["hero_key"],
+        ))
+        if content_hash == previous_hash:
+            logger.info("[%d/%d] %s: 변경 없음", index, total, label)
+            return 0, "unchanged", 0.0, None, validators
+
+        db_started = time.perf_counter()
+        if rows:
             await supabase.table("hero_stats").upsert(
-                row,
+                rows,
                 on_conflict="hero_key,platform,gamemode,region,competitive_division",
             ).execute()
-            saved += 1
+            await append_snapshots(
+                supabase, "pc", gamemode, region, division, rows,
+                datetime.fromisoformat(synced_at),
+            )
+        db_time = time.perf_counter() - db_started
+        record_item_metric("db_ms", db_time * 1000)
 
-        logger.info("[%d/%d] %s: %d명 저장", index, total, label, saved)
-        return saved, True
+        logger.info(
+            "[%d/%d] %s: %d명 저장 (DB %.0fms)", index, total, label, len(rows), db_time * 1000
+        )
+        return len(rows), "changed", db_time, content_hash, validators
 
     except Exception as e:
         logger.error("[%d/%d] %s 실패: %s", index, total, label, e)
-        await asyncio.sleep(FAILURE_DELAY)
-        return 0, False
+        return 0, "failed", 0.0, None, {}
 
-async def sync_heroes() -> None:
-    """영웅 기본 정보 + 스킬을 동기화한다. (1일 1회)"""
+
+async def _sync_hero_chunk(
+    supabase,
+    heroes: list[dict],
+    previous: dict[str, str],
+    synced_at: str,
+    offset: int,
+    total: int,
+    progress: SyncProgress,
+) -> dict:
+    """
+    영웅 묶음 하나를 조회해 바뀐 내용만 저장하고, 해시 기록과 캐시 무효화까지 마친다.
+
+    Returns:
+        묶음 처리 결과 (done/failed 영웅 키와 저장/변경 건수)
+    """
+    result = {
+        "done": [], "failed": [], "changed": 0, "unchanged": 0, "not_modified": 0,
+        "heroes_saved": 0, "abilities_saved": 0, "abilities_deleted": 0,
+        "db_time": 0.0, "invalidated": 0,
+    }
+    hero_rows: list[dict] = []
+    ability_rows: list[dict] = []
+    ability_heroes: list[str] = []
+    summary_changed: list[str] = []
+    new_hashes: dict[str, str] = {}
+    new_validators: dict[str, dict[str, str]] = {}
+
+    # 목록 항목(portrait 등)이 그대로이고 지난 해시가 있을 때만 조건부 요청을 보낸다.
+    # 그래야 304를 받았을 때 저장할 내용이 없다고 확신할 수 있다.
+    list_hashes = {hero["key"]: _content_hash(hero) for hero in heroes}
+    conditional = {
+        key: (
+            previous.get(f"{key}:list") == list_hash
+            and f"{key}:info" in previous
+            and f"{key}:abilities" in previous
+        )
+        for key, list_hash in list_hashes.items()
+    }
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    details = await asyncio.gather(*(
+        _bounded(
+            semaphore,
+            _fetch_single_hero(
+                hero, offset + i + 1, total, conditional[hero["key"]], progress
+            ),
+        )
+        for i, hero in enumerate(heroes)
+    ))
+
+    for hero, (detail, validators) in zip(heroes, details, strict=True):
+        key = hero["key"]
+        if detail is _NOT_MODIFIED:
+            result["not_modified"] += 1
+            result["done"].append(key)
+            continue
+        if not detail:
+            result["failed"].append(key)
+            continue
+
+        hero_row = _build_hero_row(hero, detail, synced_at)
+        hero_abilities = _build_ability_rows(key, detail.get("abilities", []))
+        info_hash = _content_hash(
+            {k: v for k, v in hero_row.items() if k != "synced_at"}
+        )
+        abilities_hash = _content_hash(hero_abilities)
+        new_hashes[f"{key}:list"] = list_hashes[key]
+        if validators:
+            new_validators[f"heroes:{key}"] = validators
+        result["done"].append(key)
+
+        summary_hash = _content_hash({field: hero_row[field] for field in HERO_SUMMARY_FIELDS})
+        info_changed = previous.get(f"{key}:info") != info_hash
+        abilities_changed = previous.get(f"{key}:abilities") != abilities_hash
+
+        # 기본 정보가 그대로면 DB의 요약 필드도 같으므로 해시만 기록한다 (해시가 없던 영웅)
+        summary_stale = previous.get(f"{key}:summary") != summary_hash
+        if summary_stale:
+            new_hashes[f"{key}:summary"] = summary_hash
+
+        if info_changed:
+            hero_rows.append(hero_row)
+            new_hashes[f"{key}:info"] = info_hash
+            if summary_stale:
+                summary_changed.append(key)
+        if abilities_changed:
+            ability_rows.extend(hero_abilities)
+            ability_heroes.append(key)
+            new_hashes[f"{key}:abilities"] = abilities_hash
+
+        if info_changed or abilities_changed:
+            result["changed"] += 1
+        else:
+            result["unchanged"] += 1
+
+    db_started = time.perf_counter()
+    await _upsert_heroes(supabase, hero_rows)
+    await _upsert_hero_abilities(supabase, ability_rows)
+    deleted = await _delete_stale_abilities(supabase, ability_heroes, ability_rows)
+    result["db_time"] = time.perf_counter() - db_started
+
+    await _save_hashes(HERO_HASHES_KEY, new_hashes)
+    _validators.update(new_validators)
+
+    if hero_rows or ability_heroes:
+        result["invalidated"] = await _invalidate_hero_caches(
+            supabase,
+            summary_changed,
+            [row["key"] for row in hero_rows if row["key"] not in summary_changed]
+            + ability_heroes,
+        )
+
+    result["heroes_saved"] = len(hero_rows)
+    result["abilities_saved"] = len(ability_rows)
+    result["abilities_deleted"] = deleted
+    return result
+
+
+async def sync_heroes(resume: bool = False) -> None:
+    """영웅 기본 정보 + 스킬을 동기화한다. (1일 1회)
+
+    지난 실행과 내용 해시가 같은 영웅은 저장하지 않는다.
+    기본 정보와 스킬은 따로 비교하므로 스킬만 바뀐 영웅은 스킬만 저장한다.
+
+    HERO_CHUNK_SIZE명씩 저장하고 체크포인트에 기록하므로 중간에 멈춰도 저장한 묶음은 남는다.
+
+    Args:
+        resume: True면 지난 실행에서 완료하지 못한 영웅(중단/실패)만 다시 처리한다
+    """
+    job_name = "sync_heroes"
     started_at = datetime.now(UTC)
     supabase = get_supabase()
-    failed_heroes: list[str] = []
+
+    if resume:
+        skipped = await _pending_items(job_name)
+        if skipped is None:
+            return
+    else:
+        skipped = set()
+        await _start_checkpoint(job_name, started_at)
+
+    progress: SyncProgress | None = None
 
     try:
-        async with httpx.AsyncClient() as client:
-            heroes = await _fetch_with_retry(
-                fetch_heroes, locale="ko-kr", client=client
+        previous = await _load_hashes(HERO_HASHES_KEY)
+
+        heroes = await fetch_heroes(locale="ko-kr")
+
+        if not heroes:
+            logger.error("영웅 목록을 가져오지 못했습니다")
+            await _log_sync(
+                supabase, job_name, "failed", started_at, "영웅 목록 조회 실패"
             )
+            return
+
+        heroes = [hero for hero in heroes if hero["key"] not in skipped]
+        logger.info(
+            "총 %d명의 영웅 동기화 시작%s", len(heroes), " (재시도)" if resume else ""
+        )
+        progress = SyncProgress(job_name, len(heroes), resumed=resume)
+        await progress.start()
 
-            if not heroes:
-                logger.error("영웅 목록을 가져오지 못했습니다")
-                await _log_sync(
-                    supabase, "sync_heroes", "failed", started_at, "영웅 목록 조회 실패"
-                )
-                return
+        synced_at = datetime.now(UTC).isoformat()
+        totals = {
+            "changed": 0, "unchanged": 0, "not_modified": 0, "heroes_saved": 0,
+            "abilities_saved": 0, "abilities_deleted": 0, "db_time": 0.0, "invalidated": 0,
+        }
+        failed_heroes: list[str] = []
 
-            logger.info("총 %d명의 영웅 동기화 시작", len(heroes))
+        for offset in range(0, len(heroes), HERO_CHUNK_SIZE):
+            chunk = heroes[offset:offset + HERO_CHUNK_SIZE]
+            result = await _sync_hero_chunk(
+                supabase, chunk, previous, synced_at, offset, len(heroes), progress
+            )
 
-            for i, hero in enumerate(heroes):
-                failed_key = await _sync_single_hero(
-                    supabase, client, hero, i + 1, len(heroes)
-                )
-                if failed_key:
-                    failed_heroes.append(failed_key)
-                await asyncio.sleep(BASE_DELAY)
+            await _mark_items(job_name, result["done"], "done")
+            await _mark_items(job_name, result["failed"], "failed")
+            failed_heroes.extend(result["failed"])
+            for name in totals:
+                totals[name] += result[name]
+
+        await _finish_checkpoint(job_name)
 
         status = "failed" if failed_heroes else "success"
         error_msg = (
             f"실패한 영웅: {', '.join(failed_heroes)}" if failed_heroes else None
         )
-        await _log_sync(supabase, "sync_heroes", status, started_at, error_msg)
-        await invalidate_cache("cache:heroes:*")
-        await invalidate_cache("cache:heroDetail:*")
+        metrics = {
+            "resumed": resume,
+            "heroes_processed": len(heroes),
+            "heroes_changed": totals["changed"],
+            "heroes_unchanged": totals["unchanged"],
+            "heroes_not_modified": totals["not_modified"],
+            "heroes_saved": totals["heroes_saved"],
+            "abilities_saved": totals["abilities_saved"],
+            "abilities_deleted": totals["abilities_deleted"],
+            "db_time_ms": round(totals["db_time"] * 1000),
+            "cache_keys_invalidated": totals["invalidated"],
+            **progress.summary(),
+        }
+        await progress.finish(status)
+        await _log_sync(supabase, job_name, status, started_at, error_msg, metrics)
 
-        logger.info("영웅 캐시 무효화 완료")
         logger.info(
-            "sync_heroes 완료: 성공 %d, 실패 %d",
-            len(heroes) - len(failed_heroes),
-            len(failed_heroes),
+            "sync_heroes 완료: 변경 %d, 동일 %d, 304 %d, 실패 %d, "
+            "스킬 %d개 저장 / %d개 삭제 (DB %.1fs)",
+            totals["changed"], totals["unchanged"], totals["not_modified"],
+            len(failed_heroes), totals["abilities_saved"], totals["abilities_deleted"],
+            totals["db_time"],
         )
 
     except Exception as e:
         logger.error("sync_heroes 치명적 오류: %s", e)
-        await _log_sync(supabase, "sync_heroes", "failed", started_at, str(e))
+        if progress:
+            await progress.finish("failed")
+        await _log_sync(supabase, job_name, "failed", started_at, str(e))
 
 
-async def sync_hero_stats() -> None:
-    """영웅 통계를 동기화한다. (3시간 1회)"""
+async def sync_hero_stats(resume: bool = False) -> None:
+    """영웅 통계를 동기화한다. (3시간 1회)
+
+    지난 실행과 내용 해시가 같은 조합은 저장하지 않으므로,
+    변경 없는 조합의 synced_at은 마지막으로 내용이 바뀐 시각을 뜻한다.
+
+    조합마다 저장/해시 기록/캐시 무효화를 마치고 체크포인트에 기록한다.
+
+    Args:
+        resume: True면 지난 실행에서 완료하지 못한 조합(중단/실패)만 다시 처리한다
+    """
+    job_name = "sync_hero_stats"
     started_at = datetime.now(UTC)
     supabase = get_supabase()
     synced_at = datetime.now(UTC).isoformat()
 
+    if resume:
+        skipped = await _pending_items(job_name)
+        if skipped is None:
+            return
+    else:
+        skipped = set()
+        await _start_checkpoint(job_name, started_at)
+
+    progress: SyncProgress | None = None
+
     try:
         heroes_result = await supabase.table("heroes").select("key").execute()
         valid_keys: set[str] = {hero["key"] for hero in heroes_result.data}
         logger.info("유효한 영웅 키: %d개", len(valid_keys))
 
-        tasks = _build_stat_tasks()
+        tasks = [task for task in _build_stat_tasks() if _stat_task_label(task) not in skipped]
+        previous = await _load_hashes(STATS_HASHES_KEY)
+        progress = SyncProgress(job_name, len(tasks), resumed=resume)
+        await progress.start()
+
+        new_hashes: dict[str, str] = {}
+        changed_tasks: list[dict] = []
+
+        async def run_task(index: int, task: dict) -> tuple[int, str, float]:
+            label = _stat_task_label(task)
+            item_metrics = start_item_metrics()
+            saved, outcome, db_time, content_hash, validators = await _sync_single_stat_task(
+                supabase, task, valid_keys, synced_at, index, len(tasks),
+                previous.get(label),
+            )
+
+            if content_hash:
+                new_hashes[label] = content_hash
+                changed_tasks.append(task)
+            if validators:
+                _validators[f"stats:{label}"] = validators
+
+            await _mark_items(job_name, [label], "failed" if outcome == "failed" else "done")
+            await progress.item_finished(label, outcome != "failed", item_metrics)
+            return saved, outcome, db_time
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        results = await asyncio.gather(*(
+            _bounded(semaphore, run_task(i + 1, task))
+            for i, task in enumerate(tasks)
+        ))
+        # 해시는 캐시를 지운 뒤에 저장한다 (중간에 죽으면 다음 실행이 변경으로 보고 다시 지운다)
+        invalidated = await _invalidate_stats_caches(changed_tasks)
+        await _save_hashes(STATS_HASHES_KEY, new_hashes)
+        await _finish_checkpoint(job_name)
+
         total_saved = 0
+        total_db_time = 0.0
         failed = 0
+        outcomes = {"changed": 0, "unchanged": 0, "not_modified": 0}
 
-        async with httpx.AsyncClient() as client:
-            for i, task in enumerate(tasks):
-                saved, success = await _sync_single_stat_task(
-                    supabase, client, task, valid_keys, synced_at, i + 1, len(tasks)
-                )
-                total_saved += saved
-                if not success:
-                    failed += 1
-                await asyncio.sleep(BASE_DELAY)
+        for saved, outcome, db_time in results:
+            total_saved += saved
+            total_db_time += db_time
+            if outcome == "failed":
+                failed += 1
+            else:
+                outcomes[outcome] += 1
 
         status = "failed" if failed > 0 else "success"
         error_msg = f"{failed}건 실패" if failed > 0 else None
+        rows_per_sec = total_saved / total_db_time if total_db_time else 0.0
+        metrics = {
+            "resumed": resume,
+            "combinations_processed": len(tasks),
+            "combinations_changed": outcomes["changed"],
+            "combinations_unchanged": outcomes["unchanged"],
+            "combinations_not_modified": outcomes["not_modified"],
+            "rows_saved": total_saved,
+            "db_time_ms": round(total_db_time * 1000),
+            "rows_per_sec": round(rows_per_sec, 1),
+            "failed_tasks": failed,
+            "cache_keys_invalidated": invalidated,
+            **progress.summary(),
+        }
 
-        await _log_sync(supabase, "sync_hero_stats", status, started_at, error_msg)
-        await invalidate_cache("cache:stats:*")
+        await progress.finish(status)
+        await _log_sync(supabase, job_name, status, started_at, error_msg, metrics)
 
-        logger.info("sync_hero_stats 완료: %d건 저장, %d건 실패", total_saved, failed)
-        logger.info("통계 캐시 무효화 완료")
+        logger.info(
+            "sync_hero_stats 완료: 조합 변경 %d / 동일 %d / 304 %d / 실패 %d, "
+            "%d건 저장, DB %.1fs (%.0f rows/sec)",
+            outcomes["changed"], outcomes["unchanged"], outcomes["not_modified"], failed,
+            total_saved, total_db_time, rows_per_sec,
+        )
 
     except Exception as e:
         logger.error("sync_hero_stats 치명적 오류: %s", e)
-        await _log_sync(supabase, "sync_hero_stats", "failed", started_at, str(e))
+        if progress:
+            await progress.finish("failed")
+        await _log_sync(supabase, job_name, "failed", started_at, str(e))
@@ -38,9 +38,14 @@ class MessageResponse(BaseModel):
 
 
 class MessagesResponse(BaseModel):
-    """메시지 목록 응답"""
+    """메시지 목록 응답 (키셋 페이지)"""
+    model_config = ConfigDict(populate_by_name=True)
+
     messages: list[MessageResponse]
     total: int
+    has_more: bool = Field(default=False, serialization_alias="hasMore")
+    before_cursor: str | None = Field(default=None, serialization_alias="beforeCursor")
+    after_cursor: str | None = Field(default=None, serialization_alias="afterCursor")
 
 
 class MigrateMessage(BaseModel):
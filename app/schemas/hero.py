@@ -47,6 +47,12 @@ class HeroDetailResponse(HeroItem):
     synergies: list[HeroItem]
 
 
+class HeroBatchResponse(BaseModel):
+    heroes: list[HeroDetailResponse]
+    total: int
+    missing: list[str] = []
+
+
 class HeroStatItem(HeroItem):
     winrate: float
     pickrate: float
@@ -69,3 +75,27 @@ class StatsResponse(BaseModel):
     filters: StatsFilters
     total: int
     synced_at: str | None = Field(default=None, serialization_alias="syncedAt")
+
+
+class StatsHistoryPoint(BaseModel):
+    timestamp: str
+    winrate: float
+    pickrate: float
+
+
+class StatsHistoryFilters(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    platform: str
+    gamemode: str
+    region: str
+    competitive_division: str = Field(serialization_alias="competitiveDivision")
+
+
+class StatsHistoryResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    hero_key: str = Field(serialization_alias="heroKey")
+    filters: StatsHistoryFilters
+    points: list[StatsHistoryPoint]
+    total: int
@@ -1,9 +1,92 @@
-from uuid import UUID
+import asyncio
+import base64
+import logging
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
 
+from app.ai import load_agent
 from app.config.supabase import get_supabase
-from app.exceptions import NotFoundError
+from app.exceptions import InvalidParameterError, NotFoundError
+from app.services import message_buffer
+from app.utils import metrics
+from app.utils.cache import get_or_set_cache, update_cache
+from app.utils.timing import span
+
+logger = logging.getLogger(__name__)
 
 MAX_CONVERSATIONS = 30
+DEFAULT_TITLE = "새 대화"
+DEFAULT_MESSAGE_LIMIT = 50
+MAX_MESSAGE_LIMIT = 100
+CONVERSATIONS_CACHE_TTL = 6 * 60 * 60
+CONVERSATION_LIST_FIELDS = ("id", "title", "tag", "created_at", "updated_at")
+
+_SUPABASE_READ = {"dependency": "supabase", "operation": "conversation_read"}
+_SUPABASE_WRITE = {"dependency": "supabase", "operation": "conversation_write"}
+
+
+async def _execute(query, labels: dict[str, str]):
+    """
+    Supabase 쿼리를 실행하고 시간을 기록한다.
+
+    dependency_duration_seconds 히스토그램과 요청의 db 구간(Server-Timing)에 함께 더한다.
+    """
+    with metrics.timed("dependency_duration_seconds", labels), span("db"):
+        return await query.execute()
+
+
+def _conversations_cache_key(user_id: UUID) -> str:
+    return f"cache:conversations:{user_id}"
+
+
+def _to_list_item(conversation: dict) -> dict:
+    """채팅방 행을 목록 캐시에 저장하는 형태로 줄인다."""
+    return {field: conversation[field] for field in CONVERSATION_LIST_FIELDS}
+
+
+async def _cache_prepend_conversation(user_id: UUID, conversation: dict) -> None:
+    """새 채팅방을 캐시된 목록 맨 앞에 추가한다."""
+    item = _to_list_item(conversation)
+
+    def prepend(conversations: list[dict]) -> list[dict]:
+        others = [c for c in conversations if c["id"] != item["id"]]
+        return [item, *others][:MAX_CONVERSATIONS]
+
+    await update_cache(_conversations_cache_key(user_id), prepend, CONVERSATIONS_CACHE_TTL)
+
+
+async def _cache_remove_conversation(user_id: UUID, conversation_id: UUID) -> None:
+    """캐시된 목록에서 채팅방을 제거한다."""
+
+    def remove(conversations: list[dict]) -> list[dict] | None:
+        remaining = [c for c in conversations if c["id"] != str(conversation_id)]
+        # 30개가 꽉 찬 목록에서 빠지면 31번째를 알 수 없으므로 다시 조회하게 한다
+        if len(conversations) >= MAX_CONVERSATIONS and len(remaining) < len(conversations):
+            return None
+        return remaining
+
+    await update_cache(_conversations_cache_key(user_id), remove, CONVERSATIONS_CACHE_TTL)
+
+
+async def _cache_touch_conversation(
+    user_id: UUID,
+    conversation_id: UUID,
+    changes: dict,
+) -> None:
+    """캐시된 채팅방에 변경 사항을 반영하고 updated_at이 바뀌면 맨 앞으로 옮긴다."""
+
+    def touch(conversations: list[dict]) -> list[dict] | None:
+        for index, conversation in enumerate(conversations):
+            if conversation["id"] == str(conversation_id):
+                updated = {**conversation, **changes}
+                if "updated_at" not in changes:
+                    return [*conversations[:index], updated, *conversations[index + 1:]]
+                others = conversations[:index] + conversations[index + 1:]
+                return [updated, *others]
+        # 목록 밖(31번째 이후)의 채팅방이 앞으로 올라오는 경우 행 전체를 알 수 없다
+        return None
+
+    await update_cache(_conversations_cache_key(user_id), touch, CONVERSATIONS_CACHE_TTL)
 
 
 async def create_conversation(
@@ -14,75 +97,200 @@ async def create_conversation(
     """새 채팅방을 생성한다."""
     supabase = get_supabase()
 
-    response = await supabase.table("conversations").insert({
+    response = await _execute(supabase.table("conversations").insert({
         "user_id": str(user_id),
         "title": title,
         "tag": tag,
-    }).execute()
+    }), _SUPABASE_WRITE)
 
-    return response.data[0]
+    conversation = response.data[0]
+    await _cache_prepend_conversation(user_id, conversation)
 
+    return conversation
 
-async def get_conversations(user_id: UUID) -> list[dict]:
-    """사용자의 채팅방 목록을 조회한다. (최신순, 최대 30개)"""
+
+async def _fetch_conversations(user_id: UUID) -> list[dict]:
     supabase = get_supabase()
 
-    response = await (
+    response = await _execute(
         supabase.table("conversations")
-        .select("id, title, tag, created_at, updated_at")
+        .select(", ".join(CONVERSATION_LIST_FIELDS))
         .eq("user_id", str(user_id))
         .order("updated_at", desc=True)
-        .limit(MAX_CONVERSATIONS)
-        .execute()
+        .limit(MAX_CONVERSATIONS),
+        _SUPABASE_READ,
     )
 
     return response.data
 
 
+async def get_conversations(user_id: UUID) -> list[dict]:
+    """
+    사용자의 채팅방 목록을 조회한다. (최신순, 최대 30개)
+
+    생성/삭제/메시지 추가 시 캐시를 직접 갱신(write-through)하므로
+    캐시가 만료되기 전까지는 DB를 조회하지 않는다.
+    조회 중에 다른 요청이 목록을 바꾸면 조회 결과는 캐시에 저장하지 않는다. (get_or_set_cache)
+    """
+    return await get_or_set_cache(
+        key=_conversations_cache_key(user_id),
+        fetch_fn=lambda: _fetch_conversations(user_id),
+        ttl=CONVERSATIONS_CACHE_TTL,
+    )
+
+
+def encode_message_cursor(message: dict) -> str:
+    """메시지의 (created_at, id)를 불투명한 커서 문자열로 만든다."""
+    raw = f"{message['created_at']}|{message['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_message_cursor(cursor: str) -> tuple[str, str]:
+    """커서를 (created_at, id)로 복원한다. 필터 문자열에 쓰이므로 형식을 검증한다."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, message_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        datetime.fromisoformat(created_at)
+        UUID(message_id)
+    except ValueError:
+        raise InvalidParameterError("유효하지 않은 커서입니다") from None
+
+    return created_at, message_id
+
+
+def _message_sort_key(message: dict) -> tuple[datetime, str]:
+    return datetime.fromisoformat(message["created_at"]), str(message["id"])
+
+
+def _merge_pending_messages(
+    rows: list[dict],
+    pending: list[dict],
+    cursor: tuple[str, str] | None,
+    newer: bool,
+    size: int,
+) -> list[dict]:
+    """
+    DB 조회 결과에 아직 저장되지 않은 버퍼 메시지를 합친다.
+
+    rows와 같은 키셋 조건/정렬 방향을 적용한 뒤 size개로 자른다.
+    """
+    if not pending:
+        return rows
+
+    if cursor:
+        cursor_key = (datetime.fromisoformat(cursor[0]), cursor[1])
+        pending = [
+            message for message in pending
+            if (_message_sort_key(message) > cursor_key) == newer
+            and _message_sort_key(message) != cursor_key
+        ]
+
+    # 같은 행이 버퍼와 spill 리스트에 잠깐 함께 있을 수 있으므로 id로 한 번만 합친다
+    known_ids = {str(row["id"]) for row in rows}
+    merged = list(rows)
+    for message in pending:
+        if message["id"] not in known_ids:
+            known_ids.add(message["id"])
+            merged.append(message)
+    merged.sort(key=_message_sort_key, reverse=not newer)
+
+    return merged[:size]
+
+
 async def get_conversation_messages(
     user_id: UUID,
     conversation_id: UUID,
-) -> list[dict]:
-    """채팅방의 메시지를 조회한다."""
+    limit: int = DEFAULT_MESSAGE_LIMIT,
+    before: str | None = None,
+    after: str | None = None,
+) -> dict:
+    """
+    채팅방의 메시지를 (created_at, id) 키셋 페이지 단위로 조회한다.
+
+    - 커서가 없으면 최신 메시지 limit개
+    - before: 해당 커서보다 오래된 메시지 limit개 (위로 스크롤)
+    - after: 해당 커서보다 새로운 메시지 limit개
+    - 페이지 안의 메시지는 항상 오래된 순으로 정렬해 반환한다
+
+    Returns:
+        dict: {"messages", "has_more", "before_cursor", "after_cursor"}
+        has_more는 조회 방향(before/기본: 과거, after: 최신)으로 메시지가 더 있는지 여부
+    """
+    if before and after:
+        raise InvalidParameterError("before와 after는 함께 사용할 수 없습니다")
+
     supabase = get_supabase()
 
-    conversation_response = await (
+    # 소유권 확인과 메시지 조회를 한 번의 요청으로 처리한다 (chat_messages 임베딩)
+    query = (
         supabase.table("conversations")
-        .select("id")
+        .select("id, chat_messages(id, role, content, created_at)")
         .eq("id", str(conversation_id))
         .eq("user_id", str(user_id))
-        .execute()
     )
 
-    if not conversation_response.data:
+    cursor = before or after
+    if cursor:
+        created_at, message_id = decode_message_cursor(cursor)
+        op = "lt" if before else "gt"
+        query = query.or_(
+            f'created_at.{op}."{created_at}",'
+            f'and(created_at.eq."{created_at}",id.{op}.{message_id})',
+            reference_table="chat_messages",
+        )
+
+    descending = after is None
+    # 저장 재시도를 기다리는 spill 메시지도 보이도록 DB 조회와 함께 읽는다
+    response, spilled = await asyncio.gather(
+        _execute(
+            query.order("created_at", desc=descending, foreign_table="chat_messages")
+            .order("id", desc=descending, foreign_table="chat_messages")
+            .limit(limit + 1, foreign_table="chat_messages"),
+            _SUPABASE_READ,
+        ),
+        message_buffer.spilled_messages(str(conversation_id)),
+    )
+
+    if not response.data:
         raise NotFoundError("채팅방을 찾을 수 없습니다")
 
-    message_response = await (
-        supabase.table("chat_messages")
-        .select("id, role, content, created_at")
-        .eq("conversation_id", str(conversation_id))
-        .order("created_at", desc=False)
-        .execute()
+    rows = _merge_pending_messages(
+        rows=response.data[0]["chat_messages"],
+        pending=message_buffer.pending_messages(str(conversation_id)) + spilled,
+        cursor=decode_message_cursor(cursor) if cursor else None,
+        newer=after is not None,
+        size=limit + 1,
     )
+    messages = rows[:limit]
+    has_more = len(rows) > limit
+    if descending:
+        messages.reverse()
 
-    return message_response.data
+    return {
+        "messages": messages,
+        "has_more": has_more,
+        "before_cursor": encode_message_cursor(messages[0]) if messages else None,
+        "after_cursor": encode_message_cursor(messages[-1]) if messages else None,
+    }
 
 
 async def delete_conversation(user_id: UUID, conversation_id: UUID) -> bool:
     """채팅방을 삭제한다."""
     supabase = get_supabase()
 
-    response = await (
+    response = await _execute(
         supabase.table("conversations")
         .delete()
         .eq("id", str(conversation_id))
-        .eq("user_id", str(user_id))
-        .execute()
+        .eq("user_id", str(user_id)),
+        _SUPABASE_WRITE,
     )
 
     if not response.data:
         raise NotFoundError("채팅방을 찾을 수 없습니다")
 
+    await _cache_remove_conversation(user_id, conversation_id)
+
     return True
 
 
@@ -90,17 +298,130 @@ async def add_message(
     conversation_id: UUID,
     role: str,
     content: str,
+    user_id: UUID | None = None,
 ) -> dict:
-    """채팅방에 메시지를 추가한다."""
+    """
+    채팅방에 메시지를 추가한다.
+
+    user_id가 주어지면 캐시된 채팅방 목록에서 해당 채팅방을 맨 앞으로 올린다.
+    (DB의 updated_at은 메시지 INSERT 시 트리거로 갱신된다)
+    """
     supabase = get_supabase()
 
-    response = await supabase.table("chat_messages").insert({
+    response = await _execute(supabase.table("chat_messages").insert({
         "conversation_id": str(conversation_id),
         "role": role,
         "content": content,
-    }).execute()
+    }), _SUPABASE_WRITE)
+
+    message = response.data[0]
+    if user_id:
+        await _cache_touch_conversation(
+            user_id, conversation_id, {"updated_at": message["created_at"]}
+        )
+
+    return message
+
+
+def _build_message_rows(conversation_id: UUID, messages: list[dict]) -> list[dict]:
+    """
+    chat_messages 행을 만든다.
+
+    한 INSERT 문 안에서는 now()가 같으므로 created_at을 1µs씩 늘려 순서를 보존한다.
+    """
+    base_time = datetime.now(UTC)
+
+    return [
+        {
+            "id": str(uuid4()),
+            "conversation_id": str(conversation_id),
+            "role": message["role"],
+            "content": message["content"],
+            "created_at": (base_time + timedelta(microseconds=i)).isoformat(),
+        }
+        for i, message in enumerate(messages)
+    ]
+
+
+async def add_messages(
+    conversation_id: UUID,
+    messages: list[dict],
+    user_id: UUID | None = None,
+) -> list[dict]:
+    """
+    채팅방에 여러 메시지를 한 번의 요청으로 추가한다.
+
+    - created_at을 메시지 순서대로 지정해 순서를 보존한다
+    - 단일 INSERT이므로 전부 저장되거나 전부 실패한다
+    - user_id가 주어지면 캐시된 채팅방 목록에서 해당 채팅방을 맨 앞으로 올린다
+
+    Args:
+        messages: [{"role": ..., "content": ...}, ...] (저장 순서대로)
+    """
+    if not messages:
+        return []
+
+    supabase = get_supabase()
+    rows = _build_message_rows(conversation_id, messages)
+
+    response = await _execute(supabase.table("chat_messages").insert(rows), _SUPABASE_WRITE)
+
+    if user_id:
+        await _cache_touch_conversation(
+            user_id, conversation_id, {"updated_at": rows[-1]["created_at"]}
+        )
+
+    return response.data
+
+
+async def queue_messages(
+    conversation_id: UUID,
+    messages: list[dict],
+    user_id: UUID | None = None,
+) -> list[dict]:
+    """
+    메시지를 write-behind 버퍼에 넣는다. (DB 저장은 버퍼가 모아서 처리)
+
+    저장 전에도 get_conversation_messages 결과에는 포함된다.
+    user_id가 주어지면 캐시된 채팅방 목록에서 해당 채팅방을 맨 앞으로 올린다.
+    """
+    rows = _build_message_rows(conversation_id, messages)
+    message_buffer.enqueue_messages(rows)
+
+    if user_id and rows:
+        await _cache_touch_conversation(
+            user_id, conversation_id, {"updated_at": rows[-1]["created_at"]}
+        )
+
+    return rows
+
+
+async def update_conversation_title(
+    user_id: UUID,
+    conversation_id: UUID,
+    title: str,
+) -> dict:
+    """채팅방 제목을 변경한다."""
+    supabase = get_supabase()
+
+    response = await _execute(
+        supabase.table("conversations")
+        .update({"title": title})
+        .eq("id", str(conversation_id))
+        .eq("user_id", str(user_id)),
+        _SUPABASE_WRITE,
+    )
+
+    if not response.data:
+        raise NotFoundError("채팅방을 찾을 수 없습니다")
+
+    conversation = response.data[0]
+    await _cache_touch_conversation(
+        user_id, conversation_id, _to_list_item(conversation)
+    )
+
+    return conversation
 
-    return response.data[0]
 
 def find_first_message_by_role(messages: list[dict], role: str) -> str:
     """특정 역할의 첫 번째 메시지를 찾는다."""
@@ -115,23 +436,60 @@ async def migrate_conversation(
     messages: list[dict],
     tag: str = "general",
 ) -> dict:
-    """비회원 대화를 DB로 마이그레이션"""
-    from app.ai.agent import generate_title
-
+    """
+    비회원 대화를 DB로 마이그레이션
+
+    - 제목 생성(LLM)은 채팅방 생성과 동시에 진행하고, 완료되면 제목을 덮어쓴다
+    - 메시지는 한 번의 bulk INSERT로 저장한다
+    - 메시지 저장에 실패하면 생성한 채팅방을 삭제해 빈 채팅방이 남지 않게 한다
+    - 제목 생성/저장은 실패해도 기본 제목(첫 질문 앞부분)으로 마이그레이션을 완료한다
+    """
     first_user_message = find_first_message_by_role(messages, "user")
     first_assistant_message = find_first_message_by_role(messages, "assistant")
+    fallback_title = first_user_message[:20] if first_user_message else DEFAULT_TITLE
 
+    title_task = None
     if first_user_message and first_assistant_message:
-        title = await generate_title(first_user_message, first_assistant_message)
-    else:
-        title = first_user_message[:20] if first_user_message else "새 대화"
-
-    conversation = await create_conversation(user_id, title, tag)
-    for message in messages:
-        await add_message(
-            conversation_id=conversation["id"],
-            role=message["role"],
-            content=message["content"],
+        agent = await load_agent()
+        title_task = asyncio.create_task(
+            agent.generate_title(first_user_message, first_assistant_message)
         )
 
-    return conversation
+    try:
+        conversation = await create_conversation(user_id, fallback_title, tag)
+    except Exception:
+        if title_task:
+            title_task.cancel()
+        raise
+
+    try:
+        await add_messages(conversation["id"], messages, user_id=user_id)
+    except Exception:
+        if title_task:
+            title_task.cancel()
+        # 보상 삭제가 실패해도 원래 오류(메시지 저장 실패)를 그대로 올린다
+        try:
+            await delete_conversation(user_id, conversation["id"])
+        except Exception:
+            logger.exception("빈 채팅방 삭제 실패 (%s)", conversation["id"])
+        raise
+
+    if title_task is None:
+        return conversation
+
+    try:
+        title = await title_task
+    except Exception as e:
+        logger.warning("대화 제목 생성 실패, 기본 제목 사용: %s", e)
+        return conversation
+
+    if not title or title == fallback_title:
+        return conversation
+
+    # 채팅방과 메시지는 이미 저장됐으므로 제목 갱신 실패로 요청을 실패시키지 않는다
+    # (클라이언트가 재시도하면 같은 대화가 중복 생성된다)
+    try:
+        return await update_conversation_title(user_id, conversation["id"], title)
+    except Exception as e:
+        logger.warning("대화 제목 저장 실패, 기본 제목 유지 (%s): %s", conversation["id"], e)
+        return conversation
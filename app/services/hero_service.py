@@ -1,5 +1,9 @@
 from app.config.supabase import get_supabase
 from app.exceptions import InvalidParameterError, NotFoundError
+from app.utils import metrics
+from app.utils.timing import span
+
+_SUPABASE_READ = {"dependency": "supabase", "operation": "hero_read"}
 
 VALID_ROLES = {"tank", "damage", "support"}
 VALID_ROLE_FILTERS = {"all"} | VALID_ROLES
@@ -33,45 +37,25 @@ async def get_heroes(role: str = "all") -> list[dict]:
     if role != "all":
         query = query.eq("role", role)
 
-    response = await query.execute()
+    with metrics.timed("dependency_duration_seconds", _SUPABASE_READ), span("db"):
+        response = await query.execute()
     return response.data
 
 
-async def get_hero_detail(hero_key: str) -> dict:
-    """영웅 상세 정보를 조회한다."""
-    supabase = get_supabase()
-
-    hero_response = await supabase.table("heroes").select("*").eq("key", hero_key).execute()
-
-    if not hero_response.data:
-        raise NotFoundError("존재하지 않는 영웅입니다")
-
-    hero = hero_response.data[0]
+def _build_hero_detail(hero: dict, abilities: list[dict], related_map: dict[str, dict]) -> dict:
+    """heroes 행, 스킬 행, 관련 영웅(카운터/시너지) 맵으로 상세 응답 데이터를 만든다."""
     health = hero.get("hitpoints_health", 0)
     armor = hero.get("hitpoints_armor", 0)
     shields = hero.get("hitpoints_shields", 0)
 
-    abilities_response = await supabase.table("hero_abilities").select(
-        "name, description, icon, ability_type"
-    ).eq("hero_key", hero_key).execute()
+    abilities_grouped = {"skill": [], "perk_major": [], "perk_minor": []}
 
-    abilities_grouped = {"skill": [], "perk_major": [], "perk_minor": []} 
-
-    for ability in abilities_response.data:
+    for ability in abilities:
         abilities_grouped[ability["ability_type"]].append(ability)
 
     counter_keys = hero.get("counters") or []
     synergy_keys = hero.get("synergies") or []
 
-    related_keys = list(set(counter_keys + synergy_keys))
-    if related_keys:
-        related_response = await supabase.table("heroes").select(
-            "key, name, portrait, role"
-        ).in_("key", related_keys).execute()
-        related_map = {h["key"]: h for h in related_response.data}
-    else:
-        related_map = {}
-
     return {
         "key": hero["key"],
         "name": hero["name"],
@@ -89,6 +73,89 @@ async def get_hero_detail(hero_key: str) -> dict:
     }
 
 
+async def get_hero_detail(hero_key: str) -> dict:
+    """영웅 상세 정보를 조회한다."""
+    supabase = get_supabase()
+
+    with metrics.timed("dependency_duration_seconds", _SUPABASE_READ), span("db"):
+        hero_response = await supabase.table("heroes").select("*").eq("key", hero_key).execute()
+
+    if not hero_response.data:
+        raise NotFoundError("존재하지 않는 영웅입니다")
+
+    hero = hero_response.data[0]
+
+    with metrics.timed("dependency_duration_seconds", _SUPABASE_READ), span("db"):
+        abilities_response = await supabase.table("hero_abilities").select(
+            "name, description, icon, ability_type"
+        ).eq("hero_key", hero_key).execute()
+
+    related_keys = list(set((hero.get("counters") or []) + (hero.get("synergies") or [])))
+    if related_keys:
+        with metrics.timed("dependency_duration_seconds", _SUPABASE_READ), span("db"):
+            related_response = await supabase.table("heroes").select(
+                "key, name, portrait, role"
+            ).in_("key", related_keys).execute()
+        related_map = {h["key"]: h for h in related_response.data}
+    else:
+        related_map = {}
+
+    return _build_hero_detail(hero, abilities_response.data, related_map)
+
+
+async def get_hero_details(hero_keys: list[str]) -> dict[str, dict]:
+    """
+    여러 영웅의 상세 정보를 영웅 수와 관계없이 최대 3번의 쿼리로 조회한다.
+
+    Returns:
+        {영웅 키: 상세 데이터}. 존재하지 않는 영웅은 빠진다
+    """
+    if not hero_keys:
+        return {}
+
+    supabase = get_supabase()
+
+    with metrics.timed("dependency_duration_seconds", _SUPABASE_READ), span("db"):
+        heroes_response = await supabase.table("heroes").select("*").in_(
+            "key", hero_keys
+        ).execute()
+
+    heroes = {hero["key"]: hero for hero in heroes_response.data}
+    if not heroes:
+        return {}
+
+    with metrics.timed("dependency_duration_seconds", _SUPABASE_READ), span("db"):
+        abilities_response = await supabase.table("hero_abilities").select(
+            "hero_key, name, description, icon, ability_type"
+        ).in_("hero_key", list(heroes)).execute()
+
+    abilities: dict[str, list[dict]] = {key: [] for key in heroes}
+    for ability in abilities_response.data:
+        abilities[ability.pop("hero_key")].append(ability)
+
+    # 요청한 영웅 행에 이미 있는 관련 영웅은 다시 조회하지 않는다
+    related_map = {
+        key: {field: hero[field] for field in ("key", "name", "portrait", "role")}
+        for key, hero in heroes.items()
+    }
+    related_keys = {
+        key
+        for hero in heroes.values()
+        for key in (hero.get("counters") or []) + (hero.get("synergies") or [])
+    } - related_map.keys()
+    if related_keys:
+        with metrics.timed("dependency_duration_seconds", _SUPABASE_READ), span("db"):
+            related_response = await supabase.table("heroes").select(
+                "key, name, portrait, role"
+            ).in_("key", sorted(related_keys)).execute()
+        related_map.update((h["key"], h) for h in related_response.data)
+
+    return {
+        key: _build_hero_detail(hero, abilities[key], related_map)
+        for key, hero in heroes.items()
+    }
+
+
 async def get_hero_stats(
     platform: str = "pc",
     gamemode: str = "competitive",
@@ -142,7 +209,8 @@ async def get_hero_stats(
 
     query = query.order(order_field, desc=(order_dir == "desc"))
 
-    response = await query.execute()
+    with metrics.timed("dependency_duration_seconds", _SUPABASE_READ), span("db"):
+        response = await query.execute()
 
     stats = []
     synced_at = None
@@ -0,0 +1,259 @@
+"""
+chat_messages write-behind 버퍼
+
+진행 중인 모든 채팅의 메시지를 모아 일정 주기(또는 일정 개수)마다 bulk INSERT 한다.
+
+- 행의 id/created_at은 적재 시점에 앱에서 정하므로 재시도해도 중복 저장되지 않는다
+- 재시도까지 실패한 행은 Redis 리스트로 옮겨(spill) SPILL_RETRY_INTERVAL마다 별도 태스크에서
+  다시 시도한다. 실패가 반복되는 행이 주기적 flush를 막지 않도록 백오프 없이 한 번만 시도한다
+- 아직 저장되지 않은 행은 pending_messages()로 조회해 읽기 결과에 합친다
+  (프로세스 단위 오버레이이므로 다른 워커에서는 최대 한 주기 늦게 보일 수 있다)
+- spill 리스트의 행은 spilled_messages()로 조회해 모든 워커의 읽기 결과에 합친다
+"""
+
+import asyncio
+import json
+import logging
+
+from app.config.redis import get_redis
+from app.config.supabase import get_supabase
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 0.3
+MAX_BATCH_SIZE = 200
+MAX_FLUSH_RETRIES = 3
+RETRY_BASE_DELAY = 0.5
+SPILL_KEY = "buffer:chat_messages:spill"
+MAX_SPILL_ATTEMPTS = 5
+SPILL_RETRY_INTERVAL = 30.0
+# 읽기 오버레이에서 살펴볼 spill 행 수 (보통은 비어 있다)
+MAX_SPILL_OVERLAY = 1000
+
+_pending: list[dict] = []
+_inflight: list[dict] = []
+_reingesting: list[dict] = []
+_wakeup: asyncio.Event | None = None
+_stopped: asyncio.Event | None = None
+_flush_task: asyncio.Task | None = None
+_reingest_task: asyncio.Task | None = None
+_stopping = False
+
+
+def start_message_buffer() -> None:
+    """앱 시작 시 주기적 flush 태스크와 spill 재시도 태스크를 시작한다."""
+    global _wakeup, _stopped, _flush_task, _reingest_task, _stopping
+    _stopping = False
+    _wakeup = asyncio.Event()
+    _stopped = asyncio.Event()
+    _flush_task = asyncio.create_task(_flush_loop())
+    _reingest_task = asyncio.create_task(_reingest_loop())
+
+
+async def drain_message_buffer() -> None:
+    """
+    앱 종료 시 남은 메시지를 모두 저장한다.
+
+    진행 중인 배치가 취소되어 유실되지 않도록 flush 태스크가 스스로 끝나기를 기다린다.
+    """
+    global _flush_task, _reingest_task, _stopping
+    _stopping = True
+
+    if _flush_task:
+        _wakeup.set()
+        await _flush_task
+        _flush_task = None
+
+    if _reingest_task:
+        _stopped.set()
+        await _reingest_task
+        _reingest_task = None
+
+    await _flush()
+    logger.info("메시지 버퍼 비움 완료")
+
+
+def enqueue_messages(rows: list[dict]) -> None:
+    """
+    저장할 메시지 행을 버퍼에 넣는다.
+
+    Args:
+        rows: id, conversation_id, role, content, created_at이 채워진 chat_messages 행
+    """
+    _pending.extend(rows)
+    if _wakeup and len(_pending) >= MAX_BATCH_SIZE:
+        _wakeup.set()
+
+
+def _to_message(row: dict) -> dict:
+    return {
+        "id": row["id"],
+        "role": row["role"],
+        "content": row["content"],
+        "created_at": row["created_at"],
+    }
+
+
+def pending_messages(conversation_id: str) -> list[dict]:
+    """이 프로세스에서 아직 DB에 반영되지 않았을 수 있는 채팅방 메시지를 반환한다."""
+    return [
+        _to_message(row)
+        for row in (*_reingesting, *_inflight, *_pending)
+        if row["conversation_id"] == conversation_id
+    ]
+
+
+async def spilled_messages(conversation_id: str) -> list[dict]:
+    """spill 리스트에서 재시도를 기다리는 채팅방 메시지를 반환한다. Redis 오류 시 빈 목록."""
+    try:
+        payloads = await get_redis().lrange(SPILL_KEY, 0, MAX_SPILL_OVERLAY - 1)
+    except Exception as e:
+        logger.warning("spill 리스트 조회 실패: %s", e)
+        return []
+
+    rows = (json.loads(payload) for payload in payloads)
+    return [_to_message(row) for row in rows if row["conversation_id"] == conversation_id]
+
+
+async def _flush_loop() -> None:
+    while not _stopping:
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=FLUSH_INTERVAL)
+        except TimeoutError:
+            pass
+        _wakeup.clear()
+
+        try:
+            await _flush()
+        except Exception:
+            logger.exception("메시지 버퍼 flush 실패")
+
+
+async def _reingest_loop() -> None:
+    while not _stopping:
+        try:
+            await asyncio.wait_for(_stopped.wait(), timeout=SPILL_RETRY_INTERVAL)
+        except TimeoutError:
+            pass
+        if _stopping:
+            return
+
+        try:
+            await _reingest_spilled()
+        except Exception:
+            logger.exception("spill 메시지 재저장 실패")
+
+
+async def _flush() -> None:
+    """버퍼의 메시지를 MAX_BATCH_SIZE 단위로 저장한다."""
+    while _pending:
+        batch = _pending[:MAX_BATCH_SIZE]
+        del _pending[:MAX_BATCH_SIZE]
+        _inflight.extend(batch)
+
+        try:
+            failed = await _insert_batch(batch)
+            if failed:
+                await _spill(failed)
+        finally:
+            del _inflight[:len(batch)]
+
+
+async def _insert(rows: list[dict]) -> None:
+    supabase = get_supabase()
+    await supabase.table("chat_messages").upsert(
+        rows, on_conflict="id", ignore_duplicates=True
+    ).execute()
+
+
+async def _insert_batch(rows: list[dict], retries: int = MAX_FLUSH_RETRIES) -> list[dict]:
+    """
+    지수 백오프로 최대 retries번 시도하며 저장한다.
+
+    끝까지 실패하면 한 채팅방의 문제(삭제된 채팅방 등)가 배치 전체를 막지 않도록
+    채팅방별로 나눠 한 번 더 시도한다.
+
+    Returns:
+        저장하지 못한 행 목록
+    """
+    for attempt in range(retries):
+        try:
+            await _insert(rows)
+            return []
+        except Exception as e:
+            logger.warning(
+                "메시지 %d건 저장 실패 (%d/%d): %s", len(rows), attempt + 1, retries, e
+            )
+            if attempt < retries - 1:
+                await asyncio.sleep(RETRY_BASE_DELAY * 2 ** attempt)
+
+    by_conversation: dict[str, list[dict]] = {}
+    for row in rows:
+        by_conversation.setdefault(row["conversation_id"], []).append(row)
+
+    failed: list[dict] = []
+    for conversation_rows in by_conversation.values():
+        try:
+            await _insert(conversation_rows)
+        except Exception:
+            failed.extend(conversation_rows)
+    return failed
+
+
+async def _spill(rows: list[dict]) -> None:
+    """저장에 실패한 행을 Redis 리스트로 옮긴다. 시도 횟수를 넘긴 행은 버린다."""
+    redis = get_redis()
+    payloads = []
+
+    for row in rows:
+        attempts = row.get("_attempts", 0) + 1
+        if attempts > MAX_SPILL_ATTEMPTS:
+            logger.error(
+                "메시지 저장 포기 (conversation_id=%s, id=%s)", row["conversation_id"], row["id"]
+            )
+            continue
+        payloads.append(json.dumps({**row, "_attempts": attempts}, ensure_ascii=False))
+
+    if not payloads:
+        return
+
+    try:
+        await redis.rpush(SPILL_KEY, *payloads)
+        logger.warning("메시지 %d건을 spill 리스트로 이동", len(payloads))
+    except Exception:
+        logger.exception("메시지 %d건 spill 실패 - 유실됨", len(payloads))
+
+
+async def _reingest_spilled() -> None:
+    """
+    spill 리스트의 행을 한 배치만큼 꺼내 다시 저장을 시도한다.
+
+    이미 백오프 재시도와 채팅방별 시도까지 실패한 행이므로 백오프 없이 한 번만 시도한다.
+    꺼낸 행은 저장이 끝날 때까지 pending_messages()에 포함된다.
+    """
+    redis = get_redis()
+
+    try:
+        payloads = await redis.lpop(SPILL_KEY, MAX_BATCH_SIZE)
+    except Exception:
+        logger.exception("spill 리스트 조회 실패")
+        return
+
+    if not payloads:
+        return
+
+    rows = [json.loads(payload) for payload in payloads]
+    _reingesting.extend(rows)
+    try:
+        failed = await _insert_batch(
+            [{k: v for k, v in row.items() if k != "_attempts"} for row in rows],
+            retries=1,
+        )
+
+        if failed:
+            attempts = {row["id"]: row["_attempts"] for row in rows}
+            await _spill([{**row, "_attempts": attempts[row["id"]]} for row in failed])
+    finally:
+        del _reingesting[:len(rows)]
+
+    logger.info("spill 메시지 재저장: 성공 %d, 실패 %d", len(rows) - len(failed), len(failed))
@@ -1,72 +1,204 @@
+import asyncio
+import logging
+import time
+from urllib.parse import urlencode
+
 import httpx
 
-OVERFAST_BASE_URL = "https://overfast-api.tekrop.fr"
+from app.config.settings import settings
+from app.utils.item_metrics import record_item_metric
+from app.utils.rate_limiter import TokenBucket
 
+logger = logging.getLogger(__name__)
 
-async def fetch_heroes(
-    locale: str | None = None,
-    client: httpx.AsyncClient | None = None,
-) -> list[dict]:
+# 앱 전체가 공유하는 커넥션 풀. HTTP/2로 한 연결에서 여러 요청을 동시에 보낸다
+OVERFAST_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=60.0)
+OVERFAST_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=5,
+    keepalive_expiry=120.0,
+)
+MAX_RETRIES = 5
+
+# Overfast 호출 전체가 공유하는 속도 제한 (초당 요청 수)
+OVERFAST_RATE = 0.5
+OVERFAST_BURST = 2
+OVERFAST_MIN_RATE = 0.05
+OVERFAST_MAX_RATE = 2.0
+OVERFAST_RATE_STEP = 0.05
+
+overfast_limiter = TokenBucket(
+    rate=OVERFAST_RATE,
+    capacity=OVERFAST_BURST,
+    min_rate=OVERFAST_MIN_RATE,
+    max_rate=OVERFAST_MAX_RATE,
+    increase_step=OVERFAST_RATE_STEP,
+)
+
+
+_client: httpx.AsyncClient | None = None
+
+
+class NotModifiedError(Exception):
+    """조건부 요청에 304 Not Modified가 반환됨 (마지막 조회 이후 변경 없음)"""
+
+
+async def init_overfast_client() -> None:
+    """앱 시작 시 Overfast 클라이언트를 초기화한다."""
+    global _client
+    _client = httpx.AsyncClient(
+        base_url=settings.overfast_base_url,
+        http2=True,
+        limits=OVERFAST_LIMITS,
+        timeout=OVERFAST_TIMEOUT,
+        headers={"Accept": "application/json"},
+    )
+
+
+def get_overfast_client() -> httpx.AsyncClient:
+    """초기화된 Overfast 클라이언트를 반환한다."""
+    return _client
+
+
+async def close_overfast_client() -> None:
+    """앱 종료 시 커넥션 풀을 닫는다."""
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 단위)를 해석한다. 날짜 형식 등은 무시한다."""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+async def _send(path: str, params: dict[str, str], headers: dict[str, str]) -> httpx.Response:
+    """
+    공유 토큰 버킷으로 호출 속도를 맞춰 요청하고, 일시적인 실패는 재시도한다.
+
+    - 429: 버킷 속도를 절반으로 줄이고 Retry-After 동안 모든 Overfast 호출을 멈춘다
+    - 5xx / 연결 오류 / 타임아웃: 지수 백오프 후 재시도
+    - 그 외 응답(304, 4xx 포함)은 그대로 반환한다
+
+    요청 시간, 재시도/429 횟수, 속도 제한·백오프 대기 시간은 항목 지표(item_metrics)에 기록한다.
+    """
+    client = get_overfast_client()
+
+    for attempt in range(MAX_RETRIES):
+        waited = await overfast_limiter.acquire()
+        record_item_metric("rate_wait_ms", waited * 1000)
+        if attempt:
+            record_item_metric("retries")
+
+        is_last = attempt == MAX_RETRIES - 1
+        backoff = 2 ** (attempt + 2)
+
+        started = time.perf_counter()
+        try:
+            response = await client.get(path, params=params, headers=headers)
+        except httpx.TransportError as e:
+            if is_last:
+                raise
+            logger.warning(
+                "%s 요청 실패 (%s) - %d초 대기 후 재시도 (%d/%d)",
+                path, type(e).__name__, backoff, attempt + 1, MAX_RETRIES,
+            )
+            record_item_metric("backoff_ms", backoff * 1000)
+            await asyncio.sleep(backoff)
+            continue
+        finally:
+            record_item_metric("overfast_ms", (time.perf_counter() - started) * 1000)
+            record_item_metric("requests")
+
+        status = response.status_code
+        if status == 429:
+            record_item_metric("throttled")
+        if status == 429 and not is_last:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            overfast_limiter.on_throttled(retry_after or backoff)
+            logger.warning(
+                "429 응답 - %.1f초 정지, 속도 %.2f req/s로 조정 후 재시도 (%d/%d)",
+                retry_after or backoff, overfast_limiter.rate, attempt + 1, MAX_RETRIES,
+            )
+            continue
+        if status >= 500 and not is_last:
+            logger.warning(
+                "%d 응답 - %d초 대기 후 재시도 (%d/%d)",
+                status, backoff, attempt + 1, MAX_RETRIES,
+            )
+            record_item_metric("backoff_ms", backoff * 1000)
+            await asyncio.sleep(backoff)
+            continue
+
+        if status < 400:
+            overfast_limiter.on_success()
+        return response
+
+
+async def _request_json(
+    path: str,
+    params: dict[str, str],
+    validators: dict[str, str] | None = None,
+) -> tuple[object, dict[str, str]]:
+    """Overfast API에 GET 요청을 보내고 JSON과 응답의 검증자를 반환한다.
+    validators가 있으면 그 ETag/Last-Modified로 조건부 요청을 보낸다.
+    Returns:
+        (JSON, 다음 조건부 요청에 쓸 If-None-Match / If-Modified-Since 헤더)
+    Raises:
+        NotModifiedError: 조건부 요청에 304가 반환된 경우
+        httpx.HTTPStatusError: 재시도 후에도 4xx/5xx 응답
+        httpx.TransportError: 재시도 후에도 연결 실패
+    """
+    response = await _send(path, params, validators or {})
+
+    if response.status_code == 304:
+        raise NotModifiedError(f"{path}?{urlencode(sorted(params.items()))}")
+    response.raise_for_status()
+
+    new_validators = {}
+    if etag := response.headers.get("ETag"):
+        new_validators["If-None-Match"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        new_validators["If-Modified-Since"] = last_modified
+
+    return response.json(), new_validators
+
+
+async def fetch_heroes(locale: str | None = None) -> list[dict]:
     """Overfast API에서 영웅 목록을 가져온다.
     Args:
     locale: 예시 ) "ko-kr" / "en-u", None이면 API 기본 값 영어를 사용한다.
-    client: 재사용할 httpx 클라이언트. None이면 내부에서 생성
     """
     params: dict[str, str] = {}
     if locale:
         params["locale"] = locale
 
-    if client:
-        response = await client.get(
-            f"{OVERFAST_BASE_URL}/heroes",
-            params=params,
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
-
-    async with httpx.AsyncClient() as new_client:
-        response = await new_client.get(
-            f"{OVERFAST_BASE_URL}/heroes",
-            params=params,
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
+    heroes, _ = await _request_json("/heroes", params)
+    return heroes
 
 
 async def fetch_hero_detail(
     hero_key: str,
     locale: str | None = None,
-    client: httpx.AsyncClient | None = None,
-) -> dict:
+    validators: dict[str, str] | None = None,
+) -> tuple[dict, dict[str, str]]:
     """Overfast API에서 특정 영웅의 상세 정보를 가져온다.
     Args:
     hero_key: 영웅 고유 키 예시 ) "ana" / "doomfist"
     locale: 예시 ) "ko-kr" , "en-us" None이면 API 기본 값 영어를 사용한다.
-    client: 재사용할 httpx 클라이언트. None이면 내부에서 생성
+    validators: 지난 응답의 검증자. 있으면 조건부 요청을 보내고, 변경이 없으면 NotModifiedError
+    Returns:
+        (상세 정보, 새 검증자). 검증자는 내용을 저장한 뒤에 다음 요청에 넘긴다
     """
     params: dict[str, str] = {}
     if locale:
         params["locale"] = locale
 
-    if client:
-        response = await client.get(
-            f"{OVERFAST_BASE_URL}/heroes/{hero_key}",
-            params=params,
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
-
-    async with httpx.AsyncClient() as new_client:
-        response = await new_client.get(
-            f"{OVERFAST_BASE_URL}/heroes/{hero_key}",
-            params=params,
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
+    return await _request_json(f"/heroes/{hero_key}", params, validators)
 
 
 async def fetch_hero_stats(
@@ -74,15 +206,17 @@ async def fetch_hero_stats(
     gamemode: str = "competitive",
     region: str = "asia",
     competitive_division: str | None = None,
-    client: httpx.AsyncClient | None = None,
-) -> list[dict]:
+    validators: dict[str, str] | None = None,
+) -> tuple[list[dict], dict[str, str]]:
     """Overfast API에서 영웅 통계를 가져온다.
     Args:
         platform: "pc" | "console"
         gamemode: "competitive" | "quickplay"
         region: "asia" | "europe" | "americas"
         competitive_division: "bronze" ~ "grandmaster", None이면 전체 통합
-        client: 재사용할 httpx 클라이언트. None이면 내부에서 생성
+        validators: 지난 응답의 검증자. 있으면 조건부 요청을 보내고, 변경이 없으면 NotModifiedError
+    Returns:
+        (통계 목록, 새 검증자). 검증자는 내용을 저장한 뒤에 다음 요청에 넘긴다
     """
     params: dict[str, str] = {
         "platform": platform,
@@ -92,20 +226,4 @@ async def fetch_hero_stats(
     if competitive_division:
         params["competitive_division"] = competitive_division
 
-    if client:
-        response = await client.get(
-            f"{OVERFAST_BASE_URL}/heroes/stats",
-            params=params,
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
-
-    async with httpx.AsyncClient() as new_client:
-        response = await new_client.get(
-            f"{OVERFAST_BASE_URL}/heroes/stats",
-            params=params,
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
+    return await _request_json("/heroes/stats", params, validators)
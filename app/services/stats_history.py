@@ -0,0 +1,278 @@
+"""
+영웅 통계 추이 (hero_stats_history)
+
+(영웅, 플랫폼, 게임모드, 지역, 티어)마다 한 행에 시계열 전체를 jsonb로 저장한다.
+
+- 열 단위 배열 + 델타 인코딩: {"t": [t0, Δt...], "w": [w0, Δw...], "p": [p0, Δp...]}
+  (t는 epoch 초, w/p는 승률/픽률 × VALUE_SCALE 정수)
+- DAILY_AFTER_DAYS일이 지난 지점은 하루 평균 한 점으로 줄이고, RETENTION_DAYS일이 지나면 버린다
+- 조회는 프로세스 메모리에 디코딩해 둔 시계열에서 이분 탐색으로 범위를 자른다
+- 지점은 통계가 바뀐 동기화에서만 추가되므로(변경 지점), 조회 범위 시작 이전의 마지막 값을
+  범위 시작 시각의 지점으로 이어 붙인다
+"""
+
+import time
+from bisect import bisect_left, bisect_right
+from datetime import UTC, datetime
+
+from cachetools import TTLCache
+
+from app.config.supabase import get_supabase
+from app.exceptions import InvalidParameterError, NotFoundError
+from app.services.hero_service import (
+    VALID_DIVISIONS,
+    VALID_GAMEMODES,
+    VALID_PLATFORMS,
+    VALID_REGIONS,
+)
+
+VALUE_SCALE = 100
+DAY_SECONDS = 86400
+DAILY_AFTER_DAYS = 7
+RETENTION_DAYS = 180
+SERIES_CACHE_TTL = 600
+SERIES_CACHE_SIZE = 2048
+HISTORY_CONFLICT_COLUMNS = "hero_key,platform,gamemode,region,competitive_division"
+
+# (hero_key, platform, gamemode, region, division) → (시각 목록, 승률 목록, 픽률 목록)
+_series_cache: TTLCache = TTLCache(maxsize=SERIES_CACHE_SIZE, ttl=SERIES_CACHE_TTL)
+
+
+def _delta_encode(values: list[int]) -> list[int]:
+    return [value - prev for prev, value in zip([0, *values], values, strict=False)]
+
+
+def _delta_decode(deltas: list[int]) -> list[int]:
+    values: list[int] = []
+    total = 0
+    for delta in deltas:
+        total += delta
+        values.append(total)
+    return values
+
+
+def encode_series(points: list[tuple[int, float, float]]) -> dict:
+    """[(epoch 초, 승률, 픽률)] 목록을 델타 인코딩한 열 배열로 만든다."""
+    return {
+        "t": _delta_encode([t for t, _, _ in points]),
+        "w": _delta_encode([round(w * VALUE_SCALE) for _, w, _ in points]),
+        "p": _delta_encode([round(p * VALUE_SCALE) for _, _, p in points]),
+    }
+
+
+def decode_series(series: dict | None) -> list[tuple[int, float, float]]:
+    """encode_series의 역변환"""
+    if not series:
+        return []
+    return list(zip(
+        _delta_decode(series["t"]),
+        (w / VALUE_SCALE for w in _delta_decode(series["w"])),
+        (p / VALUE_SCALE for p in _delta_decode(series["p"])),
+        strict=True,
+    ))
+
+
+def downsample(points: list[tuple[int, float, float]], now: int) -> list[tuple[int, float, float]]:
+    """
+    DAILY_AFTER_DAYS일 이전 지점은 UTC 기준 하루 평균 한 점(그날 0시)으로 합치고,
+    RETENTION_DAYS일 이전 지점은 버린다.
+    """
+    daily_before = (now - DAILY_AFTER_DAYS * DAY_SECONDS) // DAY_SECONDS * DAY_SECONDS
+    retain_after = now - RETENTION_DAYS * DAY_SECONDS
+
+    days: dict[int, list[tuple[float, float]]] = {}
+    recent: list[tuple[int, float, float]] = []
+
+    for t, w, p in points:
+        if t < retain_after:
+            continue
+        if t < daily_before:
+            days.setdefault(t // DAY_SECONDS * DAY_SECONDS, []).append((w, p))
+        else:
+            recent.append((t, w, p))
+
+    daily = [
+        (
+            day,
+            round(sum(w for w, _ in values) / len(values), 2),
+            round(sum(p for _, p in values) / len(values), 2),
+        )
+        for day, values in sorted(days.items())
+    ]
+    return daily + recent
+
+
+async def append_snapshots(
+    supabase,
+    platform: str,
+    gamemode: str,
+    region: str,
+    division: str,
+    rows: list[dict],
+    taken_at: datetime,
+) -> int:
+    """
+    통계 조합 1건의 스냅숏을 영웅별 시계열에 추가한다. (조회 1번 + bulk upsert 1번)
+
+    같은 시각 이후의 지점은 새 값으로 바꾸므로 같은 실행을 재시도해도 중복되지 않는다.
+
+    Args:
+        rows: hero_key, winrate, pickrate가 있는 hero_stats 행
+        taken_at: 스냅숏 시각 (동기화 시각)
+
+    Returns:
+        갱신한 시계열 수
+    """
+    rows = [row for row in rows if row["winrate"] is not None and row["pickrate"] is not None]
+    if not rows:
+        return 0
+
+    existing = await (
+        supabase.table("hero_stats_history")
+        .select("hero_key, series")
+        .eq("platform", platform)
+        .eq("gamemode", gamemode)
+        .eq("region", region)
+        .eq("competitive_division", division)
+        .in_("hero_key", [row["hero_key"] for row in rows])
+        .execute()
+    )
+    series_by_hero = {item["hero_key"]: item["series"] for item in existing.data}
+
+    now = int(taken_at.timestamp())
+    updated_at = taken_at.isoformat()
+    history_rows = []
+
+    for row in rows:
+        points = [
+            point for point in decode_series(series_by_hero.get(row["hero_key"]))
+            if point[0] < now
+        ]
+        points.append((now, row["winrate"], row["pickrate"]))
+        history_rows.append({
+            "hero_key": row["hero_key"],
+            "platform": platform,
+            "gamemode": gamemode,
+            "region": region,
+            "competitive_division": division,
+            "series": encode_series(downsample(points, now)),
+            "updated_at": updated_at,
+        })
+        _series_cache.pop((row["hero_key"], platform, gamemode, region, division), None)
+
+    await supabase.table("hero_stats_history").upsert(
+        history_rows, on_conflict=HISTORY_CONFLICT_COLUMNS
+    ).execute()
+    return len(history_rows)
+
+
+async def _load_series(cache_key: tuple) -> tuple[list[int], list[float], list[float]]:
+    """
+    디코딩한 시계열을 메모리에서 꺼내고, 없거나 오래됐으면 DB에서 한 행을 읽는다.
+
+    Raises:
+        NotFoundError: 시계열이 없고 heroes에도 없는 영웅 키 (캐시에 남기지 않는다)
+    """
+    cached = _series_cache.get(cache_key)
+    if cached:
+        return cached
+
+    hero_key, platform, gamemode, region, division = cache_key
+    supabase = get_supabase()
+    response = await (
+        supabase.table("hero_stats_history")
+        .select("series")
+        .eq("hero_key", hero_key)
+        .eq("platform", platform)
+        .eq("gamemode", gamemode)
+        .eq("region", region)
+        .eq("competitive_division", division)
+        .execute()
+    )
+
+    if not response.data:
+        hero_response = await (
+            supabase.table("heroes").select("key").eq("key", hero_key).execute()
+        )
+        if not hero_response.data:
+            raise NotFoundError("존재하지 않는 영웅입니다")
+
+    points = decode_series(response.data[0]["series"] if response.data else None)
+    timestamps = [t for t, _, _ in points]
+    winrates = [w for _, w, _ in points]
+    pickrates = [p for _, _, p in points]
+
+    _series_cache[cache_key] = (timestamps, winrates, pickrates)
+    return timestamps, winrates, pickrates
+
+
+async def get_hero_stats_history(
+    hero_key: str,
+    platform: str = "pc",
+    gamemode: str = "competitive",
+    region: str = "asia",
+    competitive_division: str = "all",
+    days: int = 30,
+) -> dict:
+    """
+    영웅 통계 추이를 조회한다. (최근 days일)
+
+    지점은 통계가 바뀐 시각에만 있으므로, 범위 시작 이전의 마지막 값이 있으면
+    범위 시작 시각의 첫 지점으로 이어 붙인다. (변화가 없던 영웅도 빈 추이가 되지 않도록)
+
+    Raises:
+        InvalidParameterError: 필터 값이 유효하지 않음
+        NotFoundError: 존재하지 않는 영웅
+    """
+    if platform not in VALID_PLATFORMS:
+        raise InvalidParameterError(
+            f"유효하지 않은 플랫폼입니다. {', '.join(VALID_PLATFORMS)} 중 하나를 입력하세요."
+        )
+    if gamemode not in VALID_GAMEMODES:
+        raise InvalidParameterError(
+            f"유효하지 않은 게임모드입니다. {', '.join(VALID_GAMEMODES)} 중 하나를 입력하세요."
+        )
+    if region not in VALID_REGIONS:
+        raise InvalidParameterError(
+            f"유효하지 않은 지역입니다. {', '.join(VALID_REGIONS)} 중 하나를 입력하세요."
+        )
+    if competitive_division not in VALID_DIVISIONS:
+        raise InvalidParameterError(
+            f"유효하지 않은 티어입니다. {', '.join(VALID_DIVISIONS)} 중 하나를 입력하세요."
+        )
+
+    timestamps, winrates, pickrates = await _load_series(
+        (hero_key, platform, gamemode, region, competitive_division)
+    )
+
+    now = int(time.time())
+    since = now - days * DAY_SECONDS
+    start = bisect_left(timestamps, since)
+    end = bisect_right(timestamps, now)
+
+    points = [
+        {
+            "timestamp": datetime.fromtimestamp(timestamps[i], UTC).isoformat(),
+            "winrate": winrates[i],
+            "pickrate": pickrates[i],
+        }
+        for i in range(start, end)
+    ]
+    if start > 0 and (start == len(timestamps) or timestamps[start] > since):
+        points.insert(0, {
+            "timestamp": datetime.fromtimestamp(since, UTC).isoformat(),
+            "winrate": winrates[start - 1],
+            "pickrate": pickrates[start - 1],
+        })
+
+    return {
+        "hero_key": hero_key,
+        "filters": {
+            "platform": platform,
+            "gamemode": gamemode,
+            "region": region,
+            "competitive_division": competitive_division,
+        },
+        "points": points,
+        "total": len(points),
+    }
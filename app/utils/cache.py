@@ -1,8 +1,53 @@
-import json
-from collections.abc import Callable
+import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from app.config.redis import get_redis
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.config.redis import get_redis, get_redis_binary
+from app.utils import metrics, serializer, timing
+from app.utils.compression import (
+    AVAILABLE_ENCODINGS,
+    MIN_COMPRESS_SIZE,
+    STATIC_LEVELS,
+    choose_encoding,
+    compress,
+)
+
+logger = logging.getLogger(__name__)
+
+SCAN_BATCH_SIZE = 500
+
+# 채운 뒤 쓰기 경합 방지: 조회 시작 때 본 버전이 그대로일 때만 저장한다
+_SET_IF_VERSION_SCRIPT = """
+if (redis.call('get', KEYS[2]) or '') == ARGV[1] then
+    redis.call('set', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+_REDIS_READ = {"dependency": "redis", "operation": "cache_read"}
+_REDIS_WRITE = {"dependency": "redis", "operation": "cache_write"}
+
+
+def _key_prefix(key: str) -> str:
+    """메트릭 라벨용 키 접두사. "cache:heroDetail:ana" → "heroDetail" """
+    parts = key.split(":", 2)
+    return parts[1] if parts[0] == "cache" and len(parts) > 1 else parts[0]
+
+
+def _version_key(key: str) -> str:
+    """update_cache가 쓸 때마다 올리는 버전 키 (get_or_set_cache의 늦은 저장을 막는다)"""
+    return f"{key}:version"
+
+
+def _record_lookup(key: str, hit: bool) -> None:
+    metrics.increment(
+        "cache_requests_total",
+        labels={"prefix": _key_prefix(key), "result": "hit" if hit else "miss"},
+    )
 
 
 async def get_or_set_cache(
@@ -13,6 +58,9 @@ async def get_or_set_cache(
     """
     캐시 조회 후 없으면 fetch_fn 실행하여 저장
 
+    조회하는 동안 update_cache가 같은 키에 쓰면(버전 증가) 조회 결과가 그 변경을 놓쳤을 수
+    있으므로 저장하지 않는다. 다음 조회가 다시 DB에서 채운다.
+
     Args:
         key: Redis 키
         fetch_fn: 데이터 조회 함수 (async)
@@ -23,21 +71,177 @@ async def get_or_set_cache(
     """
     redis = get_redis()
 
-    cached = await redis.get(key)
+    with metrics.timed("dependency_duration_seconds", _REDIS_READ), timing.span("cache_read"):
+        cached, version = await redis.mget(key, _version_key(key))
+    _record_lookup(key, bool(cached))
     if cached:
-        return json.loads(cached)
+        return serializer.loads(cached)
 
-    data = await fetch_fn()
+    with metrics.timed("cache_fill_duration_seconds", {"prefix": _key_prefix(key)}):
+        data = await fetch_fn()
 
-    await redis.set(key, json.dumps(data), ex=ttl)
+    with metrics.timed("dependency_duration_seconds", _REDIS_WRITE), timing.span("cache_write"):
+        stored = await redis.eval(
+            _SET_IF_VERSION_SCRIPT, 2, key, _version_key(key),
+            version or "", serializer.dumps(data), ttl,
+        )
+    if not stored:
+        logger.info("조회 중 캐시가 갱신되어 저장하지 않음 (%s)", key)
 
     return data
 
 
+def _json_response(body: bytes, encoding: str | None = None) -> Response:
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _response_variants(key: str, body: bytes) -> dict[str, bytes]:
+    """get_or_set_response_cache가 key에 저장하는 값들 (JSON 원본 + 충분히 크면 압축본)"""
+    variants = {f"{key}:json": body}
+    if len(body) >= MIN_COMPRESS_SIZE:
+        for available in AVAILABLE_ENCODINGS:
+            variants[f"{key}:{available}"] = compress(body, available, static=True)
+    return variants
+
+
+async def get_or_set_response_cache(
+    key: str,
+    fetch_fn: Callable,
+    ttl: int,
+    response_model: type[BaseModel],
+    accept_encoding: str | None,
+) -> Response:
+    """
+    직렬화된 응답 본문과 압축본을 함께 캐시하고, 클라이언트에 맞는 본문을 바로 반환한다.
+
+    - {key}:json 에 response_model로 직렬화한 JSON, {key}:{encoding} 에 압축본을 저장한다
+    - 캐시 히트 시 압축본을 그대로 내려보내므로 요청마다 다시 압축하지 않는다
+    - 압축본이 없으면(작은 응답 등) JSON 원본을 반환한다
+
+    Args:
+        key: Redis 키 접두사 ("cache:heroDetail:ana" 등)
+        fetch_fn: 데이터 조회 함수 (async)
+        ttl: 캐시 유효 시간 (초)
+        response_model: 응답 스키마 (by_alias 직렬화에 사용)
+        accept_encoding: 요청의 Accept-Encoding 헤더
+    """
+    redis = get_redis_binary()
+    encoding = choose_encoding(accept_encoding)
+    json_key = f"{key}:json"
+
+    with metrics.timed("dependency_duration_seconds", _REDIS_READ), timing.span("cache_read"):
+        if encoding:
+            compressed, body = await redis.mget(f"{key}:{encoding}", json_key)
+        else:
+            compressed, body = None, await redis.get(json_key)
+    _record_lookup(key, bool(compressed or body))
+
+    if compressed:
+        return _json_response(compressed, encoding)
+    if body:
+        return _json_response(body)
+
+    with metrics.timed("cache_fill_duration_seconds", {"prefix": _key_prefix(key)}):
+        data = await fetch_fn()
+    body = response_model.model_validate(data).model_dump_json(by_alias=True).encode()
+    variants = _response_variants(key, body)
+
+    pipe = redis.pipeline(transaction=False)
+    for variant_key, value in variants.items():
+        pipe.set(variant_key, value, ex=ttl)
+    with metrics.timed("dependency_duration_seconds", _REDIS_WRITE), timing.span("cache_write"):
+        await pipe.execute()
+
+    if encoding and f"{key}:{encoding}" in variants:
+        return _json_response(variants[f"{key}:{encoding}"], encoding)
+    return _json_response(body)
+
+
+async def get_or_set_response_bodies(
+    keys: dict[str, str],
+    fetch_fn: Callable[[list[str]], Awaitable[dict[str, Any]]],
+    ttl: int,
+    response_model: type[BaseModel],
+) -> dict[str, bytes]:
+    """
+    get_or_set_response_cache와 같은 키에 캐시된 JSON 본문을 여러 개 한 번에 가져온다.
+
+    - {key}:json 들을 MGET 한 번으로 읽고, 없는 것만 fetch_fn 한 번으로 조회한다
+    - 새로 조회한 항목은 압축본까지 파이프라인 한 번으로 저장하므로 단건 조회도 캐시를 함께 쓴다
+
+    Args:
+        keys: {항목 ID: Redis 키 접두사} (예: {"ana": "cache:heroDetail:ana"})
+        fetch_fn: 캐시에 없는 항목 ID 목록을 받아 {항목 ID: 데이터}를 반환하는 함수 (async)
+        ttl: 캐시 유효 시간 (초)
+        response_model: 항목 하나의 응답 스키마 (by_alias 직렬화에 사용)
+
+    Returns:
+        {항목 ID: JSON 본문}. fetch_fn이 돌려주지 않은 항목(존재하지 않음)은 빠진다
+    """
+    if not keys:
+        return {}
+
+    redis = get_redis_binary()
+    ids = list(keys)
+
+    with metrics.timed("dependency_duration_seconds", _REDIS_READ), timing.span("cache_read"):
+        cached = await redis.mget([f"{keys[item_id]}:json" for item_id in ids])
+
+    bodies: dict[str, bytes] = {}
+    missing: list[str] = []
+    for item_id, body in zip(ids, cached, strict=True):
+        _record_lookup(keys[item_id], bool(body))
+        if body:
+            bodies[item_id] = body
+        else:
+            missing.append(item_id)
+
+    if not missing:
+        return bodies
+
+    with metrics.timed("cache_fill_duration_seconds", {"prefix": _key_prefix(keys[missing[0]])}):
+        fetched = await fetch_fn(missing)
+
+    pipe = redis.pipeline(transaction=False)
+    for item_id, data in fetched.items():
+        body = response_model.model_validate(data).model_dump_json(by_alias=True).encode()
+        bodies[item_id] = body
+        for variant_key, value in _response_variants(keys[item_id], body).items():
+            pipe.set(variant_key, value, ex=ttl)
+
+    if fetched:
+        with metrics.timed("dependency_duration_seconds", _REDIS_WRITE), timing.span("cache_write"):
+            await pipe.execute()
+
+    return bodies
+
+
+def response_cache_keys(key: str) -> list[str]:
+    """get_or_set_response_cache가 key로 저장할 수 있는 모든 키 (JSON 원본 + 압축본)"""
+    return [f"{key}:json", *(f"{key}:{encoding}" for encoding in STATIC_LEVELS)]
+
+
+async def delete_cache_keys(keys: list[str]) -> int:
+    """
+    이름을 아는 캐시 키들을 한 번에 삭제한다.
+
+    Returns:
+        삭제된 키 개수
+    """
+    if not keys:
+        return 0
+    return await get_redis().unlink(*keys)
+
+
 async def invalidate_cache(cache_key: str) -> int:
     """
     캐시 무효화
 
+    KEYS 대신 SCAN으로 나눠 찾으므로 키가 많아도 Redis를 오래 막지 않는다.
+
     Args:
         cache_key: "cache:heroes:*", "cache:stats:*" 등
 
@@ -45,7 +249,64 @@ async def invalidate_cache(cache_key: str) -> int:
         삭제된 키 개수
     """
     redis = get_redis()
-    keys = await redis.keys(cache_key)
-    if keys:
-        return await redis.delete(*keys)
-    return 0
+    deleted = 0
+    batch: list[str] = []
+
+    async for key in redis.scan_iter(match=cache_key, count=SCAN_BATCH_SIZE):
+        batch.append(key)
+        if len(batch) >= SCAN_BATCH_SIZE:
+            deleted += await redis.unlink(*batch)
+            batch.clear()
+
+    if batch:
+        deleted += await redis.unlink(*batch)
+    return deleted
+
+
+async def update_cache(
+    key: str,
+    update_fn: Callable[[Any], Any | None],
+    ttl: int,
+) -> None:
+    """
+    캐시가 있을 때만 update_fn을 적용해 다시 저장한다. (write-through)
+
+    - WATCH 트랜잭션으로 동시 수정 시 재시도하므로 갱신이 유실되지 않는다
+    - update_fn이 None을 반환하거나 갱신에 실패하면 캐시를 삭제해 다음 조회 때 다시 채운다
+    - 캐시가 없어도 버전을 올려, 이 변경 전에 DB를 읽기 시작한 get_or_set_cache가
+      오래된 값을 저장하지 못하게 한다
+
+    Args:
+        key: Redis 키
+        update_fn: 캐시된 데이터를 받아 새 데이터를 반환하는 함수 (동기)
+        ttl: 캐시 유효 시간 (초)
+    """
+    redis = get_redis()
+    version_key = _version_key(key)
+
+    async def apply(pipe) -> None:
+        cached = await pipe.get(key)
+        updated = update_fn(serializer.loads(cached)) if cached is not None else None
+
+        pipe.multi()
+        pipe.incr(version_key)
+        pipe.expire(version_key, ttl)
+        if cached is None:
+            return
+        if updated is None:
+            pipe.delete(key)
+        else:
+            pipe.set(key, serializer.dumps(updated), ex=ttl)
+
+    try:
+        await redis.transaction(apply, key)
+    except Exception as e:
+        logger.warning("캐시 갱신 실패, 삭제 시도 (%s): %s", key, e)
+        try:
+            pipe = redis.pipeline(transaction=True)
+            pipe.delete(key)
+            pipe.incr(version_key)
+            pipe.expire(version_key, ttl)
+            await pipe.execute()
+        except Exception:
+            logger.exception("캐시 삭제 실패 (%s)", key)
@@ -0,0 +1,98 @@
+"""
+워커 전체 메트릭 (Redis로 모으기)
+
+uvicorn --workers / 여러 레플리카에서는 /metrics 요청이 임의의 워커 하나로 가므로,
+워커마다 PUBLISH_INTERVAL초마다 자기 메트릭을 Redis 해시(metrics:workers)에 올리고
+/metrics는 살아 있는 모든 워커의 값을 worker 라벨(호스트:PID)로 구분해 한 번에 내보낸다.
+
+- 응답하는 워커는 현재 값, 다른 워커는 최대 PUBLISH_INTERVAL초 전 값이다
+- WORKER_TTL초 동안 올리지 않은 워커(비정상 종료 등)는 내보내지 않고 해시에서 지운다
+- 재시작한 워커는 새 worker 라벨이 되므로 대시보드에서는 sum by (...)로 합쳐 본다
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+
+from app.config.redis import get_redis
+from app.utils import metrics, serializer
+
+logger = logging.getLogger(__name__)
+
+WORKERS_KEY = "metrics:workers"
+PUBLISH_INTERVAL = 15.0
+WORKER_TTL = 60.0
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+_publish_task: asyncio.Task | None = None
+
+
+def start_metrics_publisher() -> None:
+    """앱 시작 시 이 워커의 메트릭을 주기적으로 올리는 태스크를 시작한다."""
+    global _publish_task
+    _publish_task = asyncio.create_task(_publish_loop())
+
+
+async def stop_metrics_publisher() -> None:
+    """앱 종료 시 올리기를 멈추고 이 워커의 값을 지운다."""
+    global _publish_task
+    if _publish_task:
+        _publish_task.cancel()
+        await asyncio.gather(_publish_task, return_exceptions=True)
+        _publish_task = None
+
+    try:
+        await get_redis().hdel(WORKERS_KEY, WORKER_ID)
+    except Exception as e:
+        logger.warning("워커 메트릭 삭제 실패: %s", e)
+
+
+async def _publish() -> None:
+    payload = serializer.dumps({"published_at": time.time(), "state": metrics.export_state()})
+    await get_redis().hset(WORKERS_KEY, WORKER_ID, payload)
+
+
+async def _publish_loop() -> None:
+    while True:
+        try:
+            await _publish()
+        except Exception as e:
+            logger.warning("워커 메트릭 올리기 실패: %s", e)
+        await asyncio.sleep(PUBLISH_INTERVAL)
+
+
+async def render_cluster_metrics() -> str:
+    """
+    살아 있는 모든 워커의 메트릭을 Prometheus 텍스트 형식으로 만든다.
+
+    Redis를 읽지 못하면 이 워커의 값만 내보낸다.
+    """
+    workers: dict[str, dict] = {}
+    stale: list[str] = []
+
+    try:
+        entries = await get_redis().hgetall(WORKERS_KEY)
+    except Exception as e:
+        logger.warning("워커 메트릭 조회 실패, 이 워커 값만 내보냄: %s", e)
+        entries = {}
+
+    now = time.time()
+    for worker, payload in entries.items():
+        if worker == WORKER_ID:
+            continue
+        entry = serializer.loads(payload)
+        if now - entry["published_at"] > WORKER_TTL:
+            stale.append(worker)
+            continue
+        workers[worker] = entry["state"]
+
+    if stale:
+        try:
+            await get_redis().hdel(WORKERS_KEY, *stale)
+        except Exception as e:
+            logger.warning("종료된 워커 메트릭 삭제 실패: %s", e)
+
+    workers[WORKER_ID] = metrics.export_state()
+    return metrics.render_prometheus(workers)
@@ -0,0 +1,79 @@
+"""
+응답 압축 유틸
+
+gzip은 항상 사용할 수 있고, brotli / zstandard는 설치된 경우에만 사용한다.
+"""
+
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MIN_COMPRESS_SIZE = 1024
+
+# 요청마다 압축하는 경우 (속도 우선)
+DYNAMIC_LEVELS = {"zstd": 3, "br": 4, "gzip": 5}
+# 캐시에 한 번 압축해 두는 경우 (압축률 우선)
+STATIC_LEVELS = {"zstd": 19, "br": 11, "gzip": 9}
+
+# 같은 q 값이면 앞쪽을 우선한다
+AVAILABLE_ENCODINGS: tuple[str, ...] = tuple(
+    encoding
+    for encoding, module in (("zstd", zstandard), ("br", brotli), ("gzip", gzip))
+    if module is not None
+)
+
+
+def choose_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Accept-Encoding 헤더를 보고 사용할 압축 방식을 고른다.
+
+    Returns:
+        "zstd" | "br" | "gzip", 허용된 방식이 없으면 None
+    """
+    if not accept_encoding:
+        return None
+
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in AVAILABLE_ENCODINGS:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def compress(body: bytes, encoding: str, static: bool = False) -> bytes:
+    """body를 지정한 방식으로 압축한다."""
+    level = (STATIC_LEVELS if static else DYNAMIC_LEVELS)[encoding]
+
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(body)
+
+    raise ValueError(f"지원하지 않는 압축 방식: {encoding}")
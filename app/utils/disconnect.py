@@ -0,0 +1,73 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+
+from fastapi import Request
+
+DISCONNECT_POLL_INTERVAL = 0.25
+
+_STREAM_END = object()
+_DISCONNECTED = object()
+
+
+class ClientDisconnectedError(Exception):
+    """스트리밍 도중 클라이언트 연결이 끊김"""
+
+
+async def _pump(stream: AsyncGenerator, queue: asyncio.Queue) -> None:
+    """스트림 청크를 큐로 옮긴다. 종료/예외 시 종료 표식을 넣는다."""
+    try:
+        async for chunk in stream:
+            await queue.put(chunk)
+    finally:
+        await stream.aclose()
+        queue.put_nowait(_STREAM_END)
+
+
+async def _watch_disconnect(request: Request, queue: asyncio.Queue, interval: float) -> None:
+    """클라이언트 연결 종료를 감지하면 큐에 표식을 넣는다."""
+    while not await request.is_disconnected():
+        await asyncio.sleep(interval)
+    queue.put_nowait(_DISCONNECTED)
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    """취소된 태스크의 예외가 로그에 남지 않도록 결과를 소비한다."""
+    if not task.cancelled():
+        task.exception()
+
+
+async def stream_until_disconnect(
+    request: Request,
+    stream: AsyncGenerator,
+    poll_interval: float = DISCONNECT_POLL_INTERVAL,
+) -> AsyncIterator:
+    """
+    클라이언트 연결이 유지되는 동안만 스트림을 중계한다.
+
+    - 스트림은 별도 태스크에서 소비되므로 도구 실행처럼 청크가 없는 구간에서도
+      연결 종료를 감지할 수 있다
+    - 연결이 끊기면 스트림 태스크를 즉시 취소한다 (진행 중인 LLM/도구 호출 포함)
+
+    Raises:
+        ClientDisconnectedError: 스트림 도중 클라이언트 연결이 끊긴 경우
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    pump_task = asyncio.create_task(_pump(stream, queue))
+    watch_task = asyncio.create_task(_watch_disconnect(request, queue, poll_interval))
+
+    try:
+        while True:
+            item = await queue.get()
+
+            if item is _DISCONNECTED:
+                raise ClientDisconnectedError()
+
+            if item is _STREAM_END:
+                await pump_task
+                return
+
+            yield item
+    finally:
+        for task in (pump_task, watch_task):
+            task.cancel()
+            task.add_done_callback(_consume_result)
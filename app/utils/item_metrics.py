@@ -0,0 +1,33 @@
+"""
+작업 항목 단위 지표 수집
+
+동기화의 영웅/통계 조합처럼 한 항목을 처리하는 태스크 안에서 start_item_metrics()를 호출하면,
+그 태스크에서 일어나는 Overfast 호출/DB 저장이 record_item_metric()으로 같은 dict에 쌓인다.
+contextvar를 쓰므로 asyncio.gather로 동시에 처리하는 항목끼리 섞이지 않는다.
+"""
+
+from contextvars import ContextVar
+
+_current: ContextVar[dict[str, float] | None] = ContextVar("item_metrics", default=None)
+
+
+def start_item_metrics() -> dict[str, float]:
+    """현재 태스크의 항목 지표 수집을 시작하고, 값이 쌓일 dict를 반환한다."""
+    metrics = {
+        "overfast_ms": 0.0,
+        "requests": 0,
+        "retries": 0,
+        "throttled": 0,
+        "rate_wait_ms": 0.0,
+        "backoff_ms": 0.0,
+        "db_ms": 0.0,
+    }
+    _current.set(metrics)
+    return metrics
+
+
+def record_item_metric(name: str, value: float = 1) -> None:
+    """수집 중인 항목 지표에 값을 더한다. 수집 중이 아니면 무시한다."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics[name] = metrics.get(name, 0) + value
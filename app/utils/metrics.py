@@ -0,0 +1,199 @@
+"""
+프로세스 내 메트릭 (카운터 / 게이지 / 히스토그램)
+
+- 라벨은 (이름, 값) 튜플로 묶어 키로 쓴다. 값 종류가 적은 것만 라벨로 쓴다 (경로는 라우트 템플릿)
+- 기록은 dict 갱신 몇 번뿐이라 요청마다 호출해도 부담이 작다
+- render_prometheus()가 /metrics에 내보낼 Prometheus 텍스트 형식을 만든다
+- 여러 워커의 값은 export_state()로 모아 render_prometheus(workers)로 함께 내보낸다
+  (app.utils.cluster_metrics)
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+Labels = tuple[tuple[str, str], ...]
+
+# 초 단위 지연 시간 기본 버킷
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 기본 버킷이 맞지 않는 히스토그램
+HISTOGRAM_BUCKETS: dict[str, tuple[float, ...]] = {
+    "http_request_duration_seconds": (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+    ),
+    "llm_time_to_first_token_seconds": (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0),
+}
+
+METRIC_HELP = {
+    "http_request_duration_seconds": "라우트별 요청 처리 시간 (SSE는 스트림 종료까지)",
+    "cache_requests_total": "get_or_set_cache / 응답 캐시 조회 결과 (키 접두사별 hit/miss)",
+    "cache_fill_duration_seconds": "캐시 미스 시 원본 조회 시간 (키 접두사별)",
+    "dependency_duration_seconds": "Redis / Supabase 호출 시간",
+    "rate_limit_rejections_total": "채팅 요청 한도 초과로 거절한 요청 수",
+    "sse_active_streams": "현재 열려 있는 SSE 스트림 수",
+    "llm_time_to_first_token_seconds": "에이전트 실행 시작부터 첫 답변 토큰까지 걸린 시간",
+    "llm_tokens_streamed_total": "클라이언트로 스트리밍한 답변 토큰 수",
+}
+
+_counters: dict[str, float] = {}
+_labeled_counters: dict[tuple[str, Labels], float] = {}
+_gauges: dict[tuple[str, Labels], float] = {}
+# (이름, 라벨) → [버킷별 개수..., 합계, 개수]
+_histograms: dict[tuple[str, Labels], list[float]] = {}
+
+
+def _labels(labels: dict[str, str] | None) -> Labels:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def increment(name: str, value: float = 1, labels: dict[str, str] | None = None) -> None:
+    """카운터 값을 증가시킨다."""
+    if labels:
+        key = (name, _labels(labels))
+        _labeled_counters[key] = _labeled_counters.get(key, 0) + value
+    else:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def get_counter(name: str, labels: dict[str, str] | None = None) -> float:
+    """카운터 현재 값을 반환한다. 없으면 0"""
+    if labels:
+        return _labeled_counters.get((name, _labels(labels)), 0)
+    return _counters.get(name, 0)
+
+
+def add_gauge(name: str, delta: float, labels: dict[str, str] | None = None) -> None:
+    """게이지 값을 delta만큼 바꾼다. (열린 스트림 수 등)"""
+    key = (name, _labels(labels))
+    _gauges[key] = _gauges.get(key, 0) + delta
+
+
+def observe(name: str, value: float, labels: dict[str, str] | None = None) -> None:
+    """히스토그램에 값 하나를 기록한다."""
+    buckets = HISTOGRAM_BUCKETS.get(name, DEFAULT_BUCKETS)
+    key = (name, _labels(labels))
+    state = _histograms.get(key)
+    if state is None:
+        state = _histograms[key] = [0] * (len(buckets) + 2)
+
+    # 누적 분포는 내보낼 때 계산하고, 여기서는 해당 버킷 하나만 올린다
+    index = bisect_left(buckets, value)
+    if index < len(buckets):
+        state[index] += 1
+    state[-2] += value
+    state[-1] += 1
+
+
+@contextmanager
+def timed(name: str, labels: dict[str, str] | None = None) -> Iterator[None]:
+    """블록 실행 시간을 히스토그램에 기록한다. (예외가 나도 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - started, labels)
+
+
+def snapshot() -> dict[str, float]:
+    """라벨 없는 카운터의 현재 값을 복사해 반환한다."""
+    return dict(_counters)
+
+
+def export_state() -> dict[str, list]:
+    """
+    모든 메트릭의 현재 값을 JSON으로 직렬화할 수 있는 형태로 복사해 반환한다.
+
+    Returns:
+        {"counters" / "gauges": [[이름, 라벨, 값]], "histograms": [[이름, 라벨, 버킷 상태]]}
+    """
+    return {
+        "counters": [[name, [], value] for name, value in _counters.items()]
+        + [[name, labels, value] for (name, labels), value in _labeled_counters.items()],
+        "gauges": [[name, labels, value] for (name, labels), value in _gauges.items()],
+        "histograms": [
+            [name, labels, list(state)] for (name, labels), state in list(_histograms.items())
+        ],
+    }
+
+
+def _as_labels(labels) -> Labels:
+    """export_state()의 라벨(JSON을 거치면 리스트)을 Labels 튜플로 되돌린다."""
+    return tuple((name, value) for name, value in labels)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _header(lines: list[str], name: str, kind: str) -> None:
+    if name in METRIC_HELP:
+        lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def render_prometheus(workers: dict[str, dict] | None = None) -> str:
+    """
+    메트릭을 Prometheus 텍스트 형식(0.0.4)으로 만든다.
+
+    Args:
+        workers: {워커 ID: export_state()}. 주면 모든 워커의 값을 worker 라벨로 구분해 내보내고,
+            없으면 이 프로세스의 값만 worker 라벨 없이 내보낸다
+    """
+    if workers is None:
+        sources = [((), export_state())]
+    else:
+        sources = [((("worker", worker),), state) for worker, state in sorted(workers.items())]
+
+    counters: dict[str, list[tuple[Labels, float]]] = {}
+    gauges: dict[str, list[tuple[Labels, float]]] = {}
+    histograms: dict[str, list[tuple[Labels, list[float]]]] = {}
+    for extra, state in sources:
+        for name, labels, value in state["counters"]:
+            counters.setdefault(name, []).append((_as_labels(labels) + extra, value))
+        for name, labels, value in state["gauges"]:
+            gauges.setdefault(name, []).append((_as_labels(labels) + extra, value))
+        for name, labels, counts in state["histograms"]:
+            histograms.setdefault(name, []).append((_as_labels(labels) + extra, counts))
+
+    lines: list[str] = []
+    for name in sorted(counters):
+        _header(lines, name, "counter")
+        for labels, value in sorted(counters[name]):
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    for name in sorted(gauges):
+        _header(lines, name, "gauge")
+        for labels, value in sorted(gauges[name]):
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    for name in sorted(histograms):
+        _header(lines, name, "histogram")
+        buckets = HISTOGRAM_BUCKETS.get(name, DEFAULT_BUCKETS)
+        for labels, state in sorted(histograms[name]):
+            cumulative = 0
+            for bound, count in zip(buckets, state, strict=False):
+                cumulative += count
+                lines.append(
+                    f"{name}_bucket{_format_labels(labels, (('le', repr(bound)),))} {cumulative}"
+                )
+            lines.append(
+                f"{name}_bucket{_format_labels(labels, (('le', '+Inf'),))} "
+                f"{_format_value(state[-1])}"
+            )
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(state[-2])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_value(state[-1])}")
+
+    return "\n".join(lines) + "\n"
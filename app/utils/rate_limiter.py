@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    429 / Retry-After 피드백에 맞춰 속도를 조절하는 토큰 버킷 (AIMD)
+
+    - 성공할 때마다 초당 허용량을 increase_step씩 늘린다 (max_rate까지)
+    - 429를 받으면 허용량을 절반으로 줄이고, Retry-After 동안 모든 요청을 멈춘다
+    - 대기 순서는 acquire 호출 순서를 따른다
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: float,
+        max_rate: float,
+        increase_step: float,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        토큰 1개를 얻을 때까지 기다린다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        started = time.monotonic()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return time.monotonic() - started
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """요청 성공 시 허용량을 조금 늘린다."""
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttled(self, retry_after: float | None = None) -> None:
+        """429 응답 시 허용량을 절반으로 줄이고 Retry-After 동안 멈춘다."""
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = 0
+
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
@@ -0,0 +1,67 @@
+"""
+JSON 직렬화 유틸
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 같은 형식(UTF-8, 공백 없음)을 만든다.
+캐시 값, SSE 이벤트, 기본 응답 클래스가 모두 여기를 거친다.
+
+- orjson은 NaN/Infinity를 null로 쓰고, datetime / UUID를 그대로 직렬화한다
+- 표준 json 경로는 datetime / UUID를 str()로 바꾼다
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def _default(value: Any) -> str:
+    """표준 json이 모르는 값(datetime, UUID 등)은 문자열로 쓴다."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(data: Any) -> bytes:
+        """data를 JSON 바이트로 직렬화한다."""
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+
+    def dumps_str(data: Any) -> str:
+        """data를 JSON 문자열로 직렬화한다. (SSE 이벤트 등)"""
+        return orjson.dumps(data, option=_ORJSON_OPTIONS).decode()
+
+    loads = orjson.loads
+
+else:
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+
+    def dumps(data: Any) -> bytes:
+        """data를 JSON 바이트로 직렬화한다."""
+        return _encoder.encode(data).encode()
+
+    def dumps_str(data: Any) -> str:
+        """data를 JSON 문자열로 직렬화한다. (SSE 이벤트 등)"""
+        return _encoder.encode(data)
+
+    loads = json.loads
+
+
+def sse_event(data: Any) -> str:
+    """SSE data 이벤트 한 건. 예: 'data: {"type":"done"}\\n\\n'"""
+    return f"data: {dumps_str(data)}\n\n"
+
+
+class FastJSONResponse(JSONResponse):
+    """serializer.dumps로 본문을 만드는 기본 응답 클래스"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
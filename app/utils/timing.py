@@ -0,0 +1,87 @@
+"""
+요청 단위 구간(span) 시간 측정
+
+ServerTimingMiddleware가 표본으로 뽑은 요청에만 RequestTimings를 contextvar에 넣고,
+인증 / 요청 한도 / 캐시 / DB / 도구 / 첫 토큰 같은 구간이 span()으로 시간을 더한다.
+표본이 아닌 요청에서는 span()이 contextvar 조회 한 번으로 끝난다.
+
+- 응답 헤더를 보내기 전까지 모인 구간은 Server-Timing 헤더로 내보낸다
+- 스트리밍(SSE) 중의 구간(도구, 첫 토큰)은 헤더가 이미 나간 뒤라 구조화 로그에만 남는다
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class RequestTimings:
+    """요청 1건의 구간별 누적 시간(ms)과 호출 수"""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.spans: dict[str, list[float]] = {}
+
+    def add(self, name: str, duration_ms: float) -> None:
+        span = self.spans.get(name)
+        if span is None:
+            self.spans[name] = [duration_ms, 1]
+        else:
+            span[0] += duration_ms
+            span[1] += 1
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값. 예: "auth;dur=12.3, db;dur=40.1;desc=\"x2\", total;dur=60.2" """
+        entries = []
+        for name, (duration, count) in self.spans.items():
+            entry = f"{name};dur={duration:.1f}"
+            if count > 1:
+                entry += f';desc="x{count}"'
+            entries.append(entry)
+        entries.append(f"total;dur={self.elapsed_ms():.1f}")
+        return ", ".join(entries)
+
+    def as_log_fields(self) -> dict:
+        """구조화 로그용 구간 요약"""
+        return {
+            "total_ms": round(self.elapsed_ms(), 1),
+            "spans": {
+                name: {"ms": round(duration, 1), "count": int(count)}
+                for name, (duration, count) in self.spans.items()
+            },
+        }
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def start_request_timing() -> RequestTimings:
+    """현재 요청의 구간 측정을 시작한다."""
+    timings = RequestTimings()
+    _current.set(timings)
+    return timings
+
+
+def record_span(name: str, duration_ms: float) -> None:
+    """시작과 끝이 다른 곳에 있는 구간(첫 토큰 등)을 기록한다. 측정 중이 아니면 무시한다."""
+    timings = _current.get()
+    if timings is not None:
+        timings.add(name, duration_ms)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """블록 실행 시간을 현재 요청의 name 구간에 더한다."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, (time.perf_counter() - started) * 1000)
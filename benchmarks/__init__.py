@@ -0,0 +1,22 @@
+"""
+로컬 벤치마크 모음 (python -m benchmarks.<모듈>)
+
+app.config.settings는 임포트 시점에 필수 환경 변수를 검증하므로,
+패키지 임포트 시 더미 값을 먼저 채운다. 벤치마크 모듈은 항상 이 패키지를 통해
+실행되므로 app 모듈보다 먼저 적용된다. 실제 자격 증명이 섞이지 않도록 기존 값을 덮어쓴다.
+"""
+
+import os
+
+DUMMY_ENV = {
+    "SUPABASE_URL": "http://127.0.0.1:54321",
+    "SUPABASE_KEY": "bench.dummy.key",
+    "OPENAI_API_KEY": "sk-bench-dummy",
+    "OPENAI_MODEL": "gpt-4o-mini",
+    "OPENAI_TEMPERATURE": "0.3",
+    "TAVILY_API_KEY": "tvly-bench-dummy",
+    "REDIS_URL": "redis://127.0.0.1:6379/15",
+}
+
+for name, value in DUMMY_ENV.items():
+    os.environ[name] = value
@@ -0,0 +1,208 @@
+"""
+/api/chat 오프라인 부하 테스트
+
+LLM, 임베딩, 웹 검색, RAG DB를 결정적인 가짜 구현으로 바꾼 뒤
+앱을 로컬 uvicorn으로 띄우고 N개의 SSE 클라이언트를 동시에 붙인다.
+OpenAI / Tavily / Supabase / Redis에는 접속하지 않는다.
+
+사용 예:
+    python -m benchmarks.chat_pipeline --clients 20 --requests 3 \\
+        --tool-script search_rag,get_hero_counters --tokens 150 --token-latency 0.01
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import statistics
+import time
+
+import httpx
+import uvicorn
+
+from app.ai import agent, tools
+from app.dependencies.rate_limit import check_rate_limit
+from app.main import app
+from benchmarks.fake_ai import (
+    FakeChatModel,
+    FakeEmbeddings,
+    FakeSyncSupabase,
+    FakeTavilyClient,
+)
+from benchmarks.stats import percentile
+
+LAG_PROBE_INTERVAL = 0.01
+
+
+def install_fakes(args: argparse.Namespace) -> None:
+    """앱의 외부 의존성을 가짜 구현으로 교체한다."""
+    tool_script = [
+        step.split("+") for step in args.tool_script.split(",") if step
+    ] if args.tool_script else []
+
+    fake_llm = FakeChatModel(
+        tool_script=tool_script,
+        answer_tokens=args.tokens,
+        token_latency=args.token_latency,
+        first_token_latency=args.first_token_latency,
+    )
+    fake_embeddings = FakeEmbeddings(latency=args.embedding_latency)
+    fake_tavily = FakeTavilyClient(latency=args.search_latency)
+    fake_supabase = FakeSyncSupabase(latency=args.db_latency)
+
+    agent.get_llm = lambda: fake_llm
+    tools.get_embeddings = lambda: fake_embeddings
+    tools.get_tavily = lambda: fake_tavily
+    tools.get_sync_supabase = lambda: fake_supabase
+
+    app.dependency_overrides[check_rate_limit] = lambda: {
+        "remaining": 999,
+        "limit": 999,
+        "reset": 0,
+    }
+
+
+async def measure_loop_lag(samples: list[float], stop: asyncio.Event) -> None:
+    """이벤트 루프 지연(예정 시각 대비 실제 깨어난 시각 차이)을 측정한다."""
+    while not stop.is_set():
+        expected = time.perf_counter() + LAG_PROBE_INTERVAL
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        samples.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run_one_chat(client: httpx.AsyncClient, url: str, message: str) -> dict:
+    """SSE 요청 1건을 보내고 지표를 측정한다."""
+    started = time.perf_counter()
+    first_token_at = None
+    tokens = 0
+
+    async with client.stream("POST", url, json={"message": message}) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            event = json.loads(line.removeprefix("data: "))
+            if event.get("type") == "content":
+                tokens += 1
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+
+    finished = time.perf_counter()
+    streaming_time = finished - first_token_at if first_token_at else 0.0
+
+    return {
+        "ttft": (first_token_at or finished) - started,
+        "e2e": finished - started,
+        "tokens": tokens,
+        "tokens_per_sec": tokens / streaming_time if streaming_time else 0.0,
+    }
+
+
+async def run_client(
+    client: httpx.AsyncClient, url: str, requests: int, results: list[dict]
+) -> None:
+    for i in range(requests):
+        results.append(await run_one_chat(client, url, f"아나 운영 팁 알려줘 ({i})"))
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=args.port,
+        lifespan="off",
+        log_level="warning",
+        access_log=False,
+    )
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    url = f"http://127.0.0.1:{args.port}/api/chat"
+    results: list[dict] = []
+    lag_samples: list[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(lag_samples, stop))
+
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    started = time.perf_counter()
+    async with httpx.AsyncClient(timeout=None, limits=limits) as client:
+        await asyncio.gather(*(
+            run_client(client, url, args.requests, results) for _ in range(args.clients)
+        ))
+    wall = time.perf_counter() - started
+
+    stop.set()
+    await lag_task
+    server.should_exit = True
+    await server_task
+
+    return {"results": results, "lag": lag_samples, "wall": wall}
+
+
+def report(args: argparse.Namespace, outcome: dict) -> None:
+    results = outcome["results"]
+    ttft = [r["ttft"] for r in results]
+    e2e = [r["e2e"] for r in results]
+    rates = [r["tokens_per_sec"] for r in results if r["tokens_per_sec"]]
+    lag = outcome["lag"]
+    total_tokens = sum(r["tokens"] for r in results)
+
+    print(f"클라이언트 {args.clients} x 요청 {args.requests} = {len(results)}건, "
+          f"총 {outcome['wall']:.2f}s, 도구 스크립트: {args.tool_script or '(없음)'}")
+    print(f"{'지표':<24}{'p50':>10}{'p99':>10}{'max':>10}")
+    rows = [
+        ("TTFT (ms)", [v * 1000 for v in ttft]),
+        ("end-to-end (ms)", [v * 1000 for v in e2e]),
+        ("요청별 tokens/sec", rates),
+        ("이벤트 루프 지연 (ms)", [v * 1000 for v in lag]),
+    ]
+    for label, values in rows:
+        print(
+            f"{label:<24}{percentile(values, 50):>10.1f}"
+            f"{percentile(values, 99):>10.1f}{max(values, default=0):>10.1f}"
+        )
+    print(f"전체 처리량: {total_tokens / outcome['wall']:.1f} tokens/sec, "
+          f"{len(results) / outcome['wall']:.2f} req/sec, "
+          f"평균 TTFT {statistics.fmean(ttft) * 1000:.1f}ms")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="/api/chat 오프라인 벤치마크")
+    parser.add_argument("--clients", type=int, default=10, help="동시 SSE 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=3, help="클라이언트당 요청 수")
+    parser.add_argument(
+        "--tool-script", default="search_rag",
+        help="단계별 도구 호출. 쉼표로 단계, +로 병렬 호출 구분 "
+             "(예: search_rag,get_hero_stats+search_web)",
+    )
+    parser.add_argument("--tokens", type=int, default=200, help="답변 토큰 수")
+    parser.add_argument("--token-latency", type=float, default=0.02, help="토큰 간 지연 (초)")
+    parser.add_argument(
+        "--first-token-latency", type=float, default=0.3, help="LLM 호출당 첫 토큰 지연 (초)"
+    )
+    parser.add_argument("--embedding-latency", type=float, default=0.05, help="임베딩 지연 (초)")
+    parser.add_argument("--search-latency", type=float, default=0.3, help="웹 검색 지연 (초)")
+    parser.add_argument("--db-latency", type=float, default=0.03, help="도구 DB 쿼리 지연 (초)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--verbose", action="store_true", help="에이전트 실행 로그 출력")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    install_fakes(args)
+
+    if args.verbose:
+        outcome = asyncio.run(run_benchmark(args))
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            outcome = asyncio.run(run_benchmark(args))
+
+    report(args, outcome)
+
+
+if __name__ == "__main__":
+    main()
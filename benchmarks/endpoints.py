@@ -0,0 +1,389 @@
+"""
+API 엔드포인트 부하 테스트 (영웅 / 채팅방 / 요청 한도)
+
+앱을 로컬 uvicorn으로 띄우고 Redis는 fakeredis(또는 --redis-url의 로컬 Redis),
+Supabase는 지연을 준 인메모리 테이블(benchmarks.fake_supabase)로 바꾼 뒤,
+시드로 정해지는 혼합 요청 스크립트를 동시에 보낸다. 같은 스크립트를 세 시나리오로 반복한다.
+
+- cold: 모든 응답/목록 캐시를 비운 상태
+- warm: cold 직후 (캐시가 채워진 상태)
+- post-invalidation: 동기화가 영웅 일부를 바꾼 것처럼 sync_service의 무효화를 실행한 직후
+
+시나리오마다 전체 처리량과 엔드포인트별 p50/p95/p99, 상태 코드, DB 호출 수를 출력한다.
+요청 한도는 /bench/rate-limit(의존성만 실행하는 벤치마크 전용 경로)로 측정하고,
+시나리오마다 한도 카운터를 초기화한다.
+
+사용 예:
+    python -m benchmarks.endpoints --requests 3000 --concurrency 32 --db-latency 0.01
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import UTC, datetime, timedelta
+from typing import Annotated
+
+import httpx
+import uvicorn
+from fastapi import Depends
+
+from app.config import redis as redis_config
+from app.config import supabase as supabase_config
+from app.dependencies.rate_limit import check_rate_limit
+from app.main import app
+from app.scheduler import sync_service
+from app.services.conversation_service import encode_message_cursor
+from app.services.stats_history import DAY_SECONDS, encode_series
+from app.utils.cache import invalidate_cache
+from benchmarks.fake_supabase import FakeAsyncSupabase, fake_user_id
+from benchmarks.stats import percentile
+
+SCENARIOS = ("cold", "warm", "post-invalidation")
+ROLES = ("tank", "damage", "support")
+ROLE_FILTERS = ("all", *ROLES)
+ORDER_BY = ("winrate:desc", "pickrate:desc")
+HISTORY_POINTS = 30
+
+# (엔드포인트 라벨, 가중치)
+WORKLOAD = (
+    ("GET /api/heroes", 3),
+    ("GET /api/heroes/stats", 4),
+    ("GET /api/heroes/{hero_key}", 3),
+    ("GET /api/heroes/batch", 1),
+    ("GET /api/heroes/{hero_key}/stats/history", 1),
+    ("GET /api/conversations", 2),
+    ("GET /api/conversations/{id}/messages", 2),
+    ("GET /api/conversations/{id}/messages?before", 1),
+    ("POST /api/conversations", 0.5),
+    ("rate limit", 1),
+)
+
+
+async def _rate_limit_probe(rate_limit: Annotated[dict, Depends(check_rate_limit)]) -> dict:
+    return rate_limit
+
+
+def seed(args: argparse.Namespace, rng: random.Random) -> tuple[FakeAsyncSupabase, dict]:
+    """영웅 / 통계 / 추이 / 채팅방 / 메시지 시드 데이터를 만든다."""
+    supabase = FakeAsyncSupabase(latency=args.db_latency)
+    tables = supabase.tables
+    now = datetime.now(UTC)
+    hero_keys = [f"hero-{i:02d}" for i in range(args.heroes)]
+
+    tables["heroes"] = [
+        {
+            "key": key,
+            "name": f"Hero {i}",
+            "portrait": f"https://bench.local/{key}.png",
+            "role": ROLES[i % len(ROLES)],
+            "hitpoints_health": 250,
+            "hitpoints_armor": 0,
+            "hitpoints_shields": 0,
+            "counters": rng.sample(hero_keys, 3),
+            "synergies": rng.sample(hero_keys, 2),
+        }
+        for i, key in enumerate(hero_keys)
+    ]
+    tables["hero_abilities"] = [
+        {
+            "hero_key": key,
+            "name": f"{key} {ability_type} {n}",
+            "description": "벤치마크용 스킬 설명 " * 5,
+            "icon": f"https://bench.local/{key}-{n}.png",
+            "ability_type": ability_type,
+        }
+        for key in hero_keys
+        for ability_type, count in (("skill", 4), ("perk_major", 2), ("perk_minor", 2))
+        for n in range(count)
+    ]
+
+    synced_at = now.isoformat()
+    tables["hero_stats"] = [
+        {
+            "hero_key": key,
+            "platform": "pc",
+            "gamemode": task["gamemode"],
+            "region": task["region"],
+            "competitive_division": task["division"],
+            "winrate": round(rng.uniform(40, 60), 2),
+            "pickrate": round(rng.uniform(0, 15), 2),
+            "synced_at": synced_at,
+        }
+        for task in sync_service._build_stat_tasks()
+        for key in hero_keys
+    ]
+
+    start = int(now.timestamp()) - HISTORY_POINTS * DAY_SECONDS
+    tables["hero_stats_history"] = [
+        {
+            "hero_key": key,
+            "platform": "pc",
+            "gamemode": "competitive",
+            "region": "asia",
+            "competitive_division": "all",
+            "series": encode_series([
+                (start + day * DAY_SECONDS, rng.uniform(40, 60), rng.uniform(0, 15))
+                for day in range(HISTORY_POINTS)
+            ]),
+        }
+        for key in hero_keys
+    ]
+
+    tokens = [f"bench-{i}" for i in range(args.users)]
+    conversations: dict[str, list[str]] = {}
+    cursors: dict[str, str] = {}
+    tables["conversations"] = []
+    tables["chat_messages"] = []
+
+    for token in tokens:
+        user_id = fake_user_id(token)
+        conversations[token] = []
+        for c in range(args.conversations):
+            conversation_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+            updated_at = (now - timedelta(hours=c)).isoformat()
+            tables["conversations"].append({
+                "id": conversation_id,
+                "user_id": user_id,
+                "title": f"대화 {c}",
+                "tag": "general",
+                "created_at": updated_at,
+                "updated_at": updated_at,
+            })
+            conversations[token].append(conversation_id)
+
+            messages = [
+                {
+                    "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                    "conversation_id": conversation_id,
+                    "role": "user" if m % 2 == 0 else "assistant",
+                    "content": "벤치마크 메시지 " * 20,
+                    "created_at": (now - timedelta(hours=c, minutes=args.messages - m)).isoformat(),
+                }
+                for m in range(args.messages)
+            ]
+            tables["chat_messages"].extend(messages)
+            cursors[conversation_id] = encode_message_cursor(messages[len(messages) // 2])
+
+    return supabase, {
+        "hero_keys": hero_keys,
+        "tokens": tokens,
+        "conversations": conversations,
+        "cursors": cursors,
+    }
+
+
+def build_script(args: argparse.Namespace, data: dict, rng: random.Random) -> list[tuple]:
+    """가중치대로 섞은 요청 목록 [(라벨, 메서드, 경로, 헤더, 본문)]"""
+    labels = [label for label, _ in WORKLOAD]
+    weights = [weight for _, weight in WORKLOAD]
+    regions = sorted({task["region"] for task in sync_service._build_stat_tasks()})
+    divisions = sorted({task["division"] for task in sync_service._build_stat_tasks()})
+    script = []
+
+    for label in rng.choices(labels, weights=weights, k=args.requests):
+        token = rng.choice(data["tokens"])
+        auth = {"Authorization": f"Bearer {token}"}
+        hero_key = rng.choice(data["hero_keys"])
+        conversation_id = rng.choice(data["conversations"][token])
+
+        if label == "GET /api/heroes":
+            request = ("GET", f"/api/heroes?role={rng.choice(ROLE_FILTERS)}", {}, None)
+        elif label == "GET /api/heroes/stats":
+            params = (
+                f"region={rng.choice(regions)}&competitiveDivision={rng.choice(divisions)}"
+                f"&role={rng.choice(ROLE_FILTERS)}&order_by={rng.choice(ORDER_BY)}"
+            )
+            request = ("GET", f"/api/heroes/stats?{params}", {}, None)
+        elif label == "GET /api/heroes/{hero_key}":
+            request = ("GET", f"/api/heroes/{hero_key}", {}, None)
+        elif label == "GET /api/heroes/batch":
+            keys = ",".join(rng.sample(data["hero_keys"], rng.randint(2, 6)))
+            request = ("GET", f"/api/heroes/batch?keys={keys}", {}, None)
+        elif label == "GET /api/heroes/{hero_key}/stats/history":
+            request = ("GET", f"/api/heroes/{hero_key}/stats/history?days=14", {}, None)
+        elif label == "GET /api/conversations":
+            request = ("GET", "/api/conversations", auth, None)
+        elif label == "GET /api/conversations/{id}/messages":
+            request = ("GET", f"/api/conversations/{conversation_id}/messages", auth, None)
+        elif label == "GET /api/conversations/{id}/messages?before":
+            cursor = data["cursors"][conversation_id]
+            path = f"/api/conversations/{conversation_id}/messages?before={cursor}&limit=20"
+            request = ("GET", path, auth, None)
+        elif label == "POST /api/conversations":
+            request = ("POST", "/api/conversations", auth, {"title": "벤치마크", "tag": "general"})
+        else:
+            request = ("GET", "/bench/rate-limit", auth, None)
+
+        script.append((label, *request))
+    return script
+
+
+async def prepare_scenario(name: str, supabase: FakeAsyncSupabase, data: dict, args) -> str:
+    """시나리오 시작 전 캐시 상태를 만들고, 요청 한도 카운터를 초기화한다."""
+    await invalidate_cache("rate:*")
+
+    if name == "cold":
+        deleted = await invalidate_cache("cache:*")
+        return f"캐시 키 {deleted}개 삭제"
+
+    if name == "post-invalidation":
+        changed = random.Random(args.seed).sample(
+            data["hero_keys"], round(len(data["hero_keys"]) * args.invalidate_ratio)
+        )
+        started = time.perf_counter()
+        deleted = await sync_service._invalidate_hero_caches(supabase, changed, [])
+        elapsed = (time.perf_counter() - started) * 1000
+        return f"영웅 {len(changed)}명 변경 무효화: 키 {deleted}개, {elapsed:.1f}ms"
+
+    return "캐시 유지"
+
+
+async def run_scenario(client: httpx.AsyncClient, script: list[tuple], concurrency: int) -> dict:
+    results: list[tuple[str, int, float]] = []
+    position = 0
+
+    async def worker() -> None:
+        nonlocal position
+        while position < len(script):
+            label, method, path, headers, body = script[position]
+            position += 1
+            started = time.perf_counter()
+            response = await client.request(method, path, headers=headers, json=body)
+            await response.aread()
+            results.append((label, response.status_code, time.perf_counter() - started))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return {"results": results, "wall": time.perf_counter() - started}
+
+
+async def install_redis(args: argparse.Namespace) -> None:
+    if args.redis_url:
+        import redis.asyncio as redis
+
+        redis_config._client = redis.from_url(args.redis_url, decode_responses=True)
+        redis_config._binary_client = redis.from_url(args.redis_url)
+        return
+
+    try:
+        import fakeredis
+    except ImportError:
+        raise SystemExit(
+            "fakeredis가 필요합니다 (pip install fakeredis) 또는 --redis-url을 지정하세요"
+        ) from None
+
+    server = fakeredis.FakeServer()
+    redis_config._client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    redis_config._binary_client = fakeredis.FakeAsyncRedis(server=server)
+
+
+async def run_benchmark(args: argparse.Namespace) -> list[dict]:
+    rng = random.Random(args.seed)
+    supabase, data = seed(args, rng)
+    script = build_script(args, data, rng)
+
+    supabase_config._client = supabase
+    await install_redis(args)
+    app.add_api_route("/bench/rate-limit", _rate_limit_probe, methods=["GET"])
+
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=args.port,
+        lifespan="off",
+        log_level="warning",
+        access_log=False,
+    )
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    outcomes = []
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}", timeout=None, limits=limits
+        ) as client:
+            for name in SCENARIOS:
+                note = await prepare_scenario(name, supabase, data, args)
+                supabase.reset_calls()
+                outcome = await run_scenario(client, script, args.concurrency)
+                outcome.update(name=name, note=note, db_calls=Counter(supabase.calls))
+                outcomes.append(outcome)
+    finally:
+        server.should_exit = True
+        await server_task
+
+    return outcomes
+
+
+def report(args: argparse.Namespace, outcomes: list[dict]) -> None:
+    print(
+        f"요청 {args.requests}건 x {len(outcomes)}개 시나리오, 동시성 {args.concurrency}, "
+        f"DB 지연 {args.db_latency * 1000:.0f}ms, 사용자 {args.users}명 x 채팅방 "
+        f"{args.conversations}개 x 메시지 {args.messages}개, 영웅 {args.heroes}명"
+    )
+
+    for outcome in outcomes:
+        results = outcome["results"]
+        by_label: dict[str, list[float]] = defaultdict(list)
+        statuses: dict[str, Counter] = defaultdict(Counter)
+        for label, status_code, elapsed in results:
+            by_label[label].append(elapsed * 1000)
+            statuses[label][status_code] += 1
+
+        print(f"\n== {outcome['name']} ({outcome['note']}) ==")
+        print(
+            f"{len(results) / outcome['wall']:.0f} req/s, 전체 {outcome['wall']:.2f}s, "
+            f"DB 호출 {sum(outcome['db_calls'].values())}건"
+        )
+        print(f"{'엔드포인트':<46}{'건수':>6}{'p50':>9}{'p95':>9}{'p99':>9}  상태")
+        for label, _ in WORKLOAD:
+            values = by_label.get(label)
+            if not values:
+                continue
+            status_text = ", ".join(
+                f"{code}x{count}" for code, count in sorted(statuses[label].items())
+            )
+            print(
+                f"{label:<46}{len(values):>6}{percentile(values, 50):>9.1f}"
+                f"{percentile(values, 95):>9.1f}{percentile(values, 99):>9.1f}  {status_text}"
+            )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="API 엔드포인트 부하 테스트")
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--db-latency", type=float, default=0.01, help="DB/인증 호출 지연 (초)")
+    parser.add_argument("--heroes", type=int, default=45)
+    parser.add_argument("--users", type=int, default=20, help="채팅방을 가진 회원 수")
+    parser.add_argument("--conversations", type=int, default=10, help="회원당 채팅방 수")
+    parser.add_argument("--messages", type=int, default=60, help="채팅방당 메시지 수")
+    parser.add_argument(
+        "--invalidate-ratio", type=float, default=0.2,
+        help="post-invalidation 시나리오에서 바뀐 것으로 칠 영웅 비율",
+    )
+    parser.add_argument(
+        "--redis-url", default=None,
+        help="fakeredis 대신 쓸 로컬 Redis (cache:* / rate:* 키를 지운다)",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--port", type=int, default=8767)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    outcomes = asyncio.run(run_benchmark(args))
+    report(args, outcomes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+채팅 파이프라인 벤치마크용 가짜 LLM / 임베딩 / 검색 / RAG DB
+
+모두 결정적(deterministic)이며 지연 시간만 설정값대로 흉내 낸다.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+TOOL_ARGS = {
+    "search_rag": {"query": "아나 운영법"},
+    "search_web": {"query": "최신 패치노트"},
+    "get_hero_stats": {"hero_key": "ana"},
+    "get_hero_counters": {"hero_key": "ana"},
+    "get_hero_abilities": {"hero_key": "ana"},
+}
+
+ANSWER_WORDS = [
+    "아나는", "수면총으로", "적", "돌진을", "끊고", "나노", "강화제를", "아껴", "쓰세요.",
+]
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    스크립트대로 도구를 호출한 뒤 토큰 단위로 답변을 스트리밍하는 가짜 모델
+
+    - tool_script: 단계별 도구 이름 목록. [["search_rag"], ["get_hero_counters"]]면
+      두 번에 걸쳐 도구를 호출한 뒤 답변한다
+    - answer_tokens: 최종 답변 토큰 수
+    - token_latency: 토큰 간 지연 (초)
+    - first_token_latency: 첫 토큰(또는 도구 호출) 전 지연 (초)
+    """
+
+    tool_script: list[list[str]] = []
+    answer_tokens: int = 200
+    token_latency: float = 0.02
+    first_token_latency: float = 0.3
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "FakeChatModel":
+        return self
+
+    def _current_step(self, messages: list[BaseMessage]) -> int:
+        """마지막 사용자 메시지 이후 도구를 호출한 횟수"""
+        step = 0
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            if isinstance(message, AIMessage) and message.tool_calls:
+                step += 1
+        return step
+
+    def _tool_call_chunk(self, step: int) -> AIMessageChunk:
+        return AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {
+                    "name": name,
+                    "args": json.dumps(TOOL_ARGS.get(name, {}), ensure_ascii=False),
+                    "id": f"call_{step}_{index}",
+                    "index": index,
+                }
+                for index, name in enumerate(self.tool_script[step])
+            ],
+        )
+
+    def _answer_token(self, index: int) -> str:
+        return ANSWER_WORDS[index % len(ANSWER_WORDS)] + " "
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        chunks = list(self._stream(messages, stop, run_manager, **kwargs))
+        message = chunks[0].message
+        for chunk in chunks[1:]:
+            message += chunk.message
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        time.sleep(self.first_token_latency)
+        step = self._current_step(messages)
+
+        if step < len(self.tool_script):
+            yield ChatGenerationChunk(message=self._tool_call_chunk(step))
+            return
+
+        for index in range(self.answer_tokens):
+            if index:
+                time.sleep(self.token_latency)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=self._answer_token(index)))
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        await asyncio.sleep(self.first_token_latency)
+        step = self._current_step(messages)
+
+        if step < len(self.tool_script):
+            yield ChatGenerationChunk(message=self._tool_call_chunk(step))
+            return
+
+        for index in range(self.answer_tokens):
+            if index:
+                await asyncio.sleep(self.token_latency)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=self._answer_token(index)))
+
+
+class FakeEmbeddings:
+    """텍스트 해시로 만든 고정 벡터를 반환하는 가짜 임베딩"""
+
+    def __init__(self, latency: float = 0.05, size: int = 1536):
+        self.latency = latency
+        self.size = size
+
+    def _vector(self, text: str) -> list[float]:
+        digest = hashlib.sha256(text.encode()).digest()
+        return [digest[i % len(digest)] / 255 for i in range(self.size)]
+
+    def embed_query(self, text: str) -> list[float]:
+        time.sleep(self.latency)
+        return self._vector(text)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        await asyncio.sleep(self.latency)
+        return self._vector(text)
+
+
+class FakeTavilyClient:
+    """고정 검색 결과를 반환하는 가짜 Tavily 클라이언트 (동기 호출)"""
+
+    def __init__(self, latency: float = 0.3):
+        self.latency = latency
+
+    def search(self, query: str, **kwargs: Any) -> dict:
+        time.sleep(self.latency)
+        return {
+            "results": [
+                {
+                    "title": f"{query} 관련 문서 {i}",
+                    "content": "오버워치 2 최신 패치에서 지원 영웅 밸런스가 조정되었습니다.",
+                    "url": f"https://namu.wiki/w/bench-{i}",
+                }
+                for i in range(3)
+            ]
+        }
+
+
+class _FakeResponse:
+    def __init__(self, data: list[dict]):
+        self.data = data
+
+
+class _FakeQuery:
+    """동기 Supabase 쿼리 빌더 흉내. 필터는 무시하고 고정 행을 반환한다."""
+
+    def __init__(self, rows: list[dict], latency: float):
+        self._rows = rows
+        self._latency = latency
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: self
+
+    def execute(self) -> _FakeResponse:
+        time.sleep(self._latency)
+        return _FakeResponse(self._rows)
+
+
+class FakeSyncSupabase:
+    """도구(ai/tools.py)가 사용하는 동기 Supabase 클라이언트 흉내"""
+
+    TABLES = {
+        "hero_stats": [{"hero_key": "ana", "winrate": 51.2, "pickrate": 12.4}],
+        "heroes": [
+            {
+                "name": "아나",
+                "role": "support",
+                "counters": ["genji", "winston"],
+                "synergies": ["reinhardt", "genji"],
+            }
+        ],
+        "hero_abilities": [
+            {"name": "생체 소총", "description": "아군을 치유하고 적을 공격합니다.",
+             "ability_type": "skill"},
+            {"name": "수면총", "description": "적을 잠재웁니다.", "ability_type": "skill"},
+        ],
+    }
+    DOCUMENTS = [
+        {"content": "아나는 후방에서 탱커를 지원하며 수면총으로 돌진을 끊습니다.",
+         "metadata": {"title": "아나 가이드"}},
+        {"content": "나노 강화제는 돌진 조합의 핵심 궁극기와 함께 사용하세요.",
+         "metadata": {"title": "조합 가이드"}},
+    ]
+
+    def __init__(self, latency: float = 0.03):
+        self.latency = latency
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(self.TABLES.get(name, []), self.latency)
+
+    def rpc(self, name: str, params: dict) -> _FakeQuery:
+        return _FakeQuery(self.DOCUMENTS, self.latency)
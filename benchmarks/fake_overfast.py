@@ -0,0 +1,171 @@
+"""
+벤치마크용 가짜 Overfast API
+
+sync_service가 호출하는 /heroes, /heroes/{key}, /heroes/stats만 흉내 낸다.
+
+- 응답은 영웅 수와 버전으로 정해지는 결정적 데이터이며, ETag / If-None-Match(304)를 지원한다
+- bump_versions()로 일부 영웅/통계 조합의 내용을 바꿔 "변경 있음" 실행을 만든다
+- 요청마다 지연을 주고, 설정한 비율로 429(Retry-After)와 503을 섞는다
+
+앱과 같은 이벤트 루프에서 uvicorn으로 띄워 settings.overfast_base_url을 이 서버로 향하게 한다.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+from collections import Counter
+
+from fastapi import FastAPI, Request, Response
+
+ROLES = ("tank", "damage", "support")
+ABILITIES_PER_HERO = 4
+
+
+class FakeOverfast:
+    """
+    가짜 Overfast 서버 상태 (데이터 버전, 장애 주입 설정, 요청 집계)
+
+    Args:
+        heroes: 영웅 수
+        latency: 요청당 지연 (초)
+        throttle_rate: 429를 돌려줄 확률
+        retry_after: 429 응답의 Retry-After (초)
+        error_rate: 503을 돌려줄 확률
+        seed: 장애 주입/변경 대상 선택용 난수 시드
+    """
+
+    def __init__(
+        self,
+        heroes: int = 45,
+        latency: float = 0.05,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        error_rate: float = 0.0,
+        seed: int = 42,
+    ) -> None:
+        self.hero_keys = [f"hero-{i:02d}" for i in range(heroes)]
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.hero_versions: dict[str, int] = dict.fromkeys(self.hero_keys, 0)
+        self.stats_versions: Counter = Counter()
+        self.requests: Counter = Counter()
+
+    def bump_versions(self, ratio: float) -> tuple[list[str], int]:
+        """
+        영웅과 통계 조합 중 ratio 비율의 내용을 바꾼다.
+
+        통계는 조합별 버전이라, 버전을 올린 조합만 다음 조회에서 내용이 달라진다.
+
+        Returns:
+            (바뀐 영웅 키 목록, 바뀐 통계 조합 수)
+        """
+        changed = self.random.sample(self.hero_keys, round(len(self.hero_keys) * ratio))
+        for key in changed:
+            self.hero_versions[key] += 1
+
+        combos = sorted(self.stats_versions)
+        changed_combos = self.random.sample(combos, round(len(combos) * ratio))
+        for combo in changed_combos:
+            self.stats_versions[combo] += 1
+        return changed, len(changed_combos)
+
+    # ---- 데이터 ----
+    def hero_list(self) -> list[dict]:
+        return [
+            {
+                "key": key,
+                "name": f"Hero {i}",
+                "portrait": f"https://fake-overfast.local/{key}.png",
+                "role": ROLES[i % len(ROLES)],
+            }
+            for i, key in enumerate(self.hero_keys)
+        ]
+
+    def hero_detail(self, key: str) -> dict | None:
+        if key not in self.hero_versions:
+            return None
+        i = self.hero_keys.index(key)
+        version = self.hero_versions[key]
+        return {
+            "name": f"Hero {i}",
+            "role": ROLES[i % len(ROLES)],
+            "hitpoints": {"health": 200 + 25 * version, "armor": 50 * (i % 3), "shields": 0},
+            "abilities": [
+                {
+                    "name": f"{key} ability {n}",
+                    "description": f"{key} ability {n} (v{version})",
+                    "icon": f"https://fake-overfast.local/{key}-{n}.png",
+                }
+                for n in range(ABILITIES_PER_HERO)
+            ],
+        }
+
+    def hero_stats(self, combo: str) -> list[dict]:
+        version = self.stats_versions.setdefault(combo, 0)
+        digest = int(hashlib.md5(combo.encode()).hexdigest()[:8], 16)
+        return [
+            {
+                "hero": key,
+                "winrate": round(40 + (digest + i * 7 + version * 3) % 200 / 10, 2),
+                "pickrate": round((digest + i * 13 + version) % 150 / 10, 2),
+            }
+            for i, key in enumerate(self.hero_keys)
+        ]
+
+    # ---- 응답 ----
+    async def respond(self, request: Request, endpoint: str, body) -> Response:
+        """지연/장애 주입 후 JSON 응답(또는 304)을 만든다."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        roll = self.random.random()
+        if roll < self.throttle_rate:
+            self.requests[(endpoint, 429)] += 1
+            return Response(status_code=429, headers={"Retry-After": str(self.retry_after)})
+        if roll < self.throttle_rate + self.error_rate:
+            self.requests[(endpoint, 503)] += 1
+            return Response(status_code=503)
+
+        if body is None:
+            self.requests[(endpoint, 404)] += 1
+            return Response(status_code=404)
+
+        content = json.dumps(body, ensure_ascii=False).encode()
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            self.requests[(endpoint, 304)] += 1
+            return Response(status_code=304, headers={"ETag": etag})
+
+        self.requests[(endpoint, 200)] += 1
+        return Response(content, media_type="application/json", headers={"ETag": etag})
+
+
+def create_app(state: FakeOverfast) -> FastAPI:
+    """가짜 Overfast FastAPI 앱"""
+    app = FastAPI()
+
+    @app.get("/heroes")
+    async def heroes(request: Request) -> Response:
+        return await state.respond(request, "/heroes", state.hero_list())
+
+    # /heroes/{key}보다 먼저 등록해야 "stats"가 영웅 키로 잡히지 않는다
+    @app.get("/heroes/stats")
+    async def hero_stats(
+        request: Request,
+        platform: str,
+        gamemode: str,
+        region: str,
+        competitive_division: str = "all",
+    ) -> Response:
+        combo = f"{platform}/{gamemode}/{region}/{competitive_division}"
+        return await state.respond(request, "/heroes/stats", state.hero_stats(combo))
+
+    @app.get("/heroes/{hero_key}")
+    async def hero_detail(request: Request, hero_key: str) -> Response:
+        return await state.respond(request, "/heroes/{key}", state.hero_detail(hero_key))
+
+    return app
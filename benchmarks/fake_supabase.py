@@ -0,0 +1,402 @@
+"""
+벤치마크용 인메모리 비동기 Supabase(PostgREST) 흉내
+
+앱이 쓰는 쿼리 빌더 메서드만 구현한다.
+
+- select (컬럼 목록, "*", 연관 테이블 임베딩 "heroes(name, role)")
+- eq / neq / gt / gte / lt / lte / in_ / ov / or_ (and(...) 중첩, reference_table)
+- order / limit (foreign_table 포함), insert / upsert / update / delete
+- auth.get_user (토큰 문자열로 정해지는 가짜 사용자)
+
+execute()마다 설정한 지연을 주고, (테이블, 동작)별 호출 수를 센다.
+"""
+
+import asyncio
+import copy
+import uuid
+from collections import Counter
+from datetime import UTC, datetime
+from typing import Any
+
+# 테이블별 기본 키 (upsert에 on_conflict가 없을 때 사용)
+PRIMARY_KEYS = {
+    "heroes": ("key",),
+}
+
+# (부모 테이블, 임베딩 테이블) → (부모 컬럼, 자식 컬럼, 관계)
+RELATIONS = {
+    ("hero_stats", "heroes"): ("hero_key", "key", "one"),
+    ("conversations", "chat_messages"): ("id", "conversation_id", "many"),
+}
+
+# insert 시 비어 있으면 채우는 컬럼
+GENERATED_COLUMNS = {
+    "conversations": ("id", "created_at", "updated_at"),
+    "chat_messages": ("id", "created_at"),
+    "scheduler_logs": ("id",),
+}
+
+
+class FakeResponse:
+    def __init__(self, data: list[dict], count: int | None = None):
+        self.data = data
+        self.count = count
+
+
+class FakeUser:
+    def __init__(self, user_id: str, email: str):
+        self.id = user_id
+        self.email = email
+
+
+class FakeUserResponse:
+    def __init__(self, user: FakeUser | None):
+        self.user = user
+
+
+def fake_user_id(token: str) -> str:
+    """토큰마다 항상 같은 사용자 ID (시드 데이터와 요청 토큰을 맞출 때 사용)"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"bench-user:{token}"))
+
+
+class FakeAuth:
+    """supabase.auth 흉내. 빈 토큰과 "invalid"로 시작하는 토큰만 거부한다."""
+
+    def __init__(self, db: "FakeAsyncSupabase"):
+        self._db = db
+
+    async def get_user(self, token: str) -> FakeUserResponse:
+        self._db.calls[("auth", "get_user")] += 1
+        if self._db.latency:
+            await asyncio.sleep(self._db.latency)
+        if not token or token.startswith("invalid"):
+            return FakeUserResponse(None)
+        return FakeUserResponse(FakeUser(fake_user_id(token), f"{token}@bench.local"))
+
+
+def _split_top_level(text: str, separator: str = ",") -> list[str]:
+    """괄호/중괄호/따옴표 안의 구분자는 무시하고 나눈다."""
+    parts: list[str] = []
+    depth = 0
+    quoted = False
+    current = ""
+    escaped = False
+
+    for char in text:
+        if escaped:
+            current += char
+            escaped = False
+            continue
+        if char == "\\":
+            current += char
+            escaped = True
+            continue
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in "({":
+            depth += 1
+        elif not quoted and char in ")}":
+            depth -= 1
+        elif not quoted and depth == 0 and char == separator:
+            parts.append(current)
+            current = ""
+            continue
+        current += char
+
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def _parse_list(value: str) -> list[str]:
+    """"{a,b}" / "(a,b)" 형식의 목록 값"""
+    return [_unquote(item) for item in _split_top_level(value[1:-1])] if len(value) > 2 else []
+
+
+def _coerce(row_value: Any, raw: Any) -> tuple[Any, Any]:
+    """비교할 수 있도록 필터 값(문자열)을 행 값의 타입에 맞춘다."""
+    if isinstance(raw, str) and isinstance(row_value, bool):
+        return row_value, raw.lower() == "true"
+    if isinstance(raw, str) and isinstance(row_value, int | float):
+        return row_value, float(raw)
+    if isinstance(raw, str) and isinstance(row_value, str):
+        try:
+            return datetime.fromisoformat(row_value), datetime.fromisoformat(raw)
+        except ValueError:
+            return row_value, raw
+    return row_value, raw
+
+
+def _matches(row: dict, column: str, op: str, value: Any) -> bool:
+    row_value = row.get(column)
+
+    if op == "is":
+        return row_value is None if str(value).lower() == "null" else row_value == value
+    if op == "in":
+        values = value if isinstance(value, list) else _parse_list(value)
+        return any(row_value == _coerce(row_value, item)[1] for item in values)
+    if op == "ov":
+        values = value if isinstance(value, list) else _parse_list(value)
+        return bool(set(row_value or []) & set(values))
+    if row_value is None:
+        return False
+
+    left, right = _coerce(row_value, _unquote(value) if isinstance(value, str) else value)
+    return {
+        "eq": left == right,
+        "neq": left != right,
+        "gt": left > right,
+        "gte": left >= right,
+        "lt": left < right,
+        "lte": left <= right,
+    }[op]
+
+
+def _evaluate(row: dict, expression: str) -> bool:
+    """PostgREST 논리 필터 항목 하나 ("col.op.value" / "and(...)" / "or(...)")"""
+    for logic, combine in (("and(", all), ("or(", any)):
+        if expression.startswith(logic):
+            inner = expression[len(logic):-1]
+            return combine(_evaluate(row, part) for part in _split_top_level(inner))
+
+    column, op, value = expression.split(".", 2)
+    return _matches(row, column, op, value)
+
+
+def _parse_select(columns: str) -> tuple[list[str], dict[str, list[str]]]:
+    """"a, b, rel(c, d)" → (["a", "b"], {"rel": ["c", "d"]})"""
+    plain: list[str] = []
+    embedded: dict[str, list[str]] = {}
+    for part in _split_top_level(columns.replace(" ", "")):
+        if "(" in part:
+            name, inner = part.split("(", 1)
+            embedded[name] = _split_top_level(inner[:-1])
+        elif part:
+            plain.append(part)
+    return plain, embedded
+
+
+def _project(row: dict, columns: list[str]) -> dict:
+    if not columns or "*" in columns:
+        return dict(row)
+    return {column: row.get(column) for column in columns}
+
+
+class FakeQuery:
+    def __init__(self, db: "FakeAsyncSupabase", table: str):
+        self._db = db
+        self._table = table
+        self._action = "select"
+        self._columns = "*"
+        self._payload: list[dict] | dict | None = None
+        self._on_conflict: str | None = None
+        self._ignore_duplicates = False
+        self._filters: list[tuple[str | None, Any]] = []
+        self._orders: list[tuple[str | None, str, bool]] = []
+        self._limits: dict[str | None, int] = {}
+
+    # ---- 동작 ----
+    def select(self, columns: str = "*", count: str | None = None) -> "FakeQuery":
+        self._columns = columns
+        return self
+
+    def insert(self, rows: list[dict] | dict) -> "FakeQuery":
+        self._action = "insert"
+        self._payload = rows
+        return self
+
+    def upsert(
+        self,
+        rows: list[dict] | dict,
+        on_conflict: str = "",
+        ignore_duplicates: bool = False,
+    ) -> "FakeQuery":
+        self._action = "upsert"
+        self._payload = rows
+        self._on_conflict = on_conflict or None
+        self._ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, values: dict) -> "FakeQuery":
+        self._action = "update"
+        self._payload = values
+        return self
+
+    def delete(self) -> "FakeQuery":
+        self._action = "delete"
+        return self
+
+    # ---- 필터 ----
+    def _add(self, column: str, op: str, value: Any) -> "FakeQuery":
+        # PostgREST URL처럼 UUID 등은 문자열로 비교한다
+        if not isinstance(value, str | int | float | bool | list | None):
+            value = str(value)
+        if "." in column:
+            table, column = column.split(".", 1)
+            self._filters.append((table, lambda row: _matches(row, column, op, value)))
+        else:
+            self._filters.append((None, lambda row: _matches(row, column, op, value)))
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        return self._add(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> "FakeQuery":
+        return self._add(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> "FakeQuery":
+        return self._add(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> "FakeQuery":
+        return self._add(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> "FakeQuery":
+        return self._add(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> "FakeQuery":
+        return self._add(column, "lte", value)
+
+    def in_(self, column: str, values: list) -> "FakeQuery":
+        return self._add(column, "in", list(values))
+
+    def ov(self, column: str, values: list) -> "FakeQuery":
+        return self._add(column, "ov", list(values))
+
+    def or_(self, filters: str, reference_table: str | None = None) -> "FakeQuery":
+        parts = _split_top_level(filters)
+        self._filters.append(
+            (reference_table, lambda row: any(_evaluate(row, part) for part in parts))
+        )
+        return self
+
+    def order(
+        self, column: str, desc: bool = False, foreign_table: str | None = None
+    ) -> "FakeQuery":
+        self._orders.append((foreign_table, column, desc))
+        return self
+
+    def limit(self, size: int, foreign_table: str | None = None) -> "FakeQuery":
+        self._limits[foreign_table] = size
+        return self
+
+    # ---- 실행 ----
+    def _rows(self) -> list[dict]:
+        return self._db.tables.setdefault(self._table, [])
+
+    def _filter(self, rows: list[dict], table: str | None) -> list[dict]:
+        for target, predicate in self._filters:
+            if target == table:
+                rows = [row for row in rows if predicate(row)]
+        return rows
+
+    def _sort_limit(self, rows: list[dict], table: str | None) -> list[dict]:
+        # 여러 order는 앞의 것이 우선이므로 뒤에서부터 안정 정렬한다
+        for target, column, desc in reversed(self._orders):
+            if target == table:
+                rows = sorted(rows, key=lambda row: row.get(column), reverse=desc)
+        if table in self._limits:
+            rows = rows[:self._limits[table]]
+        return rows
+
+    def _embed(self, row: dict, name: str, columns: list[str]) -> Any:
+        parent_column, child_column, kind = RELATIONS[(self._table, name)]
+        children = [
+            child for child in self._db.tables.get(name, [])
+            if child.get(child_column) == row.get(parent_column)
+        ]
+        children = self._sort_limit(self._filter(children, name), name)
+        projected = [_project(child, columns) for child in children]
+        if kind == "one":
+            return projected[0] if projected else None
+        return projected
+
+    def _select(self) -> list[dict]:
+        plain, embedded = _parse_select(self._columns)
+        result = []
+        for row in self._sort_limit(self._filter(self._rows(), None), None):
+            item = _project(row, plain)
+            for name, columns in embedded.items():
+                item[name] = self._embed(row, name, columns)
+            result.append(item)
+        return copy.deepcopy(result)
+
+    def _fill_generated(self, row: dict) -> dict:
+        row = dict(row)
+        now = datetime.now(UTC).isoformat()
+        for column in GENERATED_COLUMNS.get(self._table, ()):
+            if row.get(column) is None:
+                row[column] = str(uuid.uuid4()) if column == "id" else now
+        return row
+
+    def _conflict_columns(self) -> tuple[str, ...]:
+        if self._on_conflict:
+            return tuple(self._on_conflict.split(","))
+        return PRIMARY_KEYS.get(self._table, ("id",))
+
+    def _write(self) -> list[dict]:
+        rows = self._rows()
+        payload = self._payload if isinstance(self._payload, list) else [self._payload]
+
+        if self._action == "insert":
+            inserted = [self._fill_generated(row) for row in payload]
+            rows.extend(inserted)
+            return copy.deepcopy(inserted)
+
+        if self._action == "upsert":
+            columns = self._conflict_columns()
+            index = {tuple(row.get(c) for c in columns): row for row in rows}
+            written = []
+            for new in payload:
+                existing = index.get(tuple(new.get(c) for c in columns))
+                if existing is None:
+                    row = self._fill_generated(new)
+                    rows.append(row)
+                    index[tuple(row.get(c) for c in columns)] = row
+                    written.append(row)
+                elif not self._ignore_duplicates:
+                    existing.update(new)
+                    written.append(existing)
+            return copy.deepcopy(written)
+
+        matched = self._filter(rows, None)
+        if self._action == "update":
+            for row in matched:
+                row.update(self._payload)
+            return copy.deepcopy(matched)
+
+        matched_ids = {id(row) for row in matched}
+        self._db.tables[self._table] = [row for row in rows if id(row) not in matched_ids]
+        return copy.deepcopy(matched)
+
+    async def execute(self) -> FakeResponse:
+        self._db.calls[(self._table, self._action)] += 1
+        if self._db.latency:
+            await asyncio.sleep(self._db.latency)
+
+        data = self._select() if self._action == "select" else self._write()
+        return FakeResponse(data, count=len(data))
+
+
+class FakeAsyncSupabase:
+    """앱이 쓰는 비동기 Supabase 클라이언트 흉내 (인메모리 테이블)"""
+
+    def __init__(self, latency: float = 0.0, tables: dict[str, list[dict]] | None = None):
+        self.latency = latency
+        self.tables: dict[str, list[dict]] = tables if tables is not None else {}
+        self.calls: Counter = Counter()
+        self.auth = FakeAuth(self)
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def from_(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def reset_calls(self) -> None:
+        self.calls.clear()
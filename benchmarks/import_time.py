@@ -0,0 +1,106 @@
+"""
+워커 시작 시 임포트 시간 예산 검사 (python -X importtime)
+
+새 인터프리터에서 대상 모듈(기본 app.main)을 임포트해 누적 임포트 시간을 재고,
+가장 무거운 하위 임포트를 보여 준다. 다음 경우 종료 코드 1로 끝나므로 CI에서 예산 테스트로 쓴다.
+
+- 누적 임포트 시간이 --budget-ms를 넘음
+- 첫 채팅 요청 때 불러와야 할 모듈(LangChain / OpenAI / Tavily 등)이 시작 시 임포트됨
+
+사용 예:
+    python -m benchmarks.import_time --budget-ms 2000 --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# 앱 시작 시 임포트되면 안 되는 모듈 (채팅 요청 또는 백그라운드 미리 불러오기에서만)
+LAZY_MODULES = (
+    "langchain_core",
+    "langchain_openai",
+    "langchain_classic",
+    "openai",
+    "tavily",
+    "app.ai.agent",
+    "app.ai.tools",
+)
+
+
+def measure(module: str) -> list[tuple[int, int, str]]:
+    """
+    새 인터프리터에서 module을 임포트하고 -X importtime 결과를 파싱한다.
+
+    Returns:
+        [(누적 마이크로초, 깊이, 모듈 이름)] (임포트된 순서)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=os.environ,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"{module} 임포트 실패:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(cumulative), depth, name.strip()))
+    return rows
+
+
+def report(args: argparse.Namespace) -> int:
+    runs = [measure(args.module) for _ in range(args.repeat)]
+    # 디스크 캐시 등 잡음을 줄이려고 가장 빠른 실행을 기준으로 한다
+    rows = min(runs, key=lambda run: next(c for c, _, name in run if name == args.module))
+    total_ms = next(c for c, _, name in rows if name == args.module) / 1000
+
+    print(f"{args.module} 누적 임포트 시간: {total_ms:.0f}ms (최소 {args.repeat}회 중)")
+    print(f"{'누적 (ms)':>10}  모듈 (직접 임포트 기준 상위 {args.top}개)")
+    direct = sorted((row for row in rows if row[1] == 1), reverse=True)
+    for cumulative, _, name in direct[:args.top]:
+        print(f"{cumulative / 1000:>10.1f}  {name}")
+
+    failed = False
+    imported = {name for _, _, name in rows}
+    eager = sorted(
+        name for name in imported
+        if any(name == lazy or name.startswith(f"{lazy}.") for lazy in LAZY_MODULES)
+    )
+    if eager:
+        failed = True
+        print(f"\n실패: 시작 시 임포트되면 안 되는 모듈 {len(eager)}개: {', '.join(eager[:10])}")
+
+    if args.budget_ms and total_ms > args.budget_ms:
+        failed = True
+        print(f"\n실패: 예산 {args.budget_ms:.0f}ms 초과 ({total_ms:.0f}ms)")
+
+    if not failed:
+        print("\n통과")
+    return 1 if failed else 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="임포트 시간 예산 검사")
+    parser.add_argument("--module", default="app.main", help="측정할 모듈")
+    parser.add_argument(
+        "--budget-ms", type=float, default=2000.0,
+        help="허용할 누적 임포트 시간 (ms, 0이면 검사 안 함). 머신 성능에 맞게 조정",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="측정 횟수 (가장 빠른 값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 무거운 임포트 수")
+    return parser.parse_args()
+
+
+def main() -> None:
+    sys.exit(report(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
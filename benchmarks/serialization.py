@@ -0,0 +1,125 @@
+"""
+JSON 직렬화 벤치마크 (표준 json vs app.utils.serializer)
+
+benchmarks.endpoints와 같은 시드 데이터에서 hero_service로 실제 통계 / 영웅 상세 응답을 만들고,
+다음 세 경로의 1회당 시간을 비교한다.
+
+- cache: get_or_set_cache / update_cache의 값 저장(dumps)과 히트(loads)
+- sse: 토큰 하나를 SSE 이벤트로 만드는 비용 (에이전트 스트림)
+- response: response_model 직렬화 뒤 응답 본문 렌더링 (JSONResponse vs FastJSONResponse)
+
+사용 예:
+    python -m benchmarks.serialization --number 2000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import timeit
+from collections.abc import Callable
+
+from fastapi.responses import JSONResponse
+
+from app.config import supabase as supabase_config
+from app.schemas.hero import HeroDetailResponse, StatsResponse
+from app.services.hero_service import get_hero_detail, get_hero_stats
+from app.utils import serializer
+from app.utils.serializer import FastJSONResponse
+from benchmarks import endpoints
+
+
+def _stdlib_sse(data: dict) -> str:
+    """serializer 도입 전 에이전트의 SSE 인코딩"""
+    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def load_payloads(args: argparse.Namespace) -> dict[str, tuple[dict, type]]:
+    """시드 데이터로 실제 응답 데이터를 만든다. {이름: (데이터, response_model)}"""
+    seed_args = argparse.Namespace(
+        db_latency=0, heroes=args.heroes, users=1, conversations=1, messages=2
+    )
+    supabase, data = endpoints.seed(seed_args, random.Random(args.seed))
+    supabase_config._client = supabase
+
+    return {
+        "stats": (await get_hero_stats(), StatsResponse),
+        "hero_detail": (await get_hero_detail(data["hero_keys"][0]), HeroDetailResponse),
+    }
+
+
+def measure(fn: Callable[[], object], number: int, repeat: int) -> float:
+    """1회당 최소 시간 (마이크로초)"""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def run(args: argparse.Namespace) -> list[tuple[str, str, float, float, int]]:
+    payloads = asyncio.run(load_payloads(args))
+    rows = []
+
+    for name, (data, response_model) in payloads.items():
+        stdlib_text = json.dumps(data)
+        fast_bytes = serializer.dumps(data)
+        assert json.loads(stdlib_text) == serializer.loads(fast_bytes)
+
+        rows.append((
+            name, "cache dumps",
+            measure(lambda d=data: json.dumps(d), args.number, args.repeat),
+            measure(lambda d=data: serializer.dumps(d), args.number, args.repeat),
+            len(fast_bytes),
+        ))
+        rows.append((
+            name, "cache loads",
+            measure(lambda t=stdlib_text: json.loads(t), args.number, args.repeat),
+            measure(lambda t=stdlib_text: serializer.loads(t), args.number, args.repeat),
+            len(fast_bytes),
+        ))
+
+        content = response_model.model_validate(data).model_dump(mode="json", by_alias=True)
+        stdlib_response = JSONResponse(content)
+        fast_response = FastJSONResponse(content)
+        rows.append((
+            name, "response render",
+            measure(lambda c=content, r=stdlib_response: r.render(c), args.number, args.repeat),
+            measure(lambda c=content, r=fast_response: r.render(c), args.number, args.repeat),
+            len(fast_response.body),
+        ))
+
+    token = {"type": "content", "content": "메르시는 아군을 치유하고"}
+    rows.append((
+        "token", "sse event",
+        measure(lambda: _stdlib_sse(token), args.number * 10, args.repeat),
+        measure(lambda: serializer.sse_event(token), args.number * 10, args.repeat),
+        len(serializer.sse_event(token).encode()),
+    ))
+    return rows
+
+
+def report(rows: list[tuple[str, str, float, float, int]]) -> None:
+    print(f"serializer 백엔드: {serializer.BACKEND}")
+    print(
+        f"{'페이로드':<12}{'경로':<18}{'json (us)':>11}{'serializer (us)':>17}"
+        f"{'배속':>7}{'크기':>9}"
+    )
+    for name, path, stdlib_us, fast_us, size in rows:
+        print(
+            f"{name:<12}{path:<18}{stdlib_us:>11.1f}{fast_us:>17.1f}"
+            f"{stdlib_us / fast_us:>6.1f}x{size:>9}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="JSON 직렬화 벤치마크")
+    parser.add_argument("--heroes", type=int, default=45)
+    parser.add_argument("--number", type=int, default=1000, help="측정 1회당 반복 수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 횟수 (가장 빠른 값 사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def main() -> None:
+    report(run(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""
+벤치마크 결과 집계 도우미
+"""
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """최근접 순위 방식 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
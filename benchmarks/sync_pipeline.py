@@ -0,0 +1,281 @@
+"""
+Overfast → Supabase 동기화 오프라인 벤치마크
+
+가짜 Overfast 서버(benchmarks.fake_overfast)를 로컬 uvicorn으로 띄우고,
+Supabase는 인메모리 테이블(benchmarks.fake_supabase), Redis는 fakeredis로 바꾼 뒤
+sync_heroes → sync_hero_stats 전체 실행을 시나리오별로 측정한다.
+
+- cold: 빈 DB / 해시 / 검증자에서 전체 동기화
+- warm: 변경 없이 다시 실행 (조건부 요청 → 304)
+- changed: --change-ratio 비율의 영웅/통계 조합 내용을 바꾼 뒤 실행
+
+각 실행 전에 응답 캐시를 채워 두고, 전체 시간 / Overfast 요청(상태 코드별) /
+DB 호출(테이블·동작별) / 캐시 무효화 키 수·시간과 scheduler_logs 지표를 출력한다.
+
+사용 예:
+    python -m benchmarks.sync_pipeline --heroes 45 --latency 0.05 \\
+        --throttle-rate 0.05 --error-rate 0.02 --change-ratio 0.1
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from collections import Counter
+
+import uvicorn
+
+from app.config import redis as redis_config
+from app.config import supabase as supabase_config
+from app.config.settings import settings
+from app.scheduler import sync_service
+from app.services import overfast
+from app.utils.cache import STATIC_LEVELS, response_cache_keys
+from benchmarks.fake_overfast import FakeOverfast, create_app
+from benchmarks.fake_supabase import FakeAsyncSupabase
+
+SCENARIOS = ("cold", "warm", "changed")
+HERO_ROLES = ("all", "tank", "damage", "support")
+STATS_ORDER_BY = ("winrate", "pickrate")
+COUNTERS_PER_HERO = 3
+
+
+class InvalidationMeter:
+    """sync_service의 캐시 무효화 호출을 감싸 삭제 키 수와 소요 시간을 잰다."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.keys = 0
+        self.seconds = 0.0
+
+    def wrap(self, fn):
+        async def measured(*args, **kwargs):
+            started = time.perf_counter()
+            deleted = await fn(*args, **kwargs)
+            self.seconds += time.perf_counter() - started
+            self.calls += 1
+            self.keys += deleted
+            return deleted
+
+        return measured
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.keys = 0
+        self.seconds = 0.0
+
+
+async def install_fakes(args: argparse.Namespace, base_url: str) -> FakeAsyncSupabase:
+    """Supabase / Redis / Overfast 주소를 가짜 구현으로 바꾼다."""
+    try:
+        import fakeredis
+    except ImportError:
+        raise SystemExit(
+            "fakeredis가 필요합니다: pip install fakeredis lupa "
+            "(리스/체크포인트가 Lua 스크립트를 씀)"
+        ) from None
+
+    server = fakeredis.FakeServer()
+    redis_config._client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    redis_config._binary_client = fakeredis.FakeAsyncRedis(server=server)
+
+    supabase = FakeAsyncSupabase(latency=args.db_latency)
+    supabase_config._client = supabase
+
+    settings.overfast_base_url = base_url
+    await overfast.init_overfast_client()
+
+    # 실제 Overfast 보호용 속도 제한은 가짜 서버에 의미가 없으므로 --rate로 바꾼다
+    limiter = overfast.overfast_limiter
+    limiter.max_rate = args.rate
+    limiter.capacity = max(limiter.capacity, args.rate)
+    return supabase
+
+
+async def fill_response_caches(fake: FakeOverfast) -> int:
+    """영웅 목록 / 영웅 상세 / 통계 응답 캐시를 모든 압축본까지 채운다."""
+    keys = [f"cache:heroes:{role}" for role in HERO_ROLES]
+    keys += [f"cache:heroDetail:{hero_key}" for hero_key in fake.hero_keys]
+    keys += [
+        f"cache:stats:pc:{task['gamemode']}:{task['region']}:{task['division']}:{role}:{order}"
+        for task in sync_service._build_stat_tasks()
+        for role in HERO_ROLES
+        for order in STATS_ORDER_BY
+    ]
+
+    pipe = redis_config.get_redis_binary().pipeline(transaction=False)
+    total = 0
+    for key in keys:
+        for cache_key in response_cache_keys(key):
+            pipe.set(cache_key, b"{}", ex=3600)
+            total += 1
+    await pipe.execute()
+    return total
+
+
+def seed_counters(supabase: FakeAsyncSupabase) -> None:
+    """카운터/시너지 관계를 채워 영웅 변경 시 의존 상세 캐시 무효화가 일어나게 한다."""
+    heroes = supabase.tables.get("heroes", [])
+    keys = [hero["key"] for hero in heroes]
+    for i, hero in enumerate(heroes):
+        neighbours = [keys[(i + n) % len(keys)] for n in range(1, COUNTERS_PER_HERO + 1)]
+        hero["counters"] = neighbours
+        hero["synergies"] = neighbours[:1]
+
+
+def counter_delta(after: Counter, before: Counter) -> Counter:
+    return Counter({key: after[key] - before[key] for key in after if after[key] - before[key]})
+
+
+async def run_scenario(
+    name: str,
+    rate: float,
+    fake: FakeOverfast,
+    supabase: FakeAsyncSupabase,
+    meter: InvalidationMeter,
+) -> dict:
+    # 이전 시나리오의 429로 줄어든 속도가 이어지지 않도록 시나리오마다 되돌린다
+    overfast.overfast_limiter.rate = rate
+    cached_keys = await fill_response_caches(fake)
+    requests_before = Counter(fake.requests)
+    meter.reset()
+    supabase.reset_calls()
+
+    timings = {}
+    for job in (sync_service.sync_heroes, sync_service.sync_hero_stats):
+        started = time.perf_counter()
+        await job()
+        timings[job.__name__] = time.perf_counter() - started
+
+    logs = supabase.tables.get("scheduler_logs", [])
+    return {
+        "name": name,
+        "timings": timings,
+        "requests": counter_delta(fake.requests, requests_before),
+        "db_calls": Counter(supabase.calls),
+        "cached_keys": cached_keys,
+        "invalidation": (meter.calls, meter.keys, meter.seconds),
+        "job_metrics": {log["task_name"]: log.get("metrics") or {} for log in logs[-2:]},
+        "job_status": {log["task_name"]: log["status"] for log in logs[-2:]},
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> list[dict]:
+    fake = FakeOverfast(
+        heroes=args.heroes,
+        latency=args.latency,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    config = uvicorn.Config(
+        create_app(fake),
+        host="127.0.0.1",
+        port=args.port,
+        lifespan="off",
+        log_level="warning",
+        access_log=False,
+    )
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    supabase = await install_fakes(args, f"http://127.0.0.1:{args.port}")
+    meter = InvalidationMeter()
+    sync_service.invalidate_cache = meter.wrap(sync_service.invalidate_cache)
+    sync_service.delete_cache_keys = meter.wrap(sync_service.delete_cache_keys)
+
+    results = []
+    try:
+        for name in SCENARIOS:
+            if name == "changed":
+                changed_heroes, changed_combos = fake.bump_versions(args.change_ratio)
+                print(f"변경 주입: 영웅 {len(changed_heroes)}명, 통계 조합 {changed_combos}개")
+            results.append(await run_scenario(name, args.rate, fake, supabase, meter))
+            if name == "cold":
+                seed_counters(supabase)
+    finally:
+        await overfast.close_overfast_client()
+        server.should_exit = True
+        await server_task
+
+    return results
+
+
+def report(args: argparse.Namespace, results: list[dict]) -> None:
+    print(
+        f"영웅 {args.heroes}명, Overfast 지연 {args.latency * 1000:.0f}ms, "
+        f"429 {args.throttle_rate:.0%} / 503 {args.error_rate:.0%}, "
+        f"DB 지연 {args.db_latency * 1000:.0f}ms, 속도 제한 {args.rate}/s, "
+        f"압축본 {len(STATIC_LEVELS)}종"
+    )
+
+    for result in results:
+        timings = result["timings"]
+        calls, keys, seconds = result["invalidation"]
+        print(f"\n== {result['name']} ==")
+        print(
+            f"전체 {sum(timings.values()):.2f}s "
+            f"(sync_heroes {timings['sync_heroes']:.2f}s, "
+            f"sync_hero_stats {timings['sync_hero_stats']:.2f}s), "
+            f"상태: {result['job_status']}"
+        )
+
+        requests = result["requests"]
+        print(f"Overfast 요청 {sum(requests.values())}건")
+        for (endpoint, status), count in sorted(requests.items()):
+            print(f"  {endpoint:<16}{status:>5}{count:>6}")
+
+        db_calls = result["db_calls"]
+        print(f"DB 호출 {sum(db_calls.values())}건")
+        for (table, action), count in sorted(db_calls.items()):
+            print(f"  {table:<20}{action:<8}{count:>6}")
+
+        print(
+            f"캐시 무효화: 호출 {calls}번, 키 {keys}/{result['cached_keys']}개 삭제, "
+            f"{seconds * 1000:.1f}ms"
+        )
+
+        for job, metrics in result["job_metrics"].items():
+            summary = {
+                name: metrics.get(name)
+                for name in (
+                    "wall_time_ms", "overfast_requests", "retries", "throttled",
+                    "rate_wait_ms", "backoff_ms", "db_time_ms", "cache_keys_invalidated",
+                )
+                if name in metrics
+            }
+            print(f"  {job}: {summary}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Overfast 동기화 오프라인 벤치마크")
+    parser.add_argument("--heroes", type=int, default=45, help="가짜 Overfast 영웅 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="Overfast 요청당 지연 (초)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429의 Retry-After (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율")
+    parser.add_argument("--db-latency", type=float, default=0.02, help="DB 쿼리 지연 (초)")
+    parser.add_argument(
+        "--change-ratio", type=float, default=0.1,
+        help="changed 시나리오에서 내용을 바꿀 영웅/통계 조합 비율",
+    )
+    parser.add_argument("--rate", type=float, default=50.0, help="Overfast 속도 제한 (초당 요청)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--verbose", action="store_true", help="동기화 로그 출력")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    results = asyncio.run(run_benchmark(args))
+    report(args, results)
+
+
+if __name__ == "__main__":
+    main()